@@ -12,12 +12,54 @@
 # =========================================================================================
 
 from flask import Flask, render_template, request, jsonify, session, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
+from markupsafe import Markup
 from datetime import datetime
+from functools import partial, wraps
+import base64
+import hashlib
+import json
+import os
 import random
+import uuid
+
+from catalogo import CatalogoJuegos, ESQUEMA_JUEGO
+from busqueda import IndiceTexto, tokenizar
+from autocompletado import IndiceAutocompletado
+from indices import VistasOrdenadas, IndicePrecio, FiltroFacetas
+from estadisticas import EstadisticasTienda
+from columnas import ColumnasCatalogo, DISPONIBLE as NUMPY_DISPONIBLE
+from cache import CacheFragmentosJSON, CacheTarjetasHTML, CacheConsultasLRU
+from portada import ModeloPortada
+from reviews import ReviewsJuegos
+from recomendador import IndiceSimilares, cargar_precalculados
+from usuarios import RegistroUsuarios, ContadorAtomico
+from persistencia import AlmacenSQLite, DiarioCatalogo
+from importador import InformeImportacion, importar
+from registros import JuegoCompacto, compactar
+
+class ProveedorJSON(DefaultJSONProvider):
+    """JSON de Flask que también serializa los juegos compactos del catálogo"""
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, JuegoCompacto):
+            return dict(o)
+        return DefaultJSONProvider.default(o)
 
 app = Flask(__name__)
+app.json = ProveedorJSON(app)
 app.secret_key = 'steam_store_secret_key_2024'
 
+# * Almacenamiento: 'memoria' (por defecto, se pierde al reiniciar) o 'sqlite'
+app.config['ALMACEN'] = os.environ.get('STEAM_ALMACEN', 'memoria')
+app.config['SQLITE_RUTA'] = os.environ.get('STEAM_SQLITE_RUTA', 'steam_store.db')
+# * Catálogo externo (.jsonl o .csv) que sustituye al de ejemplo
+app.config['CATALOGO'] = os.environ.get('STEAM_CATALOGO')
+# * Juegos similares precalculados con `python recomendador.py --salida` (se usan si existe
+#   y se calcularon para el mismo catálogo)
+app.config['SIMILARES'] = os.environ.get('STEAM_SIMILARES', 'similares.json')
+
 # =========================================================================================
 #  📊 BASE DE DATOS EN MEMORIA (Listas de Diccionarios - Sección 5)
 # =========================================================================================
@@ -480,6 +522,88 @@ catalogo_juegos = [
     }
 ]
 
+# * Con SQLite el estado se carga al arrancar y cada cambio se guarda en segundo plano;
+#   una base nueva se rellena con el catálogo de arriba
+almacen = AlmacenSQLite(app.config['SQLITE_RUTA']) if app.config['ALMACEN'] == 'sqlite' else None
+informe_importacion = None
+if almacen is not None and almacen.hay_juegos():
+    catalogo_juegos[:] = map(compactar, almacen.cargar_juegos())
+elif app.config['CATALOGO']:
+    # * Se importa en streaming y cada juego se compacta al leerlo; los índices se construyen
+    #   después, una vez, al registrarlos
+    informe_importacion = InformeImportacion()
+    catalogo_juegos[:] = map(compactar, importar(app.config['CATALOGO'], informe_importacion))
+
+# * Catálogo indexado - Índice hash id → juego sobre la misma lista.
+#   Cada juego se guarda como registro compacto (__slots__ y vocabularios compartidos)
+catalogo = CatalogoJuegos(catalogo_juegos, compactar=compactar)
+if almacen is not None:
+    catalogo.registrar_indice(DiarioCatalogo(catalogo, almacen))
+
+# * Índice invertido para la búsqueda por nombre y etiquetas (se construye una vez al arrancar)
+indice_texto = catalogo.registrar_indice(IndiceTexto())
+
+# * Sugerencias por prefijo de nombre y etiquetas para la caja de búsqueda (array ordenado + bisect)
+autocompletado = catalogo.registrar_indice(IndiceAutocompletado(catalogo))
+
+# * Criterios de ordenación: campo del que dependen + key lambda - Sección 5
+criterios_orden = {
+    "nombre": ("nombre", lambda j: j["nombre"].lower()),
+    "precio": ("precio", lambda j: j["precio"]),
+    "valoracion": ("valoracion", lambda j: j["valoracion"]),
+    "descuento": ("descuento", lambda j: j["descuento"]),
+    "fecha": ("fecha_lanzamiento", lambda j: j["fecha_lanzamiento"]),
+    "reviews": ("num_reviews", lambda j: j["num_reviews"])
+}
+
+# * Vistas preordenadas por criterio (se recalculan solo si cambia su campo)
+vistas_ordenadas = catalogo.registrar_indice(VistasOrdenadas(catalogo, criterios_orden))
+
+# * Índice por rango de precio (bisect) y bitsets por categoría, etiqueta, plataforma, idioma...
+indice_precio = catalogo.registrar_indice(IndicePrecio())
+facetas = catalogo.registrar_indice(FiltroFacetas(catalogo))
+
+# * Estadísticas de la tienda actualizadas en cada cambio del catálogo
+estadisticas = catalogo.registrar_indice(EstadisticasTienda(catalogo))
+
+# * Columnas numéricas en NumPy (solo si está instalado): filtros por rango y agregados vectorizados
+columnas = catalogo.registrar_indice(ColumnasCatalogo(catalogo)) if NUMPY_DISPONIBLE else None
+# * Medias e histogramas: vectorizados si hay NumPy; si no, los que mantiene EstadisticasTienda
+calcular_agregados = columnas.agregados if columnas is not None else estadisticas.agregados
+
+# * JSON compacto (sin espacios tras "," y ":"), el mismo formato que usa jsonify
+codificar_json = partial(app.json.dumps, separators=(",", ":"))
+
+# * JSON precodificado de cada juego para montar las respuestas de la API sin recodificar
+cache_json = catalogo.registrar_indice(CacheFragmentosJSON(catalogo, codificar_json))
+
+# * HTML de las tarjetas de juego (tienda, portada, wishlist) renderizado una vez por versión
+cache_tarjetas = catalogo.registrar_indice(CacheTarjetasHTML(
+    catalogo, lambda estilo, juego: Markup(app.jinja_env.get_template(f'tarjetas/{estilo}.html').render(juego=juego))))
+app.jinja_env.globals['tarjeta'] = cache_tarjetas.tarjeta
+
+# * IDs ordenados de las combinaciones de filtros de /tienda (LRU; se invalida con la versión del catálogo).
+#   Cada entrada puede tener todo el catálogo: también se acota el total de IDs guardados
+#   (2 millones de referencias ≈ 16 MB, caben dos listados completos de un catálogo de 1M)
+MAX_IDS_CACHE_TIENDA = 2_000_000
+cache_tienda = CacheConsultasLRU(catalogo, capacidad=256, max_elementos=MAX_IDS_CACHE_TIENDA)
+
+# * Secciones de la portada (top-k con montículos) y HTML cacheado: carrito_count → (versión, html)
+portada = catalogo.registrar_indice(ModeloPortada(catalogo))
+cache_portada = {}
+
+# * Reseñas por juego; cada reseña nueva actualiza la valoración del juego en O(1)
+reviews = catalogo.registrar_indice(ReviewsJuegos(catalogo, almacen))
+if almacen is not None:
+    reviews.cargar(almacen.cargar_reviews())
+
+# * Juegos similares (etiquetas, categoría y desarrollador en común). En catálogos grandes se
+#   calculan en segundo plano para no retrasar el arranque; mientras tanto se sirven los del
+#   fichero precalculado o, si no lo hay, los primeros de la misma categoría
+similares = catalogo.registrar_indice(IndiceSimilares(
+    catalogo, k=4, precalculados=cargar_precalculados(app.config['SIMILARES'], catalogo_juegos),
+    segundo_plano=True))
+
 # * Categorías disponibles - Diccionario con listas
 categorias = {
     "Todos": "Todos los juegos",
@@ -496,34 +620,41 @@ categorias = {
     "Indie": "Juegos independientes"
 }
 
-# * Carrito de compras - Lista de diccionarios
-carrito_global = []
-carrito_contador = 0
+# * Juegos por página en la tienda y límites de la API paginada
+JUEGOS_POR_PAGINA = 48
+REVIEWS_POR_PAGINA = 10
+LIMITE_API = 20
+LIMITE_API_MAXIMO = 100
+# * Juegos como máximo en un lote de carrito o wishlist
+LOTE_MAXIMO = 100
 
-# * Lista de deseos (Wishlist)
-wishlist_global = []
+# * Carrito, lista de deseos y biblioteca de cada sesión - Diccionarios id → item
+usuarios = RegistroUsuarios(almacen)
+if almacen is not None:
+    usuarios.cargar(almacen.cargar_usuarios())
 
-# * Biblioteca de juegos comprados
-biblioteca_global = []
+# * Generadores de IDs seguros entre hilos (servidor con threads); siguen tras los ya guardados
+carrito_contador = ContadorAtomico(
+    max((i["carrito_id"] for e in usuarios.estados() for i in e.items_carrito()), default=0) + 1)
 
-# * Reviews de usuarios
-reviews_global = []
-review_contador = 0
+# * IDs de las reviews de usuarios
+review_contador = ContadorAtomico(
+    max((r["id"] for j in catalogo for r in reviews.pagina(j["id"], 1, 1)), default=0) + 1)
 
 # =========================================================================================
 #  🔧 FUNCIONES AUXILIARES (Usando conceptos de Sección 5)
 # =========================================================================================
 
 def obtener_juego_por_id(id_juego):
-    """Buscar juego por ID usando comprensión de listas"""
-    juegos = [j for j in catalogo_juegos if j["id"] == id_juego]
-    return juegos[0] if juegos else None
+    """Buscar juego por ID en O(1) usando el índice hash del catálogo"""
+    return catalogo.obtener(id_juego)
 
 def filtrar_por_categoria(categoria):
-    """Filtrar juegos por categoría usando comprensión"""
+    """Filtrar juegos por categoría usando el conjunto de IDs precalculado"""
     if categoria == "Todos":
         return catalogo_juegos
-    return [j for j in catalogo_juegos if j["categoria"] == categoria]
+    bits = facetas.filtrar({"categoria": [categoria]})
+    return [catalogo.obtener(i) for i in facetas.ids(bits)]
 
 def filtrar_por_precio(juegos, min_precio=0, max_precio=float('inf')):
     """Filtrar por rango de precios"""
@@ -537,52 +668,198 @@ def filtrar_gratis(juegos):
     """Obtener juegos gratis"""
     return [j for j in juegos if j["precio"] == 0]
 
+def filtrar_bits_tienda(filtros, busqueda="", min_precio=0, max_precio=float('inf')):
+    """Bitset de los juegos que cumplen búsqueda, rango de precio y facetas (AND/OR de bits)"""
+    base = None
+    if busqueda:
+        # * Si la búsqueda no encuentra nada (p. ej. por una errata) se usan los juegos parecidos
+        base = facetas.bits_de_ids(indice_texto.buscar(busqueda) or indice_texto.buscar_aproximado(busqueda))
+    if not indice_precio.cubre_todo(min_precio, max_precio):
+        if columnas is not None:
+            bits_precio = columnas.filtrar({"precio": (min_precio, max_precio)})
+        else:
+            bits_precio = facetas.bits_de_ids(indice_precio.ids_en_rango(min_precio, max_precio))
+        base = bits_precio if base is None else base & bits_precio
+    return facetas.filtrar(filtros, base)
+
+def ids_tienda(filtros, busqueda, min_precio, max_precio, orden, descendente):
+    """IDs ordenados que cumplen los filtros de la tienda (tupla cacheada por consulta normalizada)"""
+    if orden not in criterios_orden:
+        orden = "nombre"
+    # * La clave no depende del orden de los parámetros ni de valores repetidos en la URL
+    clave = (
+        tuple(sorted(set(tokenizar(busqueda)))) if busqueda else None,
+        tuple(sorted((f, tuple(sorted(set(v), key=repr))) for f, v in filtros.items())),
+        min_precio, max_precio, orden, descendente
+    )
+    def calcular():
+        # Aplicar filtros con operaciones de bits (sin listas intermedias) y recorrer la vista preordenada
+        bits = filtrar_bits_tienda(filtros, busqueda, min_precio, max_precio)
+        juegos = vistas_ordenadas.ordenar_ids(set(facetas.ids(bits)), orden, descendente)
+        return tuple(j["id"] for j in juegos)
+    return cache_tienda.obtener(clave, calcular)
+
 def ordenar_juegos(juegos, criterio="nombre", descendente=False):
-    """Ordenar usando sorted() con key lambda - Sección 5"""
-    criterios_validos = {
-        "nombre": lambda j: j["nombre"].lower(),
-        "precio": lambda j: j["precio"],
-        "valoracion": lambda j: j["valoracion"],
-        "descuento": lambda j: j["descuento"],
-        "fecha": lambda j: j["fecha_lanzamiento"],
-        "reviews": lambda j: j["num_reviews"]
-    }
-    key_func = criterios_validos.get(criterio, lambda j: j["nombre"].lower())
-    return sorted(juegos, key=key_func, reverse=descendente)
+    """Ordenar recorriendo la vista preordenada del criterio (sorted() con key lambda - Sección 5)"""
+    return vistas_ordenadas.ordenar(juegos, criterio, descendente)
+
+def ids_busqueda(query):
+    """(IDs, aproximada) de una búsqueda por prefijo de palabra en nombre o etiquetas.
+    Si no hay coincidencias (p. ej. "witchr"), devuelve los juegos parecidos por trigramas
+    ordenados del más parecido al menos; si las hay, el conjunto exacto (sin orden)."""
+    ids = indice_texto.buscar(query) if query else set()
+    if ids or not tokenizar(query):
+        return ids, False
+    puntuaciones = indice_texto.buscar_aproximado(query)
+    return sorted(puntuaciones, key=lambda i: (-puntuaciones[i], catalogo.posicion(i))), True
 
 def buscar_juegos(query):
-    """Búsqueda por nombre o etiquetas"""
-    query = query.lower()
-    return [
-        j for j in catalogo_juegos
-        if query in j["nombre"].lower() or
-           any(query in et.lower() for et in j["etiquetas"])
-    ]
-
-def obtener_estadisticas():
-    """Estadísticas usando min/max/sum - Sección 5"""
-    precios = [j["precio"] for j in catalogo_juegos if j["precio"] > 0]
-    return {
-        "total_juegos": len(catalogo_juegos),
-        "precio_mas_bajo": min(precios) if precios else 0,
-        "precio_mas_alto": max(precios) if precios else 0,
-        "precio_promedio": round(sum(precios) / len(precios), 2) if precios else 0,
-        "juegos_gratis": len([j for j in catalogo_juegos if j["precio"] == 0]),
-        "juegos_con_descuento": len([j for j in catalogo_juegos if j["descuento"] > 0]),
-        "mejor_valorado": max(catalogo_juegos, key=lambda j: j["valoracion"])["nombre"],
-        "mas_reseñas": max(catalogo_juegos, key=lambda j: j["num_reviews"])["nombre"]
-    }
+    """Búsqueda por prefijo de palabra usando el índice invertido (en orden de catálogo),
+    con tolerancia a erratas: sin coincidencias exactas devuelve los juegos más parecidos"""
+    ids, aproximada = ids_busqueda(query)
+    return [catalogo.obtener(i) for i in ids] if aproximada else catalogo.juegos_en_orden(ids)
+
+def obtener_estadisticas(con_agregados=False):
+    """Estadísticas (min/max/sum - Sección 5) leídas de los agregados incrementales en O(1);
+    con_agregados añade medias e histogramas (solo los pide /api/estadisticas)"""
+    resumen = estadisticas.resumen()
+    if con_agregados:
+        resumen.update(calcular_agregados())
+    return resumen
+
+def codificar_cursor(orden, descendente, valor, posicion):
+    """Cursor opaco (base64 de JSON) con la posición del último juego devuelto"""
+    datos = json.dumps([orden, descendente, valor, posicion], separators=(",", ":"))
+    return base64.urlsafe_b64encode(datos.encode()).decode().rstrip("=")
+
+def decodificar_cursor(cursor):
+    """Devuelve (orden, descendente, valor, posición); lanza ValueError si no es válido"""
+    relleno = "=" * (-len(cursor) % 4)
+    orden, descendente, valor, posicion = json.loads(base64.urlsafe_b64decode(cursor + relleno))
+    if not isinstance(posicion, int) or not isinstance(valor, (str, int, float)):
+        raise ValueError("Cursor no válido")
+    return orden, descendente, valor, posicion
+
+def proyectar(juego, campos):
+    """Selección de campos (sparse fieldset) de un juego"""
+    return {c: juego[c] for c in campos}
+
+def respuesta_json(datos, fragmentos, status=200):
+    """Respuesta JSON que combina `datos` con fragmentos ya codificados (clave → bytes)"""
+    partes = [codificar_json(clave).encode() + b":" + valor for clave, valor in fragmentos.items()]
+    partes += [codificar_json(clave).encode() + b":" + codificar_json(valor).encode()
+               for clave, valor in datos.items()]
+    return app.response_class(b"{" + b",".join(partes) + b"}", status=status,
+                              mimetype=app.json.mimetype)
+
+MIMETYPE_NDJSON = 'application/x-ndjson'
+
+def pide_ndjson():
+    """True si el cliente prefiere JSON Lines (Accept: application/x-ndjson) a un único JSON"""
+    return request.accept_mimetypes.best_match([app.json.mimetype, MIMETYPE_NDJSON]) == MIMETYPE_NDJSON
+
+def respuesta_ndjson(juegos, campos=None, cabeceras=None):
+    """Respuesta en streaming con un juego por línea: se codifica mientras se envía, así el
+    primer byte sale enseguida y la memoria no crece con el número de resultados"""
+    def lineas():
+        for juego in juegos:
+            if campos:
+                yield codificar_json(proyectar(juego, campos)).encode() + b"\n"
+            else:
+                yield cache_json.juego(juego) + b"\n"
+    respuesta = app.response_class(lineas(), mimetype=MIMETYPE_NDJSON, headers=cabeceras)
+    respuesta.vary.add('Accept')
+    return respuesta
+
+def con_etag(calcular_etag, vary=()):
+    """Decorador de GET condicional: si If-None-Match coincide responde 304 sin ejecutar la vista.
+    `vary`: cabeceras de la petición de las que depende la respuesta (también en los 304)"""
+    def decorador(vista):
+        @wraps(vista)
+        def envoltura(*args, **kwargs):
+            etag = calcular_etag(*args, **kwargs)
+            if etag is None:
+                return vista(*args, **kwargs)
+            if request.if_none_match.contains(etag):
+                respuesta = app.response_class(status=304)
+            else:
+                respuesta = app.make_response(vista(*args, **kwargs))
+                if respuesta.status_code != 200:
+                    return respuesta
+            respuesta.set_etag(etag)
+            respuesta.vary.update(vary)
+            return respuesta
+        return envoltura
+    return decorador
+
+# * Identificador de arranque: las versiones empiezan en 0 en cada proceso y no deben repetir ETags
+ARRANQUE_ETAG = format(random.getrandbits(32), "08x")
+
+def etag_consulta(prefijo):
+    """ETag de un listado: versión del catálogo + parámetros de la petición"""
+    parametros = sorted(request.args.items(multi=True))
+    resumen = hashlib.sha1(repr(parametros).encode()).hexdigest()[:16]
+    # * JSON y JSON Lines son representaciones distintas del mismo listado: no comparten ETag
+    if pide_ndjson():
+        prefijo += "-ndjson"
+    return f"{prefijo}-{ARRANQUE_ETAG}-{catalogo.version}-{resumen}"
+
+def etag_juego(id):
+    """ETag de un juego: su ID y su versión (None si no existe)"""
+    version = catalogo.version_juego(id)
+    return None if version is None else f"juego-{ARRANQUE_ETAG}-{id}-{version}"
+
+def estado_actual(crear=False):
+    """Estado (carrito, wishlist, biblioteca) de la sesión actual.
+    Solo se guarda un estado nuevo cuando se va a modificar (crear=True)."""
+    if 'usuario' not in session:
+        if not crear:
+            return usuarios.obtener(None, crear=False)
+        session['usuario'] = uuid.uuid4().hex
+    return usuarios.obtener(session['usuario'], crear=crear)
+
+def leer_lote(data, clave, cantidad_por_defecto=None):
+    """Lista `clave` de un lote: ids o {"id", "cantidad"} → {id: cantidad}.
+    Los ids repetidos suman sus cantidades (si alguno no la indica queda None: el juego entero).
+    Lanza ValueError si algún elemento no es válido."""
+    if not isinstance(data, dict):
+        raise ValueError("El cuerpo debe ser un objeto JSON")
+    elementos = data.get(clave) or []
+    if not isinstance(elementos, list):
+        raise ValueError(f"'{clave}' debe ser una lista")
+    lote = {}
+    for elemento in elementos:
+        if type(elemento) is int:
+            elemento = {"id": elemento}
+        if not isinstance(elemento, dict) or type(elemento.get("id")) is not int:
+            raise ValueError(f"Elemento no válido en '{clave}': {elemento!r}")
+        cantidad = elemento.get("cantidad", cantidad_por_defecto)
+        if cantidad is not None and (type(cantidad) is not int or cantidad < 1):
+            raise ValueError(f"La cantidad debe ser un entero positivo (juego {elemento['id']})")
+        if elemento["id"] not in lote:
+            lote[elemento["id"]] = cantidad
+        elif lote[elemento["id"]] is not None and cantidad is not None:
+            lote[elemento["id"]] += cantidad
+        else:
+            lote[elemento["id"]] = None
+    return lote
+
+def juegos_del_lote(ids):
+    """Juegos de los ids de un lote y los ids que no existen"""
+    juegos = {id_juego: obtener_juego_por_id(id_juego) for id_juego in ids}
+    return juegos, [id_juego for id_juego, juego in juegos.items() if juego is None]
+
+def contar_carrito():
+    """Número de juegos distintos en el carrito de la sesión"""
+    return len(estado_actual().carrito)
 
 def calcular_total_carrito():
-    """Calcular total del carrito con sum()"""
-    return round(sum(item["precio"] * item["cantidad"] for item in carrito_global), 2)
+    """Total del carrito (mantenido en cada cambio, sin recorrer los items)"""
+    return estado_actual().total
 
 def calcular_ahorro_carrito():
-    """Calcular ahorro total"""
-    return round(sum(
-        (item["precio_original"] - item["precio"]) * item["cantidad"]
-        for item in carrito_global
-    ), 2)
+    """Ahorro total del carrito (mantenido en cada cambio)"""
+    return estado_actual().ahorro
 
 # =========================================================================================
 #  🌐 RUTAS DE LA APLICACIÓN
@@ -590,46 +867,28 @@ def calcular_ahorro_carrito():
 
 @app.route('/')
 def index():
-    """Página principal con destacados y ofertas"""
-    # Juegos destacados usando comprensión
-    destacados = [j for j in catalogo_juegos if j.get("destacado", False)]
-    
-    # Mejores ofertas - ordenar por descuento descendente
-    ofertas = sorted(
-        [j for j in catalogo_juegos if j["descuento"] > 0],
-        key=lambda j: j["descuento"],
-        reverse=True
-    )[:6]
-    
-    # Mejor valorados
-    mejor_valorados = sorted(
-        catalogo_juegos,
-        key=lambda j: j["valoracion"],
-        reverse=True
-    )[:6]
-    
-    # Nuevos lanzamientos
-    nuevos = sorted(
-        catalogo_juegos,
-        key=lambda j: j["fecha_lanzamiento"],
-        reverse=True
-    )[:6]
-    
-    # Juegos gratis
-    gratis = [j for j in catalogo_juegos if j["precio"] == 0]
+    """Página principal con destacados y ofertas (HTML cacheado hasta que cambie la portada)"""
+    carrito_count = contar_carrito()
+    version = portada.version
+    cacheable = not request.args
+    en_cache = cache_portada.get(carrito_count)
+    if cacheable and en_cache and en_cache[0] == version:
+        return en_cache[1]
+    
+    # Secciones precalculadas: destacados, ofertas, mejor valorados, nuevos y gratis
+    secciones = portada.obtener()
     
     # Estadísticas
     stats = obtener_estadisticas()
     
-    return render_template('index.html',
-                         destacados=destacados,
-                         ofertas=ofertas,
-                         mejor_valorados=mejor_valorados,
-                         nuevos=nuevos,
-                         gratis=gratis,
-                         stats=stats,
-                         categorias=categorias,
-                         carrito_count=len(carrito_global))
+    html = render_template('index.html',
+                           stats=stats,
+                           categorias=categorias,
+                           carrito_count=carrito_count,
+                           **secciones)
+    if cacheable:
+        cache_portada[carrito_count] = (version, html)
+    return html
 
 @app.route('/tienda')
 def tienda():
@@ -643,25 +902,32 @@ def tienda():
     busqueda = request.args.get('q', '')
     solo_ofertas = request.args.get('ofertas', '') == 'true'
     solo_gratis = request.args.get('gratis', '') == 'true'
+    pagina = max(request.args.get('pagina', 1, type=int), 1)
     
-    # Aplicar filtros usando comprensiones - Sección 5
-    juegos = catalogo_juegos.copy()
-    
-    if busqueda:
-        juegos = buscar_juegos(busqueda)
-    elif categoria != 'Todos':
-        juegos = filtrar_por_categoria(categoria)
-    
-    juegos = filtrar_por_precio(juegos, precio_min, precio_max)
-    
+    # Facetas: OR entre valores de una misma faceta, AND entre facetas distintas
+    filtros = {}
+    if categoria != 'Todos' and not busqueda:
+        filtros["categoria"] = [categoria]
+    for faceta in ('plataforma', 'idioma', 'etiqueta'):
+        valores = request.args.getlist(faceta)
+        if valores:
+            filtros[faceta] = valores
+    if request.args.get('multijugador', '') == 'true':
+        filtros["multijugador"] = [True]
     if solo_ofertas:
-        juegos = filtrar_ofertas(juegos)
-    
+        filtros["oferta"] = [True]
     if solo_gratis:
-        juegos = filtrar_gratis(juegos)
+        filtros["gratis"] = [True]
     
-    # Ordenar usando sorted con key - Sección 5
-    juegos = ordenar_juegos(juegos, orden, direccion == 'desc')
+    # IDs filtrados y ordenados: pocas combinaciones concentran casi todo el tráfico (caché LRU)
+    ids = ids_tienda(filtros, busqueda, precio_min, precio_max, orden, direccion == 'desc')
+    total_paginas = max((len(ids) + JUEGOS_POR_PAGINA - 1) // JUEGOS_POR_PAGINA, 1)
+    pagina = min(pagina, total_paginas)
+    inicio = (pagina - 1) * JUEGOS_POR_PAGINA
+    # * Un juego eliminado justo después de leer la caché se omite (el siguiente acceso ya recalcula)
+    juegos = [j for j in map(catalogo.obtener, ids[inicio:inicio + JUEGOS_POR_PAGINA]) if j is not None]
+    args_pagina = request.args.to_dict(flat=False)
+    args_pagina.pop('pagina', None)
     
     return render_template('tienda.html',
                          juegos=juegos,
@@ -670,8 +936,13 @@ def tienda():
                          orden_actual=orden,
                          direccion_actual=direccion,
                          busqueda=busqueda,
-                         total_resultados=len(juegos),
-                         carrito_count=len(carrito_global))
+                         total_resultados=len(ids),
+                         plataformas=facetas.valores("plataforma"),
+                         plataforma_actual=request.args.get('plataforma', ''),
+                         pagina_actual=pagina,
+                         total_paginas=total_paginas,
+                         args_pagina=args_pagina,
+                         carrito_count=contar_carrito())
 
 @app.route('/juego/<int:id>')
 def detalle_juego(id):
@@ -680,99 +951,175 @@ def detalle_juego(id):
     if not juego:
         return render_template('404.html'), 404
     
-    # Juegos similares (misma categoría)
-    similares = [j for j in catalogo_juegos 
-                 if j["categoria"] == juego["categoria"] and j["id"] != id][:4]
+    # Juegos similares (vecinos precalculados)
+    juegos_similares = [obtener_juego_por_id(i) for i in similares.similares(id)]
     
-    # Reviews del juego
-    reviews_juego = [r for r in reviews_global if r["juego_id"] == id]
+    # Reviews del juego (las más recientes primero, paginadas)
+    pagina_reviews = max(request.args.get('pagina_reviews', 1, type=int), 1)
+    reviews_juego = reviews.pagina(id, pagina_reviews, REVIEWS_POR_PAGINA)
+    total_paginas_reviews = -(-reviews.total(id) // REVIEWS_POR_PAGINA)
     
-    # Verificar si está en carrito o wishlist
-    en_carrito = any(item["id"] == id for item in carrito_global)
-    en_wishlist = any(item["id"] == id for item in wishlist_global)
-    en_biblioteca = any(item["id"] == id for item in biblioteca_global)
+    # Verificar si está en carrito, wishlist o biblioteca (búsqueda O(1) en diccionarios)
+    estado = estado_actual()
+    en_carrito = id in estado.carrito
+    en_wishlist = id in estado.wishlist
+    en_biblioteca = id in estado.biblioteca
     
     return render_template('detalle_juego.html',
                          juego=juego,
-                         similares=similares,
+                         similares=juegos_similares,
                          reviews=reviews_juego,
+                         pagina_reviews=pagina_reviews,
+                         total_paginas_reviews=total_paginas_reviews,
                          en_carrito=en_carrito,
                          en_wishlist=en_wishlist,
                          en_biblioteca=en_biblioteca,
                          categorias=categorias,
-                         carrito_count=len(carrito_global))
+                         carrito_count=len(estado.carrito))
 
 @app.route('/carrito')
 def ver_carrito():
     """Ver carrito de compras"""
-    total = calcular_total_carrito()
-    ahorro = calcular_ahorro_carrito()
+    estado = estado_actual()
     
     return render_template('carrito.html',
-                         carrito=carrito_global,
-                         total=total,
-                         ahorro=ahorro,
+                         carrito=estado.items_carrito(),
+                         total=estado.total,
+                         ahorro=estado.ahorro,
                          categorias=categorias,
-                         carrito_count=len(carrito_global))
+                         carrito_count=len(estado.carrito))
 
 @app.route('/biblioteca')
 def biblioteca():
     """Biblioteca de juegos comprados"""
+    estado = estado_actual()
     return render_template('biblioteca.html',
-                         biblioteca=biblioteca_global,
+                         biblioteca=estado.items_biblioteca(),
                          categorias=categorias,
-                         carrito_count=len(carrito_global))
+                         carrito_count=len(estado.carrito))
 
 @app.route('/wishlist')
 def ver_wishlist():
     """Lista de deseos"""
+    estado = estado_actual()
+    wishlist = estado.items_wishlist()
+    # * Se muestran los datos actuales del juego (precio, oferta); si ya no existe, los guardados
+    juegos_wishlist = [obtener_juego_por_id(item["id"]) or item for item in wishlist]
     return render_template('wishlist.html',
-                         wishlist=wishlist_global,
+                         wishlist=wishlist,
+                         juegos_wishlist=juegos_wishlist,
                          categorias=categorias,
-                         carrito_count=len(carrito_global))
+                         carrito_count=len(estado.carrito))
 
 # =========================================================================================
 #  🔌 API REST
 # =========================================================================================
 
 @app.route('/api/juegos')
+# * JSON o JSON Lines según Accept: una caché compartida debe separar ambas respuestas
+@con_etag(lambda: etag_consulta("juegos"), vary=('Accept',))
 def api_juegos():
-    """API: Obtener todos los juegos"""
+    """API: Obtener juegos (paginación por cursor con ?limit=&cursor= y selección de campos con ?fields=).
+    Con Accept: application/x-ndjson responde en streaming, un juego por línea."""
     categoria = request.args.get('categoria', 'Todos')
     orden = request.args.get('orden', 'nombre')
+    if orden not in criterios_orden:
+        orden = 'nombre'
+    descendente = request.args.get('direccion', 'asc') == 'desc'
+    limite = request.args.get('limit')
+    cursor = request.args.get('cursor')
+    if limite is not None:
+        # * Un limit que no es un número (o no es positivo) no debe acabar devolviendo otra cosa
+        try:
+            limite = int(limite)
+        except ValueError:
+            return jsonify({"success": False, "error": "limit debe ser un número entero"}), 400
+        if limite < 1:
+            return jsonify({"success": False, "error": "limit debe ser mayor que 0"}), 400
     
-    juegos = filtrar_por_categoria(categoria)
-    juegos = ordenar_juegos(juegos, orden)
+    campos = None
+    if request.args.get('fields'):
+        campos = [c.strip() for c in request.args['fields'].split(',') if c.strip()]
+        invalidos = [c for c in campos if c not in ESQUEMA_JUEGO]
+        if invalidos:
+            return jsonify({"success": False, "error": f"Campos no válidos: {', '.join(invalidos)}"}), 400
     
-    return jsonify({
+    siguiente_cursor = None
+    if limite is None and cursor is None and pide_ndjson():
+        # * Listado completo en streaming: se recorre la vista ordenada sin copiarla
+        if categoria == 'Todos':
+            ids, total = None, len(catalogo)
+        else:
+            bits = facetas.filtrar({"categoria": [categoria]})
+            ids, total = set(facetas.ids(bits)), facetas.contar(bits)
+        return respuesta_ndjson(vistas_ordenadas.recorrer(ids, orden, descendente), campos,
+                                {"X-Total-Count": str(total)})
+    if limite is None and cursor is None:
+        juegos = ordenar_juegos(filtrar_por_categoria(categoria), orden, descendente)
+        total = len(juegos)
+    else:
+        limite = min(LIMITE_API if limite is None else limite, LIMITE_API_MAXIMO)
+        if categoria == 'Todos':
+            ids, total = None, len(catalogo)
+        else:
+            bits = facetas.filtrar({"categoria": [categoria]})
+            ids, total = set(facetas.ids(bits)), facetas.contar(bits)
+        try:
+            despues = None
+            if cursor:
+                orden_cursor, desc_cursor, valor, posicion = decodificar_cursor(cursor)
+                if (orden_cursor, desc_cursor) != (orden, descendente):
+                    raise ValueError("El cursor no corresponde a este orden")
+                despues = (valor, posicion)
+            juegos, hay_mas = vistas_ordenadas.pagina(ids, orden, descendente, despues, limite)
+        except (ValueError, TypeError):
+            return jsonify({"success": False, "error": "Cursor no válido"}), 400
+        if hay_mas:
+            siguiente_cursor = codificar_cursor(orden, descendente,
+                                                *vistas_ordenadas.clave_cursor(juegos[-1], orden))
+    
+    if pide_ndjson():
+        cabeceras = {"X-Total-Count": str(total)}
+        if siguiente_cursor:
+            cabeceras["X-Siguiente-Cursor"] = siguiente_cursor
+        return respuesta_ndjson(juegos, campos, cabeceras)
+    
+    if campos:
+        fragmento_juegos = codificar_json([proyectar(j, campos) for j in juegos]).encode()
+    else:
+        fragmento_juegos = cache_json.lista(juegos)
+    
+    return respuesta_json({
         "success": True,
-        "total": len(juegos),
-        "juegos": juegos
-    })
+        "total": total,
+        "siguiente_cursor": siguiente_cursor
+    }, {"juegos": fragmento_juegos})
 
 @app.route('/api/juego/<int:id>')
+@con_etag(etag_juego)
 def api_juego(id):
     """API: Obtener un juego por ID"""
     juego = obtener_juego_por_id(id)
     if juego:
-        return jsonify({"success": True, "juego": juego})
+        return respuesta_json({"success": True}, {"juego": cache_json.juego(juego)})
     return jsonify({"success": False, "error": "Juego no encontrado"}), 404
 
 @app.route('/api/carrito', methods=['GET'])
 def api_carrito_get():
     """API: Obtener carrito"""
-    return jsonify({
-        "success": True,
-        "carrito": carrito_global,
-        "total": calcular_total_carrito(),
-        "ahorro": calcular_ahorro_carrito(),
-        "cantidad_items": len(carrito_global)
-    })
+    estado = estado_actual()
+    with estado.lock:
+        return jsonify({
+            "success": True,
+            "carrito": list(estado.carrito.values()),
+            "total": estado.total,
+            "ahorro": estado.ahorro,
+            "cantidad_items": len(estado.carrito)
+        })
 
 @app.route('/api/carrito/agregar', methods=['POST'])
 def api_carrito_agregar():
     """API: Agregar juego al carrito"""
-    global carrito_contador
     data = request.json
     id_juego = data.get('id')
     
@@ -780,54 +1127,42 @@ def api_carrito_agregar():
     if not juego:
         return jsonify({"success": False, "error": "Juego no encontrado"}), 404
     
-    # Verificar si ya está en el carrito
-    for item in carrito_global:
-        if item["id"] == id_juego:
-            item["cantidad"] += 1
-            return jsonify({
-                "success": True,
-                "message": f"Cantidad actualizada: {item['cantidad']}",
-                "carrito_count": len(carrito_global)
-            })
-    
-    # Agregar nuevo item
-    carrito_contador += 1
-    item_carrito = {
-        "carrito_id": carrito_contador,
-        "id": juego["id"],
-        "nombre": juego["nombre"],
-        "imagen": juego["imagen"],
-        "precio": juego["precio"],
-        "precio_original": juego["precio_original"],
-        "descuento": juego["descuento"],
-        "cantidad": 1
-    }
-    carrito_global.append(item_carrito)
+    # Si ya está en el carrito solo se incrementa la cantidad (búsqueda O(1) por ID)
+    estado = estado_actual(crear=True)
+    item, es_nuevo = estado.agregar_al_carrito(juego, carrito_contador.siguiente)
+    
+    if not es_nuevo:
+        return jsonify({
+            "success": True,
+            "message": f"Cantidad actualizada: {item['cantidad']}",
+            "carrito_count": len(estado.carrito)
+        })
     
     return jsonify({
         "success": True,
         "message": f"'{juego['nombre']}' agregado al carrito",
-        "carrito_count": len(carrito_global)
+        "carrito_count": len(estado.carrito)
     })
 
 @app.route('/api/carrito/eliminar/<int:id>', methods=['DELETE'])
 def api_carrito_eliminar(id):
     """API: Eliminar juego del carrito"""
-    global carrito_global
-    carrito_global = [item for item in carrito_global if item["id"] != id]
+    estado = estado_actual()
+    with estado.lock:
+        estado.eliminar_del_carrito(id)
+        carrito_count, total, _ = estado.resumen_carrito()
     
     return jsonify({
         "success": True,
         "message": "Juego eliminado del carrito",
-        "carrito_count": len(carrito_global),
-        "total": calcular_total_carrito()
+        "carrito_count": carrito_count,
+        "total": total
     })
 
 @app.route('/api/carrito/vaciar', methods=['DELETE'])
 def api_carrito_vaciar():
     """API: Vaciar carrito"""
-    global carrito_global
-    carrito_global = []
+    estado_actual().vaciar_carrito()
     
     return jsonify({
         "success": True,
@@ -838,26 +1173,13 @@ def api_carrito_vaciar():
 @app.route('/api/carrito/comprar', methods=['POST'])
 def api_carrito_comprar():
     """API: Procesar compra"""
-    global carrito_global, biblioteca_global
+    estado = estado_actual()
     
-    if not carrito_global:
+    # Pasar los juegos del carrito a la biblioteca (comprobación y compra bajo el mismo lock)
+    total_compra, juegos_comprados = estado.comprar(datetime.now().strftime("%Y-%m-%d %H:%M"))
+    if not juegos_comprados:
         return jsonify({"success": False, "error": "El carrito está vacío"}), 400
     
-    # Agregar juegos a biblioteca
-    for item in carrito_global:
-        if not any(j["id"] == item["id"] for j in biblioteca_global):
-            biblioteca_global.append({
-                "id": item["id"],
-                "nombre": item["nombre"],
-                "imagen": item["imagen"],
-                "fecha_compra": datetime.now().strftime("%Y-%m-%d %H:%M"),
-                "tiempo_jugado": 0
-            })
-    
-    total_compra = calcular_total_carrito()
-    juegos_comprados = len(carrito_global)
-    carrito_global = []
-    
     return jsonify({
         "success": True,
         "message": f"¡Compra realizada! {juegos_comprados} juego(s) añadidos a tu biblioteca",
@@ -865,6 +1187,30 @@ def api_carrito_comprar():
         "carrito_count": 0
     })
 
+@app.route('/api/carrito/lote', methods=['POST'])
+def api_carrito_lote():
+    """API: Añadir y quitar varios juegos del carrito de una vez.
+    Body: {"agregar": [{"id", "cantidad"}], "eliminar": [{"id", "cantidad"}]} (o solo ids);
+    en "eliminar", sin cantidad se quita el juego entero. Si algo no es válido no se aplica nada."""
+    data = request.get_json(silent=True)
+    try:
+        agregar = leer_lote(data, 'agregar', cantidad_por_defecto=1)
+        eliminar = leer_lote(data, 'eliminar')
+    except ValueError as error:
+        return jsonify({"success": False, "error": str(error)}), 400
+    if len(agregar) + len(eliminar) > LOTE_MAXIMO:
+        return jsonify({"success": False, "error": f"Como máximo {LOTE_MAXIMO} juegos por lote"}), 400
+    
+    juegos, no_encontrados = juegos_del_lote(agregar)
+    if no_encontrados:
+        return jsonify({"success": False, "error": "Juegos no encontrados", "ids": no_encontrados}), 404
+    
+    # Todo el lote bajo el lock del estado: los totales se calculan una sola vez al final
+    estado = estado_actual(crear=True)
+    resultado = estado.lote_carrito([(juegos[i], cantidad) for i, cantidad in agregar.items()],
+                                    list(eliminar.items()), carrito_contador.siguiente)
+    return jsonify({"success": True, **resultado})
+
 @app.route('/api/wishlist/agregar', methods=['POST'])
 def api_wishlist_agregar():
     """API: Agregar a lista de deseos"""
@@ -875,19 +1221,10 @@ def api_wishlist_agregar():
     if not juego:
         return jsonify({"success": False, "error": "Juego no encontrado"}), 404
     
-    if any(j["id"] == id_juego for j in wishlist_global):
+    estado = estado_actual(crear=True)
+    if not estado.agregar_a_wishlist(juego, datetime.now().strftime("%Y-%m-%d")):
         return jsonify({"success": False, "error": "Ya está en tu lista de deseos"}), 400
     
-    wishlist_global.append({
-        "id": juego["id"],
-        "nombre": juego["nombre"],
-        "imagen": juego["imagen"],
-        "precio": juego["precio"],
-        "precio_original": juego["precio_original"],
-        "descuento": juego["descuento"],
-        "fecha_agregado": datetime.now().strftime("%Y-%m-%d")
-    })
-    
     return jsonify({
         "success": True,
         "message": f"'{juego['nombre']}' añadido a lista de deseos"
@@ -896,51 +1233,125 @@ def api_wishlist_agregar():
 @app.route('/api/wishlist/eliminar/<int:id>', methods=['DELETE'])
 def api_wishlist_eliminar(id):
     """API: Eliminar de lista de deseos"""
-    global wishlist_global
-    wishlist_global = [j for j in wishlist_global if j["id"] != id]
+    estado_actual().eliminar_de_wishlist(id)
     
     return jsonify({"success": True, "message": "Eliminado de lista de deseos"})
 
+@app.route('/api/wishlist/lote', methods=['POST'])
+def api_wishlist_lote():
+    """API: Añadir y quitar varios juegos de la lista de deseos de una vez.
+    Body: {"agregar": [ids], "eliminar": [ids]}. Si algo no es válido no se aplica nada."""
+    data = request.get_json(silent=True)
+    try:
+        agregar = leer_lote(data, 'agregar')
+        eliminar = leer_lote(data, 'eliminar')
+    except ValueError as error:
+        return jsonify({"success": False, "error": str(error)}), 400
+    if len(agregar) + len(eliminar) > LOTE_MAXIMO:
+        return jsonify({"success": False, "error": f"Como máximo {LOTE_MAXIMO} juegos por lote"}), 400
+    
+    juegos, no_encontrados = juegos_del_lote(agregar)
+    if no_encontrados:
+        return jsonify({"success": False, "error": "Juegos no encontrados", "ids": no_encontrados}), 404
+    
+    estado = estado_actual(crear=True)
+    resultado = estado.lote_wishlist(list(juegos.values()), list(eliminar), datetime.now().strftime("%Y-%m-%d"))
+    return jsonify({"success": True, **resultado})
+
 @app.route('/api/review', methods=['POST'])
 def api_agregar_review():
     """API: Agregar review"""
-    global review_contador
     data = request.json
     
-    review_contador += 1
+    juego = obtener_juego_por_id(data.get('juego_id'))
+    if not juego:
+        return jsonify({"success": False, "error": "Juego no encontrado"}), 404
+    
+    valoracion = data.get('valoracion', 5)
+    if type(valoracion) is not int or not 1 <= valoracion <= 5:
+        return jsonify({"success": False, "error": "La valoración debe ser un entero entre 1 y 5"}), 400
+    
     review = {
-        "id": review_contador,
-        "juego_id": data.get('juego_id'),
+        "id": review_contador.siguiente(),
+        "juego_id": juego["id"],
         "usuario": data.get('usuario', 'Usuario Anónimo'),
-        "valoracion": data.get('valoracion', 5),
+        "valoracion": valoracion,
         "contenido": data.get('contenido', ''),
         "recomendado": data.get('recomendado', True),
         "fecha": datetime.now().strftime("%Y-%m-%d"),
         "horas_jugadas": data.get('horas_jugadas', 0)
     }
-    reviews_global.append(review)
+    reviews.agregar(review)
     
     return jsonify({"success": True, "message": "Review añadida", "review": review})
 
+@app.route('/api/juego/<int:id>/reviews')
+def api_reviews_juego(id):
+    """API: Reviews de un juego, de la más reciente a la más antigua"""
+    if not obtener_juego_por_id(id):
+        return jsonify({"success": False, "error": "Juego no encontrado"}), 404
+    
+    pagina = max(request.args.get('pagina', 1, type=int), 1)
+    por_pagina = min(max(request.args.get('por_pagina', REVIEWS_POR_PAGINA, type=int), 1), LIMITE_API_MAXIMO)
+    total = reviews.total(id)
+    
+    return jsonify({
+        "success": True,
+        "reviews": reviews.pagina(id, pagina, por_pagina),
+        "total": total,
+        "pagina": pagina,
+        "total_paginas": -(-total // por_pagina)
+    })
+
 @app.route('/api/estadisticas')
+@con_etag(lambda: f"estadisticas-{ARRANQUE_ETAG}-{catalogo.version}")
 def api_estadisticas():
     """API: Estadísticas de la tienda"""
     return jsonify({
         "success": True,
-        "estadisticas": obtener_estadisticas()
+        "estadisticas": obtener_estadisticas(con_agregados=True)
+    })
+
+@app.route('/api/cache')
+def api_cache():
+    """API: Aciertos y fallos de las cachés (para comprobar que son efectivas)"""
+    return jsonify({
+        "success": True,
+        "tarjetas": cache_tarjetas.estadisticas(),
+        "json": cache_json.estadisticas(),
+        "tienda": cache_tienda.estadisticas()
     })
 
 @app.route('/api/buscar')
+@con_etag(lambda: etag_consulta("buscar"), vary=('Accept',))
 def api_buscar():
-    """API: Búsqueda de juegos"""
+    """API: Búsqueda de juegos (con Accept: application/x-ndjson, en streaming).
+    Si ninguna palabra coincide, responde con los juegos más parecidos y "aproximada": true."""
     query = request.args.get('q', '')
-    resultados = buscar_juegos(query) if query else []
+    ids, aproximada = ids_busqueda(query)
+    if pide_ndjson():
+        juegos = map(catalogo.obtener, ids) if aproximada else catalogo.recorrer_en_orden(ids)
+        return respuesta_ndjson(juegos, cabeceras={"X-Total-Count": str(len(ids))})
+    resultados = [catalogo.obtener(i) for i in ids] if aproximada else catalogo.juegos_en_orden(ids)
     
-    return jsonify({
+    return respuesta_json({
         "success": True,
         "query": query,
         "resultados": len(resultados),
-        "juegos": resultados
+        "aproximada": aproximada
+    }, {"juegos": cache_json.lista(resultados)})
+
+@app.route('/api/autocomplete')
+def api_autocomplete():
+    """API: Sugerencias para la caja de búsqueda (juegos con más reseñas y etiquetas por prefijo)"""
+    query = request.args.get('q', '')
+    cantidad = min(max(request.args.get('n', 8, type=int), 1), IndiceAutocompletado.MAX_SUGERENCIAS)
+    return jsonify({
+        "success": True,
+        "query": query,
+        "juegos": [proyectar(j, ("id", "nombre", "imagen", "precio", "num_reviews"))
+                   for j in autocompletado.juegos(query, cantidad)],
+        "etiquetas": autocompletado.etiquetas(query, 3)
     })
 
 # =========================================================================================
@@ -952,6 +1363,8 @@ if __name__ == '__main__':
     print("🎮 STEAM STORE CLONE - Tienda de Videojuegos")
     print("=" * 60)
     print(f"📊 {len(catalogo_juegos)} juegos en el catálogo")
+    if informe_importacion is not None:
+        print(f"📥 {informe_importacion}")
     print(f"📁 {len(categorias)} categorías disponibles")
     print("=" * 60)
     print("🌐 Servidor iniciando en: http://127.0.0.1:5000")
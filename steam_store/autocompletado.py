@@ -0,0 +1,200 @@
+# =========================================================================================
+#  🔡 AUTOCOMPLETADO - Sugerencias por prefijo para la caja de búsqueda
+#  ────────────────────────────────────────────────────────────────────────────────────────
+#  * Array ordenado de claves normalizadas (sin tildes, en minúsculas) con bisect: las claves
+#    que empiezan por un prefijo forman un rango contiguo
+#  * Cada nombre se indexa desde cada una de sus palabras ("witcher" sugiere "The Witcher 3")
+#  * Los prefijos que abarcan muchas claves guardan su top por num_reviews con reserva (más
+#    entradas de las que se sugieren) y se reparan en cada cambio: solo se vuelve a recorrer
+#    el rango si las bajas dejan el top sin entradas suficientes
+#  * Los recorridos se hacen sin el lock del catálogo (no frenan las escrituras); el top
+#    solo se guarda si la versión del catálogo no cambió mientras tanto
+#  * Los que abarcan pocas claves se resuelven recorriendo su rango (no hace falta guardar nada)
+#  * Las etiquetas se sugieren aparte, ordenadas por las reseñas sumadas de sus juegos
+# =========================================================================================
+
+import heapq
+import unicodedata
+from bisect import bisect_left, insort
+
+from busqueda import tokenizar
+from catalogo import IndiceCatalogo
+
+
+def normalizar(texto):
+    """Texto en minúsculas, sin tildes y con las palabras separadas por un espacio"""
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    sin_tildes = "".join(c for c in descompuesto if not unicodedata.combining(c))
+    return " ".join(tokenizar(sin_tildes))
+
+
+def claves_nombre(nombre):
+    """Una clave por palabra del nombre: desde esa palabra hasta el final"""
+    palabras = normalizar(nombre).split(" ")
+    return {" ".join(palabras[i:]) for i in range(len(palabras)) if palabras[i]}
+
+
+class _Top:
+    """Mejores entradas (-num_reviews, posición, id) de un prefijo, ordenadas.
+    `corte`: ninguna entrada fuera de la lista es menor (None: la lista tiene todos los juegos)"""
+
+    __slots__ = ("entradas", "corte")
+
+    def __init__(self, entradas, corte):
+        self.entradas = entradas
+        self.corte = corte
+
+    def bajar_corte(self, entrada):
+        if self.corte is None or entrada < self.corte:
+            self.corte = entrada
+
+
+class IndiceAutocompletado(IndiceCatalogo):
+    """Top de juegos y etiquetas cuyo nombre (o una de sus palabras) empieza por un prefijo"""
+
+    CAMPOS = {"nombre", "etiquetas", "num_reviews"}
+    # * Un prefijo con más claves que esto guarda su top (así son pocos y la memoria queda acotada)
+    MIN_CLAVES_TOP = 64
+    MAX_SUGERENCIAS = 10
+    # * Entradas guardadas por top: las bajas lo van gastando antes de tener que recorrer el rango
+    RESERVA = 3 * MAX_SUGERENCIAS
+
+    def __init__(self, catalogo):
+        self._catalogo = catalogo
+        # * (clave, id) ordenado
+        self._claves = []
+        # * prefijo → _Top con como mucho RESERVA entradas
+        self._tops = {}
+        # * clave de etiqueta → [nombre, reseñas sumadas, número de juegos]
+        self._etiquetas = {}
+        self._claves_etiquetas = []
+
+    def _entrada(self, juego):
+        return -juego["num_reviews"], self._catalogo.posicion(juego["id"]), juego["id"]
+
+    def _prefijos(self, juego):
+        return {clave[:n] for clave in claves_nombre(juego["nombre"]) for n in range(1, len(clave) + 1)}
+
+    def construir(self, juegos):
+        self._claves = sorted((clave, j["id"]) for j in juegos for clave in claves_nombre(j["nombre"]))
+        self._tops = {}
+        self._etiquetas = {}
+        self._claves_etiquetas = []
+        for juego in juegos:
+            self._sumar_etiquetas(juego, 1)
+
+    def _sumar_etiquetas(self, juego, signo):
+        for etiqueta in set(juego["etiquetas"]):
+            clave = normalizar(etiqueta)
+            datos = self._etiquetas.get(clave)
+            if datos is None:
+                datos = self._etiquetas[clave] = [etiqueta, 0, 0]
+                insort(self._claves_etiquetas, clave)
+            datos[1] += signo * juego["num_reviews"]
+            datos[2] += signo
+            if datos[2] == 0:
+                del self._etiquetas[clave]
+                del self._claves_etiquetas[bisect_left(self._claves_etiquetas, clave)]
+
+    def _entrar_en_tops(self, juego):
+        """Coloca el juego en los tops guardados de sus prefijos (si le corresponde)"""
+        entrada = self._entrada(juego)
+        for prefijo in self._prefijos(juego):
+            top = self._tops.get(prefijo)
+            if top is None:
+                continue
+            actual = next((e for e in top.entradas if e[2] == juego["id"]), None)
+            if actual is not None:
+                top.entradas.remove(actual)
+            if top.corte is not None and entrada > top.corte:
+                # * Peor que algún juego que ya quedó fuera: tampoco está en el top
+                continue
+            insort(top.entradas, entrada)
+            if len(top.entradas) > self.RESERVA:
+                top.bajar_corte(top.entradas.pop())
+
+    def _quitar_de_tops(self, juego):
+        """Saca al juego de los tops guardados; lo que queda sigue siendo el top exacto"""
+        for prefijo in self._prefijos(juego):
+            top = self._tops.get(prefijo)
+            if top is not None:
+                actual = next((e for e in top.entradas if e[2] == juego["id"]), None)
+                if actual is not None:
+                    top.entradas.remove(actual)
+
+    def al_agregar(self, juego):
+        for clave in claves_nombre(juego["nombre"]):
+            insort(self._claves, (clave, juego["id"]))
+        self._sumar_etiquetas(juego, 1)
+        self._entrar_en_tops(juego)
+
+    def al_eliminar(self, juego):
+        for clave in claves_nombre(juego["nombre"]):
+            i = bisect_left(self._claves, (clave, juego["id"]))
+            if i < len(self._claves) and self._claves[i] == (clave, juego["id"]):
+                del self._claves[i]
+        self._sumar_etiquetas(juego, -1)
+        self._quitar_de_tops(juego)
+
+    def al_actualizar(self, anterior, juego, campos):
+        if not campos & self.CAMPOS:
+            return
+        if "nombre" in campos:
+            super().al_actualizar(anterior, juego, campos)
+            return
+        # * Mismas claves: basta con recolocarlo en sus tops (si baja por debajo del corte sale)
+        self._sumar_etiquetas(anterior, -1)
+        self._sumar_etiquetas(juego, 1)
+        self._entrar_en_tops(juego)
+
+    def _rango(self, prefijo):
+        return bisect_left(self._claves, (prefijo,)), bisect_left(self._claves, (prefijo + "\uffff",))
+
+    def _top_rango(self, inicio, fin, cantidad):
+        """Top recorriendo un rango de claves (un juego cuenta una vez). Se llama sin el lock del
+        catálogo: un juego dado de baja a mitad del recorrido simplemente no cuenta."""
+        entradas = []
+        for id_juego in {id_juego for _, id_juego in self._claves[inicio:fin]}:
+            juego = self._catalogo.obtener(id_juego)
+            try:
+                entradas.append(self._entrada(juego))
+            except (KeyError, TypeError):
+                continue
+        return heapq.nsmallest(cantidad, entradas)
+
+    def _calcular_top(self, prefijo):
+        """Top recorriendo el rango del prefijo; se guarda solo si el rango es grande y el
+        catálogo no cambió durante el recorrido (si cambió, vale para esta consulta)"""
+        with self._catalogo.lock:
+            version = self._catalogo.version
+        inicio, fin = self._rango(prefijo)
+        mejores = self._top_rango(inicio, fin, self.RESERVA + 1)
+        top = _Top(mejores[:self.RESERVA], mejores[self.RESERVA] if len(mejores) > self.RESERVA else None)
+        if fin - inicio > self.MIN_CLAVES_TOP:
+            with self._catalogo.lock:
+                if self._catalogo.version == version:
+                    self._tops[prefijo] = top
+        return top
+
+    def juegos(self, texto, cantidad=MAX_SUGERENCIAS):
+        """Juegos con más reseñas cuyo nombre o alguna de sus palabras empieza por `texto`"""
+        prefijo = normalizar(texto)
+        if not prefijo:
+            return []
+        cantidad = min(cantidad, self.MAX_SUGERENCIAS)
+        top = self._tops.get(prefijo)
+        # * Un top gastado por las bajas (y con juegos fuera de la lista) se vuelve a calcular
+        if top is None or (len(top.entradas) < cantidad and top.corte is not None):
+            top = self._calcular_top(prefijo)
+        juegos = (self._catalogo.obtener(e[2]) for e in top.entradas[:cantidad])
+        return [j for j in juegos if j is not None]
+
+    def etiquetas(self, texto, cantidad=MAX_SUGERENCIAS):
+        """Etiquetas que empiezan por `texto`, de más a menos reseñas de sus juegos"""
+        prefijo = normalizar(texto)
+        if not prefijo:
+            return []
+        inicio = bisect_left(self._claves_etiquetas, prefijo)
+        fin = bisect_left(self._claves_etiquetas, prefijo + "\uffff")
+        datos = (d for d in map(self._etiquetas.get, self._claves_etiquetas[inicio:fin]) if d is not None)
+        return [nombre for nombre, _, _ in heapq.nsmallest(cantidad, datos, key=lambda d: (-d[1], d[0]))]
@@ -0,0 +1,74 @@
+# =========================================================================================
+#  ⏱️ BENCHMARK: autocompletado por prefijo (recorrido del catálogo vs array ordenado)
+#  Uso: python benchmarks/bench_autocompletado.py
+# =========================================================================================
+
+import random
+import time
+
+from comun import TAMANOS, medir
+
+from app import catalogo_juegos
+from autocompletado import IndiceAutocompletado, claves_nombre, normalizar
+from catalogo import CatalogoJuegos
+from generador import generar_catalogo
+
+
+def sugerencias_lineal(juegos, texto, cantidad=8):
+    """Sin índice: recorrer el catálogo y ordenar los que encajan por num_reviews"""
+    prefijo = normalizar(texto)
+    encajan = [j for j in juegos if any(c.startswith(prefijo) for c in claves_nombre(j["nombre"]))]
+    return sorted(encajan, key=lambda j: j["num_reviews"], reverse=True)[:cantidad]
+
+
+def main():
+    aleatorio = random.Random(0)
+    print(f"{'juegos':>10} | {'índice (s)':>10} | {'lineal (µs)':>12} | {'corto (µs)':>10} | "
+          f"{'largo (µs)':>10} | {'1ª vez (µs)':>11} | {'alta (µs)':>9} | {'tras baja (µs)':>14}")
+    for n in TAMANOS:
+        juegos = generar_catalogo(n, catalogo_juegos)
+        catalogo = CatalogoJuegos(juegos)
+        inicio = time.perf_counter()
+        indice = catalogo.registrar_indice(IndiceAutocompletado(catalogo))
+        construccion = time.perf_counter() - inicio
+
+        nombres = [normalizar(j["nombre"]) for j in aleatorio.sample(juegos, 100)]
+        # * Prefijos cortos (1-3 letras) y largos (palabra + parte de la siguiente)
+        cortos = [nombre[:aleatorio.randint(1, 3)] for nombre in nombres]
+        largos = [nombre[:aleatorio.randint(6, 12)] for nombre in nombres]
+        # * Primera consulta de cada prefijo (recorre su rango y guarda el top si es grande)
+        inicio = time.perf_counter()
+        for prefijo in cortos + largos:
+            indice.juegos(prefijo, 8)
+        primera = (time.perf_counter() - inicio) * 1_000_000 / (len(cortos) + len(largos))
+
+        lineal = medir(lambda: sugerencias_lineal(juegos, cortos[0]), repeticiones=1, numero=1)
+        corto = medir(lambda: [indice.juegos(p, 8) for p in cortos], numero=10) / len(cortos)
+        largo = medir(lambda: [indice.juegos(p, 8) for p in largos], numero=10) / len(largos)
+
+        plantilla = dict(juegos[0])
+        siguiente = iter(range(n + 1, n + 10_001))
+
+        def alta():
+            juego = dict(plantilla, id=next(siguiente), num_reviews=aleatorio.randint(0, 10 ** 6))
+            catalogo.agregar(juego)
+
+        altas = medir(alta, repeticiones=1, numero=1000)
+
+        # * Consulta justo después de dar de baja al primer sugerido: el top guardado se repara en la
+        #   baja, así que no hace falta volver a recorrer el rango (la baja en sí no se cronometra)
+        tras_baja = 0.0
+        for _ in range(200):
+            prefijo = aleatorio.choice(cortos)
+            sugeridos = indice.juegos(prefijo, 8)
+            if sugeridos:
+                catalogo.eliminar(sugeridos[0]["id"])
+            inicio = time.perf_counter()
+            indice.juegos(prefijo, 8)
+            tras_baja += (time.perf_counter() - inicio) * 1_000_000 / 200
+        print(f"{n:>10,} | {construccion:>10.2f} | {lineal:>12,.0f} | {corto:>10.1f} | {largo:>10.1f} | "
+              f"{primera:>11,.0f} | {altas:>9.1f} | {tras_baja:>14,.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+# =========================================================================================
+#  ⏱️ BENCHMARK: búsqueda con erratas (trigramas) según el tamaño del catálogo
+#  Uso: python benchmarks/bench_busqueda_aproximada.py [--tamanos 1000,10000,100000]
+#
+#  Las consultas son palabras reales del catálogo con una errata al azar (letra borrada,
+#  cambiada o repetida). Se mide la latencia de la búsqueda aproximada y el acierto:
+#  la palabra original debe estar entre los tokens propuestos.
+# =========================================================================================
+
+import random
+import string
+import time
+
+from comun import TAMANOS
+
+from app import catalogo_juegos
+from busqueda import IndiceTexto, tokenizar
+from catalogo import CatalogoJuegos
+from generador import generar_catalogo
+
+CONSULTAS = 500
+
+
+def con_errata(palabra, aleatorio):
+    i = aleatorio.randrange(len(palabra))
+    tipo = aleatorio.choice(("borrar", "cambiar", "repetir"))
+    if tipo == "borrar":
+        return palabra[:i] + palabra[i + 1:]
+    if tipo == "cambiar":
+        return palabra[:i] + aleatorio.choice(string.ascii_lowercase) + palabra[i + 1:]
+    return palabra[:i] + palabra[i] + palabra[i:]
+
+
+def percentil(ordenados, p):
+    return ordenados[min(int(len(ordenados) * p / 100), len(ordenados) - 1)]
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Latencia y acierto de la búsqueda con erratas")
+    parser.add_argument("--tamanos", default=",".join(map(str, TAMANOS)))
+    args = parser.parse_args()
+
+    aleatorio = random.Random(0)
+    palabras = sorted({t for j in catalogo_juegos for t in tokenizar(j["nombre"]) if t.isalpha() and len(t) >= 5})
+    print(f"{'juegos':>10} | {'índice (s)':>10} | {'p50 (µs)':>9} | {'p95 (µs)':>9} | {'máx (µs)':>9} | {'acierto':>7}")
+    for n in (int(t) for t in args.tamanos.split(",")):
+        catalogo = CatalogoJuegos(generar_catalogo(n, catalogo_juegos))
+        inicio = time.perf_counter()
+        indice = catalogo.registrar_indice(IndiceTexto())
+        construccion = time.perf_counter() - inicio
+
+        tiempos = []
+        aciertos = 0
+        for _ in range(CONSULTAS):
+            palabra = aleatorio.choice(palabras)
+            errata = con_errata(palabra, aleatorio)
+            t0 = time.perf_counter()
+            indice.buscar_aproximado(errata)
+            tiempos.append((time.perf_counter() - t0) * 1_000_000)
+            if palabra in (t for _, t in indice.tokens_parecidos(errata)) or indice.ids_con_prefijo(errata):
+                aciertos += 1
+        tiempos.sort()
+        print(f"{n:>10,} | {construccion:>10.2f} | {percentil(tiempos, 50):>9,.0f} | {percentil(tiempos, 95):>9,.0f} | "
+              f"{tiempos[-1]:>9,.0f} | {aciertos / CONSULTAS:>7.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+# =========================================================================================
+#  ⏱️ BENCHMARK: búsqueda por ID (recorrido lineal vs índice hash)
+#  Uso: python benchmarks/bench_busqueda_id.py
+# =========================================================================================
+
+import random
+
+from comun import TAMANOS, generar_juegos, medir
+
+from app import catalogo_juegos
+from catalogo import CatalogoJuegos
+
+
+def buscar_lineal(juegos, id_juego):
+    """Implementación anterior: comprensión sobre todo el catálogo"""
+    encontrados = [j for j in juegos if j["id"] == id_juego]
+    return encontrados[0] if encontrados else None
+
+
+def main():
+    print(f"{'juegos':>10} | {'lineal (µs)':>12} | {'índice (µs)':>12} | {'mejora':>8}")
+    print("-" * 52)
+    for n in TAMANOS:
+        juegos = generar_juegos(n, catalogo_juegos)
+        catalogo = CatalogoJuegos(juegos)
+        ids = [random.randint(1, n) for _ in range(100)]
+
+        lineal = medir(lambda: [buscar_lineal(juegos, i) for i in ids], numero=1) / len(ids)
+        indice = medir(lambda: [catalogo.obtener(i) for i in ids], numero=100) / len(ids)
+        print(f"{n:>10} | {lineal:>12.2f} | {indice:>12.4f} | {lineal / indice:>7.0f}x")
+
+
+if __name__ == '__main__':
+    main()
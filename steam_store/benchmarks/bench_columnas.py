@@ -0,0 +1,59 @@
+# =========================================================================================
+#  ⏱️ BENCHMARK: filtros y agregados con bucles de Python vs columnas de NumPy
+#  Uso: python benchmarks/bench_columnas.py   (necesita NumPy: pip install numpy)
+# =========================================================================================
+
+import sys
+
+from comun import TAMANOS, generar_juegos, medir
+
+from app import catalogo_juegos
+from catalogo import CatalogoJuegos
+from columnas import DISPONIBLE, ColumnasCatalogo
+from indices import FiltroFacetas, IndicePrecio
+
+
+def consultas_python(juegos, facetas, indice_precio):
+    """Implementación sin NumPy: índice de precios con bisect y recorridos del catálogo"""
+    return {
+        "rango de precio (bitset)": lambda: facetas.bits_de_ids(indice_precio.ids_en_rango(10, 30)),
+        "conteo valoración >= 4.5": lambda: sum(1 for j in juegos if j["valoracion"] >= 4.5),
+        "media de valoración": lambda: sum(j["valoracion"] for j in juegos) / len(juegos),
+        "histograma de precios": lambda: [sum(1 for j in juegos if a <= j["precio"] < b)
+                                          for a, b in zip([0, 10, 20, 40], [10, 20, 40, 60])],
+    }
+
+
+def consultas_numpy(columnas):
+    return {
+        "rango de precio (bitset)": lambda: columnas.filtrar({"precio": (10, 30)}),
+        "conteo valoración >= 4.5": lambda: columnas.contar({"valoracion": (4.5, None)}),
+        "media de valoración": lambda: columnas.media("valoracion"),
+        "histograma de precios": lambda: columnas.histograma("precio", [0, 10, 20, 40, 60]),
+    }
+
+
+def main():
+    if not DISPONIBLE:
+        print("⚠️  NumPy no está instalado: pip install numpy")
+        sys.exit(1)
+
+    print(f"{'juegos':>10} | {'consulta':>26} | {'python (µs)':>12} | {'numpy (µs)':>11} | {'mejora':>7}")
+    for n in TAMANOS:
+        juegos = generar_juegos(n, catalogo_juegos)
+        catalogo = CatalogoJuegos(juegos)
+        facetas = catalogo.registrar_indice(FiltroFacetas(catalogo))
+        indice_precio = catalogo.registrar_indice(IndicePrecio())
+        columnas = catalogo.registrar_indice(ColumnasCatalogo(catalogo))
+
+        python = consultas_python(juegos, facetas, indice_precio)
+        numpy = consultas_numpy(columnas)
+        numero = max(10_000 // n, 1)
+        for nombre in python:
+            t_python = medir(python[nombre], repeticiones=3, numero=numero)
+            t_numpy = medir(numpy[nombre], repeticiones=3, numero=numero)
+            print(f"{n:>10,} | {nombre:>26} | {t_python:>12,.1f} | {t_numpy:>11,.1f} | {t_python / t_numpy:>6.1f}x")
+
+
+if __name__ == '__main__':
+    main()
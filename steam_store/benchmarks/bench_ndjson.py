@@ -0,0 +1,101 @@
+# =========================================================================================
+#  ⏱️ BENCHMARK: listados grandes en un único JSON vs JSON Lines en streaming
+#  Uso: python benchmarks/bench_ndjson.py [--juegos 100000]
+#
+#  Mide el tiempo hasta el primer byte, el tiempo total y el pico de memoria (tracemalloc)
+#  de /api/juegos y /api/buscar con Accept: application/json y application/x-ndjson.
+#  La app se arranca en un proceso hijo con un catálogo sintético (STEAM_CATALOGO).
+# =========================================================================================
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+
+import comun  # noqa: F401 (añade steam_store al path)
+
+FORMATOS = {"json": "application/json", "ndjson": "application/x-ndjson"}
+
+
+def medir_peticion(cliente, url, accept):
+    """(primer byte en ms, total en ms, bytes, pico de memoria en KB) consumiendo la respuesta por trozos"""
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    inicio = time.perf_counter()
+    respuesta = cliente.get(url, headers={"Accept": accept}, buffered=False)
+    primer_byte = None
+    total_bytes = 0
+    for trozo in respuesta.response:
+        if primer_byte is None:
+            primer_byte = time.perf_counter() - inicio
+        total_bytes += len(trozo)
+    total = time.perf_counter() - inicio
+    respuesta.close()
+    pico = tracemalloc.get_traced_memory()[1] - base
+    return primer_byte * 1000, total * 1000, total_bytes, pico / 1024
+
+
+def medir_proceso():
+    """Se ejecuta en el proceso hijo: arranca la app y mide cada URL en los dos formatos"""
+    import app
+
+    etiqueta = Counter(e for j in app.catalogo_juegos for e in j["etiquetas"]).most_common(1)[0][0]
+    urls = {
+        "/api/juegos": "/api/juegos",
+        "/api/juegos?fields": "/api/juegos?fields=id,nombre,precio",
+        "/api/buscar": f"/api/buscar?q={etiqueta.split()[0].lower()}",
+    }
+    cliente = app.app.test_client()
+    resultados = {}
+    tracemalloc.start()
+    for nombre, url in urls.items():
+        for formato, accept in FORMATOS.items():
+            # * La primera petición llena la caché de fragmentos JSON: se mide la segunda
+            medir_peticion(cliente, url, accept)
+            primer_byte, total, tamano, pico = medir_peticion(cliente, url, accept)
+            resultados[f"{nombre} {formato}"] = {
+                "primer_byte_ms": round(primer_byte, 1),
+                "total_ms": round(total, 1),
+                "mb": round(tamano / 1024 / 1024, 1),
+                "pico_kb": round(pico, 1)
+            }
+    tracemalloc.stop()
+    return {"juegos": len(app.catalogo), "resultados": resultados}
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Memoria y primer byte de JSON frente a JSON Lines en streaming")
+    parser.add_argument("--juegos", type=int, default=100_000)
+    parser.add_argument("--hijo", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.hijo:
+        print(json.dumps(medir_proceso()))
+        return
+
+    from app import catalogo_juegos
+    from generador import GeneradorCatalogo, escribir_jsonl
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, f"catalogo_{args.juegos}.jsonl")
+        escribir_jsonl(GeneradorCatalogo(catalogo_juegos).generar(args.juegos), ruta)
+        entorno = dict(os.environ, STEAM_CATALOGO=ruta, STEAM_ALMACEN="memoria")
+        salida = subprocess.run([sys.executable, os.path.abspath(__file__), "--hijo"],
+                                env=entorno, capture_output=True, text=True, check=True).stdout
+    medida = json.loads(salida.strip().splitlines()[-1])
+
+    print(f"{medida['juegos']:,} juegos")
+    print(f"{'petición':>26} | {'primer byte (ms)':>16} | {'total (ms)':>10} | {'MB':>6} | {'pico (KB)':>11}")
+    for nombre, r in medida["resultados"].items():
+        print(f"{nombre:>26} | {r['primer_byte_ms']:>16.1f} | {r['total_ms']:>10.1f} | "
+              f"{r['mb']:>6.1f} | {r['pico_kb']:>11,.1f}")
+
+
+if __name__ == '__main__':
+    main()
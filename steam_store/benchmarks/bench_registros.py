@@ -0,0 +1,64 @@
+# =========================================================================================
+#  ⏱️ BENCHMARK DE MEMORIA: juegos como diccionarios vs registros compactos (__slots__)
+#  Uso: python benchmarks/bench_registros.py [--tamanos 10000,100000,1000000]
+#
+#  Los juegos se generan, se pasan a JSON Lines y se vuelven a leer (como al importar un
+#  catálogo): así cada juego tiene sus propias cadenas, igual que en producción.
+#  Se mide con tracemalloc la memoria que ocupa el catálogo ya cargado de cada forma.
+# =========================================================================================
+
+import gc
+import json
+import time
+import tracemalloc
+
+import comun  # noqa: F401 (añade steam_store al path)
+
+from app import catalogo_juegos
+from generador import GeneradorCatalogo
+from registros import JuegoCompacto, Vocabulario
+
+TAMANOS_REGISTROS = [10_000, 100_000]
+
+
+def lineas_jsonl(n):
+    """Generador de las líneas JSON de n juegos sintéticos"""
+    for juego in GeneradorCatalogo(catalogo_juegos).generar(n):
+        yield json.dumps(dict(juego), ensure_ascii=False)
+
+
+def medir_carga(n, convertir):
+    """(MB que ocupa el catálogo, segundos de carga) leyendo n juegos con `convertir`"""
+    lineas = list(lineas_jsonl(n))
+    gc.collect()
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    juegos = [convertir(json.loads(linea)) for linea in lineas]
+    segundos = time.perf_counter() - inicio
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del juegos
+    return memoria / 1024 / 1024, segundos
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Memoria del catálogo con diccionarios y con registros compactos")
+    parser.add_argument("--tamanos", default=",".join(map(str, TAMANOS_REGISTROS)))
+    args = parser.parse_args()
+
+    print(f"{'juegos':>10} | {'dict (MB)':>10} | {'compacto (MB)':>13} | {'B/juego dict':>12} | "
+          f"{'B/juego compacto':>16} | {'ahorro':>6} | {'carga dict (s)':>14} | {'carga compacto (s)':>18}")
+    for n in (int(t) for t in args.tamanos.split(",")):
+        mb_dict, s_dict = medir_carga(n, lambda juego: juego)
+        # * Vocabulario nuevo en cada tamaño: su memoria cuenta dentro de la medida
+        JuegoCompacto.vocabulario = Vocabulario()
+        mb_compacto, s_compacto = medir_carga(n, JuegoCompacto)
+        print(f"{n:>10,} | {mb_dict:>10.1f} | {mb_compacto:>13.1f} | {mb_dict * 1024 * 1024 / n:>12,.0f} | "
+              f"{mb_compacto * 1024 * 1024 / n:>16,.0f} | {1 - mb_compacto / mb_dict:>6.0%} | "
+              f"{s_dict:>14.2f} | {s_compacto:>18.2f}")
+
+
+if __name__ == '__main__':
+    main()
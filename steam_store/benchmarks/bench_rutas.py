@@ -0,0 +1,202 @@
+# =========================================================================================
+#  ⏱️ BENCHMARK DE CARGA: latencia (p50/p95/p99) y memoria por ruta y tamaño de catálogo
+#  Uso: python benchmarks/bench_rutas.py [--tamanos 1000,10000,100000,1000000]
+#                                        [--peticiones 200] [--salida informe.json]
+#       python benchmarks/bench_rutas.py --comparar anterior.json nuevo.json
+#
+#  Cada tamaño se mide en un proceso nuevo que importa la app con un catálogo sintético
+#  (STEAM_CATALOGO), así el arranque y la memoria de un tamaño no afectan al siguiente.
+#  Antes de medir se espera a que terminen los juegos similares (se calculan en segundo
+#  plano): si no, su CPU se mezclaría con las latencias y /juego/<id> iría por el provisional.
+#  El informe JSON lleva el commit para poder comparar ejecuciones.
+# =========================================================================================
+
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import comun  # noqa: F401 (añade steam_store al path)
+
+TAMANOS_CARGA = [1_000, 10_000, 100_000, 1_000_000]
+
+# * Peticiones de cada ruta con tracemalloc activo (es lento: solo para la memoria)
+PETICIONES_MEMORIA = 10
+
+
+def rutas(ids, palabras):
+    """ruta → función (aleatorio) → (método, url, json). El carrito se llena antes de leerlo."""
+    return {
+        "/": lambda a: ("GET", "/", None),
+        "/tienda": lambda a: ("GET", "/tienda", None),
+        "/tienda?filtros": lambda a: ("GET", f"/tienda?categoria=RPG&orden=precio&direccion=desc&pagina={a.randint(1, 5)}", None),
+        "/juego/<id>": lambda a: ("GET", f"/juego/{a.choice(ids)}", None),
+        "/api/juegos": lambda a: ("GET", "/api/juegos?limit=20", None),
+        "/api/buscar": lambda a: ("GET", f"/api/buscar?q={a.choice(palabras)}", None),
+        "/api/carrito/agregar": lambda a: ("POST", "/api/carrito/agregar", {"id": a.choice(ids)}),
+        "/api/carrito": lambda a: ("GET", "/api/carrito", None),
+        "/api/carrito/eliminar/<id>": lambda a: ("DELETE", f"/api/carrito/eliminar/{a.choice(ids)}", None),
+    }
+
+
+def percentil(ordenados, p):
+    return ordenados[min(int(len(ordenados) * p / 100), len(ordenados) - 1)]
+
+
+def _rss_mb():
+    # * ru_maxrss está en KB en Linux (y en bytes en macOS)
+    maximo = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(maximo / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def medir_proceso(peticiones, semilla=0):
+    """Se ejecuta en el proceso hijo: arranca la app y mide cada ruta"""
+    inicio = time.perf_counter()
+    import app
+    arranque = time.perf_counter() - inicio
+    app.similares.esperar()
+    similares = time.perf_counter() - inicio - arranque
+    rss_arranque = _rss_mb()
+
+    aleatorio = random.Random(semilla)
+    ids = [j["id"] for j in app.catalogo_juegos]
+    palabras = sorted({p.lower() for j in app.catalogo_juegos[:1000] for p in j["nombre"].split() if p.isalpha()})
+    cliente = app.app.test_client()
+    resultados = {}
+    for nombre, peticion in rutas(ids, palabras).items():
+        def pedir():
+            metodo, url, cuerpo = peticion(aleatorio)
+            respuesta = cliente.open(url, method=metodo, json=cuerpo)
+            respuesta.get_data()
+            return respuesta.status_code
+
+        for _ in range(3):
+            pedir()
+        tiempos = []
+        estados = set()
+        for _ in range(peticiones):
+            t0 = time.perf_counter()
+            estados.add(pedir())
+            tiempos.append((time.perf_counter() - t0) * 1000)
+
+        tracemalloc.start()
+        picos = []
+        for _ in range(PETICIONES_MEMORIA):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            pedir()
+            picos.append(tracemalloc.get_traced_memory()[1] - base)
+        tracemalloc.stop()
+
+        tiempos.sort()
+        resultados[nombre] = {
+            "peticiones": peticiones,
+            "estados": sorted(estados),
+            "p50_ms": round(percentil(tiempos, 50), 3),
+            "p95_ms": round(percentil(tiempos, 95), 3),
+            "p99_ms": round(percentil(tiempos, 99), 3),
+            "media_ms": round(sum(tiempos) / len(tiempos), 3),
+            "memoria_pico_kb": round(max(picos) / 1024, 1)
+        }
+    return {
+        "juegos": len(app.catalogo),
+        "arranque_s": round(arranque, 3),
+        "similares_s": round(similares, 3),
+        "rss_arranque_mb": rss_arranque,
+        "rss_final_mb": _rss_mb(),
+        "rutas": resultados
+    }
+
+
+def medir_tamano(n, peticiones):
+    """Genera el catálogo en un fichero temporal y lo mide en un proceso hijo"""
+    from app import catalogo_juegos
+    from generador import GeneradorCatalogo, escribir_jsonl
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, f"catalogo_{n}.jsonl")
+        escribir_jsonl(GeneradorCatalogo(catalogo_juegos).generar(n), ruta)
+        # * STEAM_SIMILARES vacío: no se usa un similares.json que haya en la carpeta actual
+        entorno = dict(os.environ, STEAM_CATALOGO=ruta, STEAM_ALMACEN="memoria", STEAM_SIMILARES="")
+        salida = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--hijo", "--peticiones", str(peticiones)],
+            env=entorno, capture_output=True, text=True, check=True
+        ).stdout
+    return json.loads(salida.strip().splitlines()[-1])
+
+
+def commit_actual():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def comparar(anterior, nuevo):
+    """Tabla con la variación de p50/p95 de cada ruta en los tamaños comunes"""
+    with open(anterior, encoding="utf-8") as f:
+        a = json.load(f)
+    with open(nuevo, encoding="utf-8") as f:
+        b = json.load(f)
+    print(f"{a.get('commit')} → {b.get('commit')}")
+    for tamano in a["tamanos"]:
+        if tamano not in b["tamanos"]:
+            continue
+        print(f"\n{int(tamano):,} juegos")
+        print(f"{'ruta':>28} | {'p50 antes':>10} | {'p50 ahora':>10} | {'p95 antes':>10} | {'p95 ahora':>10}")
+        for ruta, antes in a["tamanos"][tamano]["rutas"].items():
+            ahora = b["tamanos"][tamano]["rutas"].get(ruta)
+            if ahora:
+                print(f"{ruta:>28} | {antes['p50_ms']:>10.3f} | {ahora['p50_ms']:>10.3f} | "
+                      f"{antes['p95_ms']:>10.3f} | {ahora['p95_ms']:>10.3f}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Latencia y memoria de cada ruta según el tamaño del catálogo")
+    parser.add_argument("--tamanos", default=",".join(map(str, TAMANOS_CARGA)))
+    parser.add_argument("--peticiones", type=int, default=200)
+    parser.add_argument("--salida", default="informe_rutas.json")
+    parser.add_argument("--comparar", nargs=2, metavar=("ANTERIOR", "NUEVO"))
+    parser.add_argument("--hijo", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.comparar:
+        comparar(*args.comparar)
+        return
+    if args.hijo:
+        print(json.dumps(medir_proceso(args.peticiones)))
+        return
+
+    informe = {
+        "commit": commit_actual(),
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "peticiones": args.peticiones,
+        "tamanos": {}
+    }
+    for n in (int(t) for t in args.tamanos.split(",")):
+        print(f"⏱️  {n:,} juegos...", flush=True)
+        medida = informe["tamanos"][str(n)] = medir_tamano(n, args.peticiones)
+        print(f"   arranque {medida['arranque_s']} s (+{medida['similares_s']} s de similares), "
+              f"RSS {medida['rss_final_mb']} MB")
+        for ruta, r in medida["rutas"].items():
+            print(f"   {ruta:>28}  p50 {r['p50_ms']:>9.3f} ms  p95 {r['p95_ms']:>9.3f} ms  "
+                  f"p99 {r['p99_ms']:>9.3f} ms  pico {r['memoria_pico_kb']:>9.1f} KB")
+        # * Se guarda tras cada tamaño: si el siguiente se queda sin memoria, lo medido no se pierde
+        with open(args.salida, "w", encoding="utf-8") as fichero:
+            json.dump(informe, fichero, indent=2, ensure_ascii=False)
+    print(f"📄 Informe: {args.salida}")
+
+
+if __name__ == '__main__':
+    main()
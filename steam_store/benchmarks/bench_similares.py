@@ -0,0 +1,76 @@
+# =========================================================================================
+#  ⏱️ BENCHMARK: juegos similares (recorrido por categoría vs vecinos precalculados)
+#  Uso: python benchmarks/bench_similares.py [procesos]
+#
+#  Los juegos sintéticos reciben etiquetas y desarrollador al azar para que casi todos
+#  tengan un perfil distinto (el peor caso para la reconstrucción).
+#  recall@4: fracción del top exacto (todos los candidatos, sin LSH) que devuelve el índice,
+#  medida sobre una muestra de juegos.
+# =========================================================================================
+
+import os
+import random
+import sys
+import time
+
+from comun import TAMANOS, generar_juegos, medir
+
+from app import catalogo_juegos
+from catalogo import CatalogoJuegos
+from recomendador import IndiceSimilares, Vecindario, perfil_juego
+
+PROCESOS = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count()
+
+
+def similares_por_categoria(juegos, juego):
+    """Implementación anterior: los 4 primeros de la misma categoría"""
+    return [j for j in juegos if j["categoria"] == juego["categoria"] and j["id"] != juego["id"]][:4]
+
+
+def variar_perfiles(juegos, semilla=0):
+    aleatorio = random.Random(semilla)
+    etiquetas = sorted({e for j in catalogo_juegos for e in j["etiquetas"]})
+    desarrolladores = [f"Estudio {i}" for i in range(max(len(juegos) // 50, 1))]
+    for juego in juegos:
+        juego["etiquetas"] = aleatorio.sample(etiquetas, aleatorio.randint(2, 6))
+        juego["desarrollador"] = aleatorio.choice(desarrolladores)
+    return juegos
+
+
+def recall(indice, muestra, k=4):
+    """Fracción del top k exacto que aparece en el top k del índice"""
+    exacto = Vecindario(indice._vecindario.perfiles, lsh=False)
+    aciertos = 0
+    for juego in muestra:
+        top = exacto.top(perfil_juego(juego), k + 1)
+        esperados = [e[2] for e in top if e[2] != juego["id"]][:k]
+        aciertos += len(set(esperados) & set(indice.similares(juego["id"])))
+    return aciertos / (k * len(muestra))
+
+
+def main():
+    print(f"{'juegos':>10} | {'categoría (µs)':>14} | {'consulta (µs)':>13} | "
+          f"{'rebuild 1 proc (s)':>18} | {f'rebuild {PROCESOS} proc (s)':>18} | {'recall@4':>8}")
+    print("-" * 99)
+    for n in TAMANOS:
+        juegos = variar_perfiles(generar_juegos(n, catalogo_juegos))
+        catalogo = CatalogoJuegos(juegos)
+        muestra = random.sample(juegos, 100)
+
+        tiempos = {}
+        for procesos in (1, PROCESOS):
+            indice = IndiceSimilares(catalogo, k=4, procesos=procesos)
+            inicio = time.perf_counter()
+            indice.construir(juegos)
+            tiempos[procesos] = time.perf_counter() - inicio
+
+        escaneo = medir(lambda: [similares_por_categoria(juegos, j) for j in muestra], numero=1) / len(muestra)
+        consulta = medir(lambda: [indice.similares(j["id"]) for j in muestra], numero=100) / len(muestra)
+        # * El cálculo exacto recorre todos los perfiles con algún rasgo en común: muestra pequeña
+        acierto = recall(indice, random.sample(juegos, 200))
+        print(f"{n:>10} | {escaneo:>14.2f} | {consulta:>13.2f} | {tiempos[1]:>18.2f} | "
+              f"{tiempos[PROCESOS]:>18.2f} | {acierto:>8.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+# =========================================================================================
+#  🧪 UTILIDADES COMUNES PARA LOS BENCHMARKS
+# =========================================================================================
+
+import os
+import sys
+import timeit
+
+# * Permite importar app.py y los módulos de steam_store desde esta carpeta
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+TAMANOS = [1_000, 10_000, 100_000]
+
+
+def generar_juegos(n, base):
+    """Genera n juegos clonando las plantillas del catálogo base con IDs nuevos"""
+    juegos = []
+    for i in range(n):
+        juego = dict(base[i % len(base)])
+        juego["id"] = i + 1
+        juego["nombre"] = f"{juego['nombre']} #{i + 1}"
+        juegos.append(juego)
+    return juegos
+
+
+def medir(funcion, repeticiones=5, numero=100):
+    """Mejor tiempo por llamada (en microsegundos)"""
+    tiempos = timeit.repeat(funcion, repeat=repeticiones, number=numero)
+    return min(tiempos) / numero * 1_000_000
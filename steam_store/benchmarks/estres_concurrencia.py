@@ -0,0 +1,223 @@
+# =========================================================================================
+#  🧵 PRUEBA DE ESTRÉS: carrito, compra y reseñas desde muchos hilos a la vez
+#  Uso: python benchmarks/estres_concurrencia.py [hilos] [operaciones_por_hilo]
+#
+#  Comprueba los invariantes del estado bajo concurrencia:
+#    * No se pierden incrementos de cantidad en una misma sesión
+#    * El dinero se conserva: lo añadido = lo pagado en compras + lo que queda en el carrito
+#    * El total y el ahorro mantenidos coinciden con los recalculados desde los items
+#    * Los IDs de carrito y de reseña nunca se repiten
+#    * num_reviews de cada juego cuenta todas las reseñas recibidas
+#    * Un lote de carrito se ve entero o nada (nunca a medias)
+# =========================================================================================
+
+import random
+import sys
+import threading
+from collections import Counter
+
+import comun  # noqa: F401 (añade steam_store al path)
+
+from app import app, catalogo_juegos, usuarios, reviews
+
+HILOS = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+OPERACIONES = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+errores = []
+
+
+def centimos(precio):
+    return round(precio * 100)
+
+
+def cliente_con_sesion(cookie=None):
+    """Cliente de pruebas; si se pasa cookie comparte la sesión de otro cliente"""
+    cliente = app.test_client()
+    if cookie is not None:
+        cliente.set_cookie("session", cookie)
+    return cliente
+
+
+def nueva_sesion():
+    """Crea una sesión con estado (añadiendo y vaciando el carrito) y devuelve su cookie"""
+    cliente = app.test_client()
+    cliente.post('/api/carrito/agregar', json={"id": catalogo_juegos[0]["id"]})
+    cliente.delete('/api/carrito/vaciar')
+    return cliente.get_cookie("session").value
+
+
+def en_hilos(funcion, *args):
+    """Ejecuta funcion(indice, *args) en HILOS hilos y espera a que terminen"""
+    barrera = threading.Barrier(HILOS)
+
+    def envoltura(indice):
+        barrera.wait()
+        try:
+            funcion(indice, *args)
+        except Exception as error:
+            # * Cualquier excepción dentro de un hilo es un fallo de la prueba
+            errores.append(repr(error))
+
+    hilos = [threading.Thread(target=envoltura, args=(i,)) for i in range(HILOS)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+
+def comprobar(condicion, mensaje):
+    print(f"  {'✅' if condicion else '❌'} {mensaje}")
+    if not condicion:
+        errores.append(mensaje)
+
+
+def comprobar_totales(estado):
+    items = estado.items_carrito()
+    total = sum(centimos(i["precio"]) * i["cantidad"] for i in items)
+    ahorro = sum((centimos(i["precio_original"]) - centimos(i["precio"])) * i["cantidad"] for i in items)
+    _, total_mantenido, ahorro_mantenido = estado.resumen_carrito()
+    comprobar(centimos(total_mantenido) == total and centimos(ahorro_mantenido) == ahorro,
+              "Total y ahorro mantenidos coinciden con los items")
+
+
+def prueba_incrementos():
+    """Todos los hilos añaden el mismo juego en la misma sesión"""
+    print("1) Incrementos concurrentes en una misma sesión")
+    cookie = nueva_sesion()
+    id_juego = catalogo_juegos[1]["id"]
+
+    def trabajo(indice):
+        cliente = cliente_con_sesion(cookie)
+        for _ in range(OPERACIONES):
+            respuesta = cliente.post('/api/carrito/agregar', json={"id": id_juego})
+            if respuesta.status_code != 200:
+                errores.append(f"agregar → {respuesta.status_code}")
+
+    en_hilos(trabajo)
+    estado = usuarios.obtener(_id_sesion(cookie))
+    cantidad = estado.carrito[id_juego]["cantidad"]
+    comprobar(cantidad == HILOS * OPERACIONES, f"Cantidad final {cantidad} == {HILOS * OPERACIONES}")
+    comprobar_totales(estado)
+
+
+def prueba_compras():
+    """Altas, bajas y compras mezcladas en una misma sesión; el dinero debe cuadrar"""
+    print("2) Altas, bajas y compras concurrentes")
+    cookie = nueva_sesion()
+    estado = usuarios.obtener(_id_sesion(cookie))
+    movimientos = Counter()
+    lock = threading.Lock()
+
+    def trabajo(indice):
+        cliente = cliente_con_sesion(cookie)
+        aleatorio = random.Random(indice)
+        for _ in range(OPERACIONES):
+            juego = aleatorio.choice(catalogo_juegos)
+            operacion = aleatorio.random()
+            if operacion < 0.7:
+                respuesta = cliente.post('/api/carrito/agregar', json={"id": juego["id"]})
+                if respuesta.status_code == 200:
+                    with lock:
+                        movimientos["añadido"] += centimos(juego["precio"])
+            elif operacion < 0.85:
+                # * La baja se hace con el método del estado para saber exactamente qué se quitó
+                item = estado.eliminar_del_carrito(juego["id"])
+                if item is not None:
+                    with lock:
+                        movimientos["eliminado"] += centimos(item["precio"]) * item["cantidad"]
+            else:
+                respuesta = cliente.post('/api/carrito/comprar')
+                if respuesta.status_code == 200:
+                    with lock:
+                        movimientos["pagado"] += centimos(respuesta.get_json()["total_pagado"])
+                elif respuesta.status_code != 400:
+                    errores.append(f"comprar → {respuesta.status_code}")
+
+    en_hilos(trabajo)
+    _, total_final, _ = estado.resumen_carrito()
+    cuadra = movimientos["añadido"] == movimientos["pagado"] + movimientos["eliminado"] + centimos(total_final)
+    comprobar(cuadra, "Añadido == pagado + eliminado + carrito final")
+    comprobar_totales(estado)
+    compradas = estado.items_biblioteca()
+    comprobar(len(compradas) == len({j["id"] for j in compradas}), "La biblioteca no tiene duplicados")
+
+
+def prueba_ids():
+    """Sesiones distintas y reseñas en paralelo: los IDs generados no se repiten"""
+    print("3) IDs únicos de carrito y de reseña")
+    antes = len(reviews)
+    reseñas_antes = {j["id"]: j["num_reviews"] for j in catalogo_juegos}
+
+    def trabajo(indice):
+        cliente = app.test_client()
+        for juego in catalogo_juegos:
+            cliente.post('/api/carrito/agregar', json={"id": juego["id"]})
+            cliente.post('/api/review', json={"juego_id": juego["id"], "valoracion": 4})
+
+    en_hilos(trabajo)
+    ids_carrito = [item["carrito_id"] for estado in usuarios.estados() for item in estado.items_carrito()]
+    comprobar(len(ids_carrito) == len(set(ids_carrito)), f"{len(ids_carrito)} IDs de carrito distintos")
+    nuevas = len(reviews) - antes
+    comprobar(nuevas == HILOS * len(catalogo_juegos), f"{nuevas} reseñas guardadas")
+    ids_review = [r["id"] for j in catalogo_juegos for r in reviews.pagina(j["id"], 1, reviews.total(j["id"]))]
+    comprobar(len(ids_review) == len(set(ids_review)), "IDs de reseña distintos")
+    comprobar(all(j["num_reviews"] == reseñas_antes[j["id"]] + HILOS for j in catalogo_juegos),
+              "num_reviews de cada juego sube una vez por reseña")
+
+
+def prueba_lotes():
+    """Lotes con los mismos juegos desde todos los hilos mientras otro hilo mira el carrito"""
+    print("4) Lotes de carrito atómicos")
+    cookie = nueva_sesion()
+    estado = usuarios.obtener(_id_sesion(cookie))
+    lote = [{"id": j["id"], "cantidad": 1} for j in catalogo_juegos[:10]]
+    terminado = threading.Event()
+    vistas_a_medias = []
+
+    def observar():
+        while not terminado.is_set():
+            with estado.lock:
+                cantidades = {item["cantidad"] for item in estado.carrito.values()}
+            if len(cantidades) > 1:
+                vistas_a_medias.append(cantidades)
+
+    def trabajo(indice):
+        cliente = cliente_con_sesion(cookie)
+        for _ in range(OPERACIONES):
+            respuesta = cliente.post('/api/carrito/lote', json={"agregar": lote})
+            if respuesta.status_code != 200:
+                errores.append(f"lote → {respuesta.status_code}")
+
+    observador = threading.Thread(target=observar)
+    observador.start()
+    en_hilos(trabajo)
+    terminado.set()
+    observador.join()
+    comprobar(not vistas_a_medias, "Ningún lote se vio a medias")
+    cantidades = [item["cantidad"] for item in estado.items_carrito()]
+    comprobar(cantidades == [HILOS * OPERACIONES] * len(lote), f"Cada juego del lote con cantidad {HILOS * OPERACIONES}")
+    comprobar_totales(estado)
+
+
+def _id_sesion(cookie):
+    """Identificador de usuario guardado en la cookie de sesión firmada"""
+    serializador = app.session_interface.get_signing_serializer(app)
+    return serializador.loads(cookie)["usuario"]
+
+
+def main():
+    # * Cambios de hilo muy frecuentes para provocar entrelazados
+    sys.setswitchinterval(1e-6)
+    print(f"🧵 {HILOS} hilos × {OPERACIONES} operaciones")
+    prueba_incrementos()
+    prueba_compras()
+    prueba_ids()
+    prueba_lotes()
+    if errores:
+        print(f"\n❌ {len(errores)} fallo(s): {errores[:5]}")
+        sys.exit(1)
+    print("\n✅ Todos los invariantes se cumplen")
+
+
+if __name__ == '__main__':
+    main()
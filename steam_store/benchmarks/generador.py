@@ -0,0 +1,115 @@
+# =========================================================================================
+#  🏭 GENERADOR DE CATÁLOGOS SINTÉTICOS
+#  Uso: python benchmarks/generador.py 100000 --salida juegos.jsonl [--semilla 0]
+#
+#  Categorías, etiquetas, precios, descuentos, valoraciones y fechas se sacan de las
+#  distribuciones del catálogo de ejemplo (elegir al azar de la lista de valores reales
+#  conserva sus frecuencias). Textos, imágenes y requisitos se copian de una plantilla.
+# =========================================================================================
+
+import json
+import random
+import statistics
+import sys
+from collections import Counter
+from datetime import date
+
+import comun  # noqa: F401 (añade steam_store al path)
+
+
+class GeneradorCatalogo:
+    """Juegos sintéticos con las mismas distribuciones que un catálogo base"""
+
+    def __init__(self, base, semilla=0):
+        self._aleatorio = random.Random(semilla)
+        self._base = base
+        etiquetas = Counter(e for j in base for e in j["etiquetas"])
+        self._etiquetas = list(etiquetas)
+        self._pesos_etiquetas = list(etiquetas.values())
+        self._num_etiquetas = [len(j["etiquetas"]) for j in base]
+        self._categorias = [j["categoria"] for j in base]
+        self._precios = [j["precio_original"] for j in base]
+        self._descuentos = [j["descuento"] for j in base]
+        self._reviews = [j["num_reviews"] for j in base]
+        self._logros = [j["logros"] for j in base]
+        self._palabras = [p for j in base for p in j["nombre"].split() if p.isalpha()]
+        self._valoracion = (statistics.mean(j["valoracion"] for j in base), statistics.pstdev(j["valoracion"] for j in base))
+        self._positivas = (statistics.mean(j["positivas"] for j in base), statistics.pstdev(j["positivas"] for j in base))
+        self._destacados = sum(1 for j in base if j.get("destacado")) / len(base)
+        fechas = [date.fromisoformat(j["fecha_lanzamiento"]).toordinal() for j in base]
+        self._fechas = (min(fechas), max(fechas))
+
+    def _etiquetas_al_azar(self):
+        cuantas = min(self._aleatorio.choice(self._num_etiquetas), len(self._etiquetas))
+        elegidas = []
+        while len(elegidas) < cuantas:
+            etiqueta = self._aleatorio.choices(self._etiquetas, self._pesos_etiquetas)[0]
+            if etiqueta not in elegidas:
+                elegidas.append(etiqueta)
+        return elegidas
+
+    def juego(self, id_juego, estudios):
+        aleatorio = self._aleatorio
+        juego = dict(aleatorio.choice(self._base))
+        precio_original = aleatorio.choice(self._precios)
+        descuento = aleatorio.choice(self._descuentos) if precio_original else 0
+        juego.update({
+            "id": id_juego,
+            "nombre": f"{' '.join(aleatorio.sample(self._palabras, 2))} {id_juego}",
+            "categoria": aleatorio.choice(self._categorias),
+            "etiquetas": self._etiquetas_al_azar(),
+            "desarrollador": f"Estudio {aleatorio.randrange(estudios)}",
+            "precio_original": precio_original,
+            "descuento": descuento,
+            "precio": round(precio_original * (100 - descuento) / 100, 2),
+            "valoracion": round(min(max(aleatorio.gauss(*self._valoracion), 1.0), 5.0), 1),
+            "positivas": round(min(max(aleatorio.gauss(*self._positivas), 0), 100)),
+            # * Pocos juegos muy populares y muchos con pocas reseñas
+            "num_reviews": int(aleatorio.choice(self._reviews) * aleatorio.random() ** 4),
+            "logros": aleatorio.choice(self._logros),
+            "fecha_lanzamiento": date.fromordinal(aleatorio.randint(*self._fechas)).isoformat(),
+            "destacado": aleatorio.random() < self._destacados
+        })
+        return juego
+
+    def generar(self, n):
+        """Generador de n juegos con IDs 1..n"""
+        # * Un estudio por cada ~20 juegos: los vecinos por desarrollador siguen siendo pocos
+        estudios = max(n // 20, 1)
+        for id_juego in range(1, n + 1):
+            yield self.juego(id_juego, estudios)
+
+
+def generar_catalogo(n, base, semilla=0):
+    return list(GeneradorCatalogo(base, semilla).generar(n))
+
+
+def escribir_jsonl(juegos, ruta):
+    """Escribe los juegos en JSON Lines (acepta un generador: no hace falta tenerlos todos)"""
+    with open(ruta, "w", encoding="utf-8") as fichero:
+        for juego in juegos:
+            fichero.write(json.dumps(juego, ensure_ascii=False))
+            fichero.write("\n")
+
+
+def main():
+    import argparse
+
+    from app import catalogo_juegos
+
+    parser = argparse.ArgumentParser(description="Genera un catálogo sintético en JSON Lines")
+    parser.add_argument("n", type=int)
+    parser.add_argument("--salida", default="-", help="Fichero .jsonl (por defecto, salida estándar)")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    juegos = GeneradorCatalogo(catalogo_juegos, args.semilla).generar(args.n)
+    if args.salida == "-":
+        for juego in juegos:
+            sys.stdout.write(json.dumps(juego, ensure_ascii=False) + "\n")
+    else:
+        escribir_jsonl(juegos, args.salida)
+
+
+if __name__ == '__main__':
+    main()
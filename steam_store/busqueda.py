@@ -0,0 +1,175 @@
+# =========================================================================================
+#  🔍 BÚSQUEDA - Índice invertido sobre nombres y etiquetas
+#  ────────────────────────────────────────────────────────────────────────────────────────
+#  * Cada palabra (token) apunta al conjunto de IDs de juegos que la contienen
+#  * El vocabulario se mantiene ordenado para buscar por prefijo con bisect
+#  * El coste de una búsqueda depende de los resultados, no del tamaño del catálogo
+#  * Tolerancia a erratas: cada token del vocabulario se indexa por sus trigramas y una
+#    palabra sin coincidencias se sustituye por los tokens más parecidos ("witchr" → "witcher")
+# =========================================================================================
+
+import re
+from bisect import bisect_left, insort
+from collections import Counter
+
+from catalogo import IndiceCatalogo
+
+PATRON_TOKEN = re.compile(r"\w+")
+
+
+def tokenizar(texto):
+    """Divide un texto en palabras en minúsculas"""
+    return PATRON_TOKEN.findall(texto.lower())
+
+
+def tokens_juego(juego):
+    """Conjunto de tokens indexados de un juego (nombre + etiquetas)"""
+    tokens = set(tokenizar(juego["nombre"]))
+    for etiqueta in juego["etiquetas"]:
+        tokens.update(tokenizar(etiqueta))
+    return tokens
+
+
+def trigramas(token):
+    """Trigramas de un token con relleno (las palabras cortas y los bordes también cuentan)"""
+    relleno = f"  {token} "
+    return {relleno[i:i + 3] for i in range(len(relleno) - 2)}
+
+
+class IndiceTrigramas:
+    """Trigrama → tokens del vocabulario que lo contienen, para buscar tokens parecidos"""
+
+    # * Similitud mínima (coeficiente de Dice de trigramas) para aceptar un token como errata de otro
+    UMBRAL = 0.4
+    # * Corte de candidatos: trigramas demasiado comunes no se recorren y solo se puntúan
+    #   los tokens que más trigramas comparten (latencia acotada con vocabularios grandes)
+    MAX_POSTING = 5_000
+    MAX_CANDIDATOS = 200
+
+    def __init__(self):
+        self._postings = {}
+        self._tamanos = {}
+
+    def agregar(self, token):
+        gramas = trigramas(token)
+        self._tamanos[token] = len(gramas)
+        for grama in gramas:
+            self._postings.setdefault(grama, set()).add(token)
+
+    def eliminar(self, token):
+        for grama in trigramas(token):
+            tokens = self._postings.get(grama)
+            if tokens is not None:
+                tokens.discard(token)
+                if not tokens:
+                    del self._postings[grama]
+        self._tamanos.pop(token, None)
+
+    def parecidos(self, palabra, limite=10):
+        """[(similitud, token)] de los tokens más parecidos a `palabra`, de más a menos"""
+        gramas = trigramas(palabra)
+        compartidos = Counter()
+        for grama in gramas:
+            tokens = self._postings.get(grama, ())
+            if len(tokens) <= self.MAX_POSTING:
+                compartidos.update(tokens)
+        # * Dice = 2c / (|a| + |b|) <= 2c / (|a| + c): con menos trigramas comunes no llega al umbral
+        minimo = self.UMBRAL * len(gramas) / (2 - self.UMBRAL)
+        resultado = []
+        for token, comunes in compartidos.most_common(self.MAX_CANDIDATOS):
+            if comunes < minimo:
+                break
+            similitud = 2 * comunes / (len(gramas) + self._tamanos[token])
+            if similitud >= self.UMBRAL:
+                resultado.append((similitud, token))
+        resultado.sort(key=lambda par: (-par[0], par[1]))
+        return resultado[:limite]
+
+
+class IndiceTexto(IndiceCatalogo):
+    """Índice invertido token → IDs con búsqueda por prefijo"""
+
+    CAMPOS = {"nombre", "etiquetas"}
+
+    def __init__(self):
+        self._postings = {}
+        self._vocabulario = []
+        self._trigramas = IndiceTrigramas()
+
+    def al_agregar(self, juego):
+        for token in tokens_juego(juego):
+            ids = self._postings.get(token)
+            if ids is None:
+                ids = self._postings[token] = set()
+                insort(self._vocabulario, token)
+                self._trigramas.agregar(token)
+            ids.add(juego["id"])
+
+    def al_eliminar(self, juego):
+        for token in tokens_juego(juego):
+            ids = self._postings.get(token)
+            if ids is None:
+                continue
+            ids.discard(juego["id"])
+            if not ids:
+                del self._postings[token]
+                del self._vocabulario[bisect_left(self._vocabulario, token)]
+                self._trigramas.eliminar(token)
+
+    def al_actualizar(self, anterior, juego, campos):
+        # * Solo se reindexa si cambia algún campo de texto
+        if campos & self.CAMPOS:
+            super().al_actualizar(anterior, juego, campos)
+
+    def ids_con_prefijo(self, prefijo):
+        """Unión de los IDs de todos los tokens que empiezan por `prefijo`"""
+        ids = set()
+        i = bisect_left(self._vocabulario, prefijo)
+        while i < len(self._vocabulario) and self._vocabulario[i].startswith(prefijo):
+            ids |= self._postings[self._vocabulario[i]]
+            i += 1
+        return ids
+
+    def buscar(self, query):
+        """IDs de los juegos en los que cada palabra de la consulta es prefijo de algún token"""
+        prefijos = tokenizar(query)
+        if not prefijos:
+            return set()
+        # * Se intersecta empezando por el conjunto más pequeño
+        conjuntos = sorted((self.ids_con_prefijo(p) for p in set(prefijos)), key=len)
+        resultado = conjuntos[0]
+        for ids in conjuntos[1:]:
+            if not resultado:
+                break
+            resultado = resultado & ids
+        return resultado
+
+    def tokens_parecidos(self, palabra, limite=10):
+        """[(similitud, token)] del vocabulario parecidos a una palabra (posibles erratas)"""
+        return self._trigramas.parecidos(palabra, limite)
+
+    def buscar_aproximado(self, query):
+        """id → puntuación (0-1] de los juegos que encajan con todas las palabras admitiendo erratas.
+        Una palabra que es prefijo de algún token puntúa 1; si no, puntúa la similitud del token
+        más parecido que tenga el juego. La puntuación del juego es la media de sus palabras."""
+        palabras = set(tokenizar(query))
+        if not palabras:
+            return {}
+        puntuaciones = None
+        for palabra in palabras:
+            ids = self.ids_con_prefijo(palabra)
+            if ids:
+                por_juego = dict.fromkeys(ids, 1.0)
+            else:
+                por_juego = {}
+                for similitud, token in self.tokens_parecidos(palabra):
+                    for id_juego in tuple(self._postings.get(token, ())):
+                        if similitud > por_juego.get(id_juego, 0.0):
+                            por_juego[id_juego] = similitud
+            if puntuaciones is None:
+                puntuaciones = por_juego
+            else:
+                puntuaciones = {i: p + por_juego[i] for i, p in puntuaciones.items() if i in por_juego}
+            if not puntuaciones:
+                return {}
+        return {i: p / len(palabras) for i, p in puntuaciones.items()}
@@ -0,0 +1,172 @@
+# =========================================================================================
+#  ⚡ CACHÉS - Resultados precalculados que se invalidan con los cambios del catálogo
+# =========================================================================================
+
+import threading
+from collections import OrderedDict
+
+from catalogo import IndiceCatalogo
+
+
+class CacheFragmentosJSON(IndiceCatalogo):
+    """JSON ya codificado (bytes) de cada juego; se invalida al modificar o eliminar el juego"""
+
+    def __init__(self, catalogo, codificar):
+        # * codificar: función objeto → str (p. ej. app.json.dumps compacto para respetar la config de Flask)
+        self._catalogo = catalogo
+        self._codificar = codificar
+        # * id → (versión, bytes)
+        self._fragmentos = {}
+        self.aciertos = 0
+        self.fallos = 0
+
+    def construir(self, juegos):
+        self._fragmentos.clear()
+
+    def al_eliminar(self, juego):
+        self._fragmentos.pop(juego["id"], None)
+
+    def al_actualizar(self, anterior, juego, campos):
+        self._fragmentos.pop(juego["id"], None)
+
+    def juego(self, juego):
+        """Fragmento JSON de un juego (se codifica solo la primera vez para cada versión del juego)"""
+        # * La versión se lee antes de codificar: si el juego cambia entre medias no se guardan bytes viejos
+        version = self._catalogo.version_juego(juego["id"])
+        guardado = self._fragmentos.get(juego["id"])
+        if guardado is not None and guardado[0] == version:
+            self.aciertos += 1
+            return guardado[1]
+        self.fallos += 1
+        fragmento = self._codificar(juego).encode()
+        if version is not None:
+            self._fragmentos[juego["id"]] = (version, fragmento)
+        return fragmento
+
+    def lista(self, juegos):
+        """Array JSON concatenando los fragmentos de cada juego"""
+        return b"[" + b",".join(self.juego(j) for j in juegos) + b"]"
+
+    def estadisticas(self):
+        return {"aciertos": self.aciertos, "fallos": self.fallos, "entradas": len(self._fragmentos)}
+
+
+class CacheTarjetasHTML(IndiceCatalogo):
+    """HTML ya renderizado de las tarjetas de cada juego, con clave (estilo, id, versión)"""
+
+    def __init__(self, catalogo, renderizar):
+        # * renderizar: función (estilo, juego) → str con el HTML de la tarjeta
+        self._catalogo = catalogo
+        self._renderizar = renderizar
+        # * id → {estilo: (versión, html)}: una baja o edición descarta todas sus tarjetas de golpe
+        self._tarjetas = {}
+        self.aciertos = 0
+        self.fallos = 0
+
+    def construir(self, juegos):
+        self._tarjetas.clear()
+
+    def al_eliminar(self, juego):
+        self._tarjetas.pop(juego["id"], None)
+
+    def al_actualizar(self, anterior, juego, campos):
+        self._tarjetas.pop(juego["id"], None)
+
+    def tarjeta(self, estilo, juego):
+        """HTML de la tarjeta (se renderiza solo la primera vez para cada versión del juego)"""
+        # * La versión se lee antes de renderizar: si el juego cambia entre medias no se guarda HTML viejo
+        version = self._catalogo.version_juego(juego["id"])
+        por_estilo = self._tarjetas.get(juego["id"])
+        guardada = por_estilo.get(estilo) if por_estilo else None
+        if guardada is not None and guardada[0] == version:
+            self.aciertos += 1
+            return guardada[1]
+        self.fallos += 1
+        html = self._renderizar(estilo, juego)
+        # * Un juego que ya no está en el catálogo (p. ej. en una wishlist antigua) no se cachea
+        if version is not None:
+            self._tarjetas.setdefault(juego["id"], {})[estilo] = (version, html)
+        return html
+
+    def estadisticas(self):
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "entradas": sum(len(t) for t in self._tarjetas.values())
+        }
+
+
+class CacheConsultasLRU:
+    """Resultados de consultas (p. ej. IDs ordenados de un filtro) con tamaño acotado (LRU).
+    Todas las entradas dependen del catálogo completo: cualquier cambio de versión las invalida.
+    max_elementos acota además la suma de len() de los resultados guardados: una entrada puede
+    tener todo el catálogo, así que el número de entradas solo no limita la memoria."""
+
+    def __init__(self, catalogo, capacidad=256, max_elementos=None):
+        self._catalogo = catalogo
+        self.capacidad = capacidad
+        self.max_elementos = max_elementos
+        self._entradas = OrderedDict()
+        self._elementos = 0
+        self._version = catalogo.version
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.invalidaciones = 0
+
+    def _comprobar_version(self, version):
+        if version != self._version:
+            if self._entradas:
+                self.invalidaciones += 1
+                self._entradas.clear()
+                self._elementos = 0
+            self._version = version
+
+    def _peso(self, resultado):
+        return len(resultado) if self.max_elementos is not None else 0
+
+    def _excede(self, elementos):
+        return self.max_elementos is not None and elementos > self.max_elementos
+
+    def obtener(self, clave, calcular):
+        """Resultado guardado para `clave` o calcular() si no está (o el catálogo ha cambiado)"""
+        version = self._catalogo.version
+        with self._lock:
+            self._comprobar_version(version)
+            resultado = self._entradas.get(clave)
+            if resultado is not None:
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return resultado
+            self.fallos += 1
+        # * Se calcula fuera del lock: dos fallos simultáneos de la misma clave calculan lo mismo
+        resultado = calcular()
+        with self._lock:
+            # * Si el catálogo cambió mientras se calculaba, el resultado puede estar viejo: no se guarda.
+            #   Tampoco uno que por sí solo pasa de max_elementos (desalojaría todo lo demás)
+            if self._catalogo.version == version == self._version and not self._excede(self._peso(resultado)):
+                anterior = self._entradas.pop(clave, None)
+                if anterior is not None:
+                    self._elementos -= self._peso(anterior)
+                self._entradas[clave] = resultado
+                self._elementos += self._peso(resultado)
+                while len(self._entradas) > self.capacidad or self._excede(self._elementos):
+                    _, desalojado = self._entradas.popitem(last=False)
+                    self._elementos -= self._peso(desalojado)
+                    self.desalojos += 1
+        return resultado
+
+    def estadisticas(self):
+        consultas = self.aciertos + self.fallos
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "ratio_aciertos": round(self.aciertos / consultas, 3) if consultas else 0.0,
+            "desalojos": self.desalojos,
+            "invalidaciones": self.invalidaciones,
+            "entradas": len(self._entradas),
+            "capacidad": self.capacidad,
+            "elementos": self._elementos,
+            "max_elementos": self.max_elementos
+        }
@@ -0,0 +1,194 @@
+# =========================================================================================
+#  📦 CATÁLOGO INDEXADO - Almacén de juegos con índice hash por ID
+#  ────────────────────────────────────────────────────────────────────────────────────────
+#  * La lista original `catalogo_juegos` sigue siendo la fuente de datos (orden del catálogo)
+#  * Un diccionario id → juego permite búsquedas O(1) en lugar de recorrer la lista
+#  * Los índices registrados se mantienen sincronizados en cada alta, edición o baja
+# =========================================================================================
+
+import threading
+from itertools import count
+
+# * Esquema de un juego del catálogo: campo → tipo(s) esperado(s)
+ESQUEMA_JUEGO = {
+    "id": int,
+    "nombre": str,
+    "descripcion": str,
+    "descripcion_corta": str,
+    "precio": (int, float),
+    "precio_original": (int, float),
+    "descuento": int,
+    "categoria": str,
+    "desarrollador": str,
+    "editor": str,
+    "fecha_lanzamiento": str,
+    "imagen": str,
+    "capturas": list,
+    "video": str,
+    "etiquetas": list,
+    "requisitos_minimos": dict,
+    "requisitos_recomendados": dict,
+    "valoracion": (int, float),
+    "num_reviews": int,
+    "positivas": int,
+    "plataformas": list,
+    "idiomas": list,
+    "multijugador": bool,
+    "logros": int,
+    "destacado": bool
+}
+
+
+class IndiceCatalogo:
+    """Base para índices que se actualizan con cada cambio del catálogo"""
+
+    def construir(self, juegos):
+        """Construcción inicial recorriendo todo el catálogo una sola vez"""
+        for juego in juegos:
+            self.al_agregar(juego)
+
+    def al_agregar(self, juego):
+        pass
+
+    def al_eliminar(self, juego):
+        pass
+
+    def al_actualizar(self, anterior, juego, campos):
+        """Por defecto una edición equivale a baja del estado anterior + alta del nuevo"""
+        self.al_eliminar(anterior)
+        self.al_agregar(juego)
+
+
+class CatalogoJuegos:
+    """Catálogo de juegos con índice hash id → juego"""
+
+    def __init__(self, juegos=None, compactar=None):
+        # * Se reutiliza la misma lista para que el código existente vea los cambios
+        self.juegos = juegos if juegos is not None else []
+        # * compactar: función juego → registro con el que se guarda (p. ej. registros.compactar)
+        self._compactar = compactar
+        if compactar is not None:
+            self.juegos[:] = map(compactar, self.juegos)
+        self._por_id = {}
+        self._indices = []
+        # * Posición de alta de cada juego: conserva el orden del catálogo sin recorrer la lista
+        self._secuencia = count()
+        self._posiciones = {}
+        # * Versión global del catálogo y versión de cada juego (para ETags y cachés)
+        self.version = 0
+        self._versiones = {}
+        # * Las modificaciones se serializan: índices y versiones cambian siempre juntos
+        self.lock = threading.RLock()
+        for juego in self.juegos:
+            if juego["id"] in self._por_id:
+                raise ValueError(f"ID de juego duplicado: {juego['id']}")
+            self._por_id[juego["id"]] = juego
+            self._posiciones[juego["id"]] = next(self._secuencia)
+            self._versiones[juego["id"]] = 0
+
+    def __len__(self):
+        return len(self._por_id)
+
+    def __iter__(self):
+        return iter(self.juegos)
+
+    def __contains__(self, id_juego):
+        return id_juego in self._por_id
+
+    def registrar_indice(self, indice):
+        """Registra un índice y lo construye con el contenido actual"""
+        with self.lock:
+            indice.construir(self.juegos)
+            self._indices.append(indice)
+        return indice
+
+    def obtener(self, id_juego):
+        """Búsqueda O(1) por ID"""
+        return self._por_id.get(id_juego)
+
+    def posicion(self, id_juego):
+        """Posición de alta del juego (sirve para respetar el orden del catálogo)"""
+        return self._posiciones[id_juego]
+
+    def version_juego(self, id_juego):
+        """Versión del juego: cambia cada vez que se modifica (None si no existe)"""
+        return self._versiones.get(id_juego)
+
+    def _nueva_version(self, id_juego):
+        self.version += 1
+        self._versiones[id_juego] = self.version
+
+    def juegos_en_orden(self, ids):
+        """Materializa un conjunto de IDs como lista de juegos en orden de catálogo"""
+        return [self._por_id[i] for i in sorted(ids, key=self._posiciones.__getitem__)]
+
+    def recorrer_en_orden(self, ids):
+        """Iterador de los juegos de un conjunto de IDs en orden de catálogo.
+        Con muchos IDs recorre el catálogo con la máscara en lugar de ordenar una lista de ellos."""
+        if len(ids) * 8 < len(self._por_id):
+            return iter(self.juegos_en_orden(ids))
+        return (j for j in self.juegos if j["id"] in ids)
+
+    def agregar(self, juego):
+        """Alta de un juego nuevo"""
+        with self.lock:
+            return self._agregar(juego)
+
+    def _agregar(self, juego):
+        if juego["id"] in self._por_id:
+            raise ValueError(f"Ya existe un juego con ID {juego['id']}")
+        if self._compactar is not None:
+            juego = self._compactar(juego)
+        self.juegos.append(juego)
+        self._por_id[juego["id"]] = juego
+        self._posiciones[juego["id"]] = next(self._secuencia)
+        self._nueva_version(juego["id"])
+        for indice in self._indices:
+            indice.al_agregar(juego)
+        return juego
+
+    def actualizar(self, id_juego, cambios):
+        """Edición parcial de un juego; devuelve el juego actualizado"""
+        with self.lock:
+            return self._actualizar(id_juego, cambios)
+
+    def _actualizar(self, id_juego, cambios):
+        juego = self._por_id.get(id_juego)
+        if juego is None:
+            raise KeyError(id_juego)
+        if cambios.get("id", id_juego) != id_juego:
+            raise ValueError("No se puede cambiar el ID de un juego")
+        # * Se compara después de aplicar los cambios: un registro compacto puede guardarlos
+        #   con otro tipo (una lista como tupla) y no deben contar como cambio
+        anterior = dict(juego)
+        # * update aplica todos los campos o ninguno (un registro compacto rechaza los que no
+        #   están en el esquema antes de escribir): si falla, ni índices ni versión cambian
+        juego.update(cambios)
+        campos = {c for c in cambios if anterior.get(c) != juego.get(c)}
+        if not campos:
+            return juego
+        self._nueva_version(id_juego)
+        for indice in self._indices:
+            indice.al_actualizar(anterior, juego, campos)
+        return juego
+
+    def eliminar(self, id_juego):
+        """Baja de un juego; devuelve el juego eliminado o None"""
+        with self.lock:
+            return self._eliminar(id_juego)
+
+    def _eliminar(self, id_juego):
+        juego = self._por_id.pop(id_juego, None)
+        if juego is None:
+            return None
+        # * Se compara por identidad para no comparar diccionarios completos
+        for i, j in enumerate(self.juegos):
+            if j is juego:
+                del self.juegos[i]
+                break
+        for indice in self._indices:
+            indice.al_eliminar(juego)
+        del self._posiciones[id_juego]
+        del self._versiones[id_juego]
+        self.version += 1
+        return juego
@@ -0,0 +1,177 @@
+# =========================================================================================
+#  🧮 COLUMNAS NUMÉRICAS - Espejo del catálogo en arrays de NumPy (opcional)
+#  ────────────────────────────────────────────────────────────────────────────────────────
+#  * Un array por campo numérico; la fila i es el juego en la posición i del catálogo
+#    (la misma numeración que los bitsets de FiltroFacetas, así se combinan con un AND)
+#  * Filtros por rango, conteos, medias e histogramas con operaciones vectorizadas
+#  * Las bajas solo desmarcan la fila en `activo`; los arrays crecen al doble cuando se llenan
+#  * Si NumPy no está instalado, DISPONIBLE es False y la app usa sus índices de siempre;
+#    EstadisticasTienda mantiene los mismos agregados al vuelo (misma respuesta)
+# =========================================================================================
+
+from catalogo import IndiceCatalogo
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DISPONIBLE = np is not None
+
+# * campo → tipo de la columna
+COLUMNAS = {
+    "precio": "float64",
+    "precio_original": "float64",
+    "descuento": "int64",
+    "valoracion": "float64",
+    "num_reviews": "int64",
+    "positivas": "int64",
+    "logros": "int64",
+    "fecha_lanzamiento": "datetime64[D]"
+}
+
+# * Bordes de los histogramas del resumen (el último intervalo incluye su borde derecho)
+BORDES_PRECIO = [0, 0.01, 10, 20, 40, 60, float("inf")]
+BORDES_VALORACION = [1, 2, 3, 4, 5]
+
+
+def _fecha(texto):
+    """Fecha ISO como datetime64 (NaT si no se puede leer)"""
+    try:
+        return np.datetime64(texto, "D")
+    except (TypeError, ValueError):
+        return np.datetime64("NaT")
+
+
+class ColumnasCatalogo(IndiceCatalogo):
+    """Columnas numéricas del catálogo para filtros y agregados vectorizados"""
+
+    CAMPOS = set(COLUMNAS)
+    CAPACIDAD_INICIAL = 1024
+
+    def __init__(self, catalogo):
+        if not DISPONIBLE:
+            raise RuntimeError("ColumnasCatalogo necesita NumPy (pip install numpy)")
+        self._catalogo = catalogo
+        self._columnas = {}
+        self._activo = np.zeros(0, dtype=bool)
+
+    def _valor(self, campo, juego):
+        return _fecha(juego[campo]) if campo == "fecha_lanzamiento" else juego[campo]
+
+    def construir(self, juegos):
+        # * Una pasada por campo y cada array se crea de una vez
+        posiciones = np.fromiter((self._catalogo.posicion(j["id"]) for j in juegos), dtype=np.int64, count=len(juegos))
+        capacidad = max(self.CAPACIDAD_INICIAL, int(posiciones.max()) + 1 if len(posiciones) else 0)
+        self._activo = np.zeros(capacidad, dtype=bool)
+        self._activo[posiciones] = True
+        self._columnas = {}
+        for campo, tipo in COLUMNAS.items():
+            columna = np.zeros(capacidad, dtype=tipo)
+            if campo == "fecha_lanzamiento":
+                columna[:] = np.datetime64("NaT")
+            columna[posiciones] = np.array([self._valor(campo, j) for j in juegos], dtype=tipo)
+            self._columnas[campo] = columna
+
+    def _asegurar_capacidad(self, posicion):
+        capacidad = len(self._activo)
+        if posicion < capacidad:
+            return
+        nueva = max(capacidad * 2, posicion + 1, self.CAPACIDAD_INICIAL)
+        activo = np.zeros(nueva, dtype=bool)
+        activo[:capacidad] = self._activo
+        columnas = {}
+        for campo, columna in self._columnas.items():
+            ampliada = np.zeros(nueva, dtype=columna.dtype)
+            if campo == "fecha_lanzamiento":
+                ampliada[:] = np.datetime64("NaT")
+            ampliada[:capacidad] = columna
+            columnas[campo] = ampliada
+        # * Se sustituyen de golpe (primero las columnas): una consulta lee `activo` antes que las
+        #   columnas, así nunca ve una máscara más larga que ellas
+        self._columnas = columnas
+        self._activo = activo
+
+    def _escribir(self, juego):
+        posicion = self._catalogo.posicion(juego["id"])
+        self._asegurar_capacidad(posicion)
+        for campo, columna in self._columnas.items():
+            columna[posicion] = self._valor(campo, juego)
+        return posicion
+
+    def al_agregar(self, juego):
+        posicion = self._escribir(juego)
+        self._activo[posicion] = True
+
+    def al_eliminar(self, juego):
+        self._activo[self._catalogo.posicion(juego["id"])] = False
+
+    def al_actualizar(self, anterior, juego, campos):
+        if campos & self.CAMPOS:
+            self._escribir(juego)
+
+    def columna(self, campo):
+        return self._columnas[campo]
+
+    def mascara(self, rangos=None):
+        """Máscara de los juegos con min <= campo <= max para cada {campo: (min, max)}.
+        None en un extremo deja ese lado abierto; las fechas admiten texto ISO."""
+        mascara = self._activo.copy()
+        columnas = self._columnas
+        for campo, (minimo, maximo) in (rangos or {}).items():
+            columna = columnas[campo][:len(mascara)]
+            if campo == "fecha_lanzamiento":
+                minimo = None if minimo is None else _fecha(minimo)
+                maximo = None if maximo is None else _fecha(maximo)
+            if minimo is not None:
+                mascara &= columna >= minimo
+            if maximo is not None:
+                mascara &= columna <= maximo
+        return mascara
+
+    @staticmethod
+    def bits(mascara):
+        """Bitset (int) de una máscara: el bit i es la fila i, como en FiltroFacetas"""
+        return int.from_bytes(np.packbits(mascara, bitorder="little").tobytes(), "little")
+
+    def filtrar(self, rangos):
+        """Bitset de los juegos dentro de los rangos (para combinar con las facetas)"""
+        return self.bits(self.mascara(rangos))
+
+    def _valores(self, campo, rangos):
+        mascara = self.mascara(rangos)
+        return self._columnas[campo][:len(mascara)][mascara]
+
+    def contar(self, rangos=None):
+        return int(np.count_nonzero(self.mascara(rangos)))
+
+    def media(self, campo, rangos=None):
+        """Media del campo en los juegos dentro de los rangos (None si no hay ninguno)"""
+        valores = self._valores(campo, rangos)
+        return round(float(valores.mean()), 2) if len(valores) else None
+
+    def histograma(self, campo, bordes, rangos=None):
+        """Número de juegos en cada intervalo [bordes[i], bordes[i+1]) (el último incluye su borde)"""
+        valores = self._valores(campo, rangos)
+        return np.histogram(valores, bins=bordes)[0].tolist()
+
+    def agregados(self):
+        """Medias e histogramas de /api/estadisticas (se calculan al pedirlos)"""
+        return formato_agregados(
+            self.media("valoracion"),
+            self.media("descuento", {"descuento": (1, None)}),
+            self.histograma("precio", BORDES_PRECIO),
+            self.histograma("valoracion", BORDES_VALORACION))
+
+
+def formato_agregados(valoracion, descuento, histograma_precios, histograma_valoracion):
+    return {
+        "valoracion_promedio": valoracion,
+        "descuento_promedio_ofertas": descuento,
+        "histograma_precios": {
+            "bordes": BORDES_PRECIO[:-1],
+            "juegos": histograma_precios
+        },
+        "histograma_valoracion": histograma_valoracion
+    }
+
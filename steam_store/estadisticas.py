@@ -0,0 +1,144 @@
+# =========================================================================================
+#  📊 ESTADÍSTICAS INCREMENTALES - Agregados de la tienda mantenidos al vuelo
+#  ────────────────────────────────────────────────────────────────────────────────────────
+#  * Cada alta, edición o baja ajusta contadores y estructuras ordenadas
+#  * Consultar las estadísticas cuesta O(1): no se recorre el catálogo
+#  * También las medias e histogramas de /api/estadisticas cuando no hay NumPy (sumas exactas
+#    con Fraction para que miles de reseñas no acumulen error de redondeo)
+# =========================================================================================
+
+from bisect import bisect_left, bisect_right, insort
+from fractions import Fraction
+
+from catalogo import IndiceCatalogo
+from columnas import BORDES_PRECIO, BORDES_VALORACION, formato_agregados
+
+
+def _quitar_ordenado(lista, valor):
+    """Elimina un valor de una lista ordenada usando bisect"""
+    i = bisect_left(lista, valor)
+    if i < len(lista) and lista[i] == valor:
+        del lista[i]
+
+
+def _intervalo(valor, bordes):
+    """Índice del intervalo [b_i, b_i+1) del valor, como np.histogram (el último incluye su
+    borde derecho); None si queda fuera"""
+    if bordes[0] <= valor < bordes[-1]:
+        return bisect_right(bordes, valor) - 1
+    if valor == bordes[-1]:
+        return len(bordes) - 2
+    return None
+
+
+class EstadisticasTienda(IndiceCatalogo):
+    """Contadores de precios, ofertas, valoraciones y reseñas del catálogo"""
+
+    CAMPOS = {"precio", "descuento", "valoracion", "num_reviews"}
+
+    def __init__(self, catalogo):
+        self._catalogo = catalogo
+        self.total = 0
+        self.gratis = 0
+        self.con_descuento = 0
+        # * Precios > 0 ordenados (mínimo y máximo en los extremos) y su suma en céntimos
+        self._precios = []
+        self._suma_centimos = 0
+        # * (-valor, posición, id): el primero es el máximo; a igualdad gana el primero del catálogo
+        self._por_valoracion = []
+        self._por_reviews = []
+        # * Medias e histogramas: sumas y conteos por intervalo
+        self._suma_valoraciones = Fraction(0)
+        self._suma_descuentos = 0
+        self._histograma_precios = [0] * (len(BORDES_PRECIO) - 1)
+        self._histograma_valoracion = [0] * (len(BORDES_VALORACION) - 1)
+
+    def _claves(self, juego):
+        posicion = self._catalogo.posicion(juego["id"])
+        return ((-juego["valoracion"], posicion, juego["id"]),
+                (-juego["num_reviews"], posicion, juego["id"]))
+
+    def construir(self, juegos):
+        # * Se reúnen las tres listas y cada una se ordena una vez (insort juego a juego es O(n²))
+        self.total = len(juegos)
+        self._precios = sorted(j["precio"] for j in juegos if j["precio"] > 0)
+        self._suma_centimos = sum(round(precio * 100) for precio in self._precios)
+        self.gratis = sum(1 for j in juegos if j["precio"] == 0)
+        self.con_descuento = sum(1 for j in juegos if j["descuento"] > 0)
+        claves = [self._claves(j) for j in juegos]
+        self._por_valoracion = sorted(c[0] for c in claves)
+        self._por_reviews = sorted(c[1] for c in claves)
+        self._suma_valoraciones = sum(map(Fraction, (j["valoracion"] for j in juegos)), Fraction(0))
+        self._suma_descuentos = sum(j["descuento"] for j in juegos if j["descuento"] > 0)
+        self._histograma_precios = [0] * (len(BORDES_PRECIO) - 1)
+        self._histograma_valoracion = [0] * (len(BORDES_VALORACION) - 1)
+        for juego in juegos:
+            self._sumar_histogramas(juego, 1)
+
+    def _sumar_histogramas(self, juego, signo):
+        for histograma, valor, bordes in ((self._histograma_precios, juego["precio"], BORDES_PRECIO),
+                                          (self._histograma_valoracion, juego["valoracion"], BORDES_VALORACION)):
+            i = _intervalo(valor, bordes)
+            if i is not None:
+                histograma[i] += signo
+
+    def al_agregar(self, juego):
+        self.total += 1
+        if juego["precio"] > 0:
+            insort(self._precios, juego["precio"])
+            self._suma_centimos += round(juego["precio"] * 100)
+        elif juego["precio"] == 0:
+            self.gratis += 1
+        if juego["descuento"] > 0:
+            self.con_descuento += 1
+            self._suma_descuentos += juego["descuento"]
+        self._suma_valoraciones += Fraction(juego["valoracion"])
+        self._sumar_histogramas(juego, 1)
+        por_valoracion, por_reviews = self._claves(juego)
+        insort(self._por_valoracion, por_valoracion)
+        insort(self._por_reviews, por_reviews)
+
+    def al_eliminar(self, juego):
+        self.total -= 1
+        if juego["precio"] > 0:
+            _quitar_ordenado(self._precios, juego["precio"])
+            self._suma_centimos -= round(juego["precio"] * 100)
+        elif juego["precio"] == 0:
+            self.gratis -= 1
+        if juego["descuento"] > 0:
+            self.con_descuento -= 1
+            self._suma_descuentos -= juego["descuento"]
+        self._suma_valoraciones -= Fraction(juego["valoracion"])
+        self._sumar_histogramas(juego, -1)
+        por_valoracion, por_reviews = self._claves(juego)
+        _quitar_ordenado(self._por_valoracion, por_valoracion)
+        _quitar_ordenado(self._por_reviews, por_reviews)
+
+    def al_actualizar(self, anterior, juego, campos):
+        if campos & self.CAMPOS:
+            super().al_actualizar(anterior, juego, campos)
+
+    def _nombre(self, ordenados):
+        return self._catalogo.obtener(ordenados[0][2])["nombre"] if ordenados else None
+
+    def resumen(self):
+        """Estadísticas actuales (mismo formato que obtener_estadisticas)"""
+        precios = self._precios
+        return {
+            "total_juegos": self.total,
+            "precio_mas_bajo": precios[0] if precios else 0,
+            "precio_mas_alto": precios[-1] if precios else 0,
+            "precio_promedio": round(self._suma_centimos / len(precios) / 100, 2) if precios else 0,
+            "juegos_gratis": self.gratis,
+            "juegos_con_descuento": self.con_descuento,
+            "mejor_valorado": self._nombre(self._por_valoracion),
+            "mas_reseñas": self._nombre(self._por_reviews)
+        }
+
+    def agregados(self):
+        """Medias e histogramas (mismo formato que ColumnasCatalogo.agregados)"""
+        return formato_agregados(
+            round(float(self._suma_valoraciones / self.total), 2) if self.total else None,
+            round(self._suma_descuentos / self.con_descuento, 2) if self.con_descuento else None,
+            list(self._histograma_precios),
+            list(self._histograma_valoracion))
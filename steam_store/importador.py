@@ -0,0 +1,175 @@
+# =========================================================================================
+#  📥 IMPORTADOR DE CATÁLOGOS - JSON Lines o CSV, registro a registro
+#  ────────────────────────────────────────────────────────────────────────────────────────
+#  * El fichero se lee en streaming: en memoria solo hay una línea y los juegos ya validados
+#  * Cada registro se valida contra ESQUEMA_JUEGO; los inválidos se cuentan y se saltan
+#  * Los índices se construyen después, una sola vez, al registrarlos sobre el catálogo cargado
+#  * Uso: python importador.py juegos.jsonl  (valida, construye la app completa y da el ritmo)
+# =========================================================================================
+
+import csv
+import json
+import os
+import time
+
+from catalogo import ESQUEMA_JUEGO
+
+# * En CSV las listas van separadas por "|" (o como array JSON) y los diccionarios en JSON
+SEPARADOR_LISTAS = "|"
+VERDADEROS = {"true", "1", "si", "sí", "yes"}
+FALSOS = {"false", "0", "no", ""}
+
+
+class InformeImportacion:
+    """Contadores y ritmo de una importación"""
+
+    # * Solo se guardan los primeros errores (un fichero muy roto no debe llenar la memoria)
+    MAX_ERRORES_GUARDADOS = 20
+
+    def __init__(self):
+        self.leidos = 0
+        self.importados = 0
+        self.invalidos = 0
+        self.errores = []
+        self.segundos = 0.0
+
+    def error(self, linea, mensaje):
+        self.invalidos += 1
+        if len(self.errores) < self.MAX_ERRORES_GUARDADOS:
+            self.errores.append((linea, mensaje))
+
+    @property
+    def por_segundo(self):
+        return self.leidos / self.segundos if self.segundos else 0.0
+
+    def __str__(self):
+        return (f"{self.importados:,} juegos importados de {self.leidos:,} registros "
+                f"({self.invalidos:,} inválidos) en {self.segundos:.2f} s → {self.por_segundo:,.0f} registros/s")
+
+
+def validar_juego(registro):
+    """Lista de errores del registro frente a ESQUEMA_JUEGO (vacía si es válido)"""
+    if not isinstance(registro, dict):
+        return ["el registro no es un objeto"]
+    errores = []
+    faltan = [c for c in ESQUEMA_JUEGO if c not in registro]
+    if faltan:
+        errores.append(f"faltan campos: {', '.join(faltan)}")
+    desconocidos = [c for c in registro if c not in ESQUEMA_JUEGO]
+    if desconocidos:
+        errores.append(f"campos desconocidos: {', '.join(map(repr, desconocidos))}")
+    for campo, tipo in ESQUEMA_JUEGO.items():
+        if campo not in registro:
+            continue
+        valor = registro[campo]
+        # * bool es subclase de int: True no es un precio ni un ID válidos
+        if not isinstance(valor, tipo) or (isinstance(valor, bool) and tipo is not bool):
+            errores.append(f"'{campo}' debería ser {_nombre_tipo(tipo)}, no {type(valor).__name__}")
+        # * Las listas del esquema (etiquetas, idiomas, plataformas, capturas) son de textos:
+        #   los índices de facetas y de búsqueda los tratan como tales
+        elif tipo is list and not all(isinstance(elemento, str) for elemento in valor):
+            errores.append(f"'{campo}' debería ser una lista de str")
+    return errores
+
+
+def _nombre_tipo(tipo):
+    return " o ".join(t.__name__ for t in tipo) if isinstance(tipo, tuple) else tipo.__name__
+
+
+def _convertir_csv(campo, texto):
+    """Convierte una celda CSV al tipo del esquema (ValueError si no se puede)"""
+    tipo = ESQUEMA_JUEGO.get(campo)
+    if tipo is None or tipo is str:
+        return texto
+    if tipo is int:
+        return int(texto)
+    if tipo == (int, float):
+        numero = float(texto)
+        return int(numero) if numero.is_integer() and "." not in texto else numero
+    if tipo is bool:
+        texto = texto.strip().lower()
+        if texto not in VERDADEROS | FALSOS:
+            raise ValueError(f"'{campo}' no es un booleano: {texto!r}")
+        return texto in VERDADEROS
+    if tipo is dict or texto.startswith("["):
+        return json.loads(texto)
+    return [parte.strip() for parte in texto.split(SEPARADOR_LISTAS) if parte.strip()]
+
+
+def leer_registros(ruta, formato=None):
+    """(número de línea, registro o excepción) leyendo el fichero en streaming.
+    El formato se deduce de la extensión: .csv o JSON Lines (.jsonl, .ndjson)."""
+    formato = formato or ("csv" if ruta.lower().endswith(".csv") else "jsonl")
+    with open(ruta, encoding="utf-8", newline="") as fichero:
+        if formato == "csv":
+            lector = csv.DictReader(fichero)
+            for fila in lector:
+                # * Una fila con columnas de más o de menos que la cabecera no se puede leer campo a campo
+                if None in fila:
+                    yield lector.line_num, ValueError(f"{len(fila[None])} columna(s) más que la cabecera")
+                    continue
+                if None in fila.values():
+                    faltan = sum(1 for v in fila.values() if v is None)
+                    yield lector.line_num, ValueError(f"{faltan} columna(s) menos que la cabecera")
+                    continue
+                try:
+                    yield lector.line_num, {c: _convertir_csv(c, v) for c, v in fila.items()}
+                except ValueError as error:
+                    yield lector.line_num, error
+        else:
+            for numero, linea in enumerate(fichero, 1):
+                if not linea.strip():
+                    continue
+                try:
+                    yield numero, json.loads(linea)
+                except ValueError as error:
+                    yield numero, error
+
+
+def importar(ruta, informe=None, formato=None):
+    """Generador de juegos válidos del fichero (los inválidos o con ID repetido se anotan en el informe)"""
+    informe = informe if informe is not None else InformeImportacion()
+    vistos = set()
+    inicio = time.perf_counter()
+    try:
+        for linea, registro in leer_registros(ruta, formato):
+            informe.leidos += 1
+            if isinstance(registro, Exception):
+                informe.error(linea, f"no se puede leer: {registro}")
+                continue
+            errores = validar_juego(registro)
+            if not errores and registro["id"] in vistos:
+                errores = [f"ID repetido: {registro['id']}"]
+            if errores:
+                informe.error(linea, "; ".join(errores))
+                continue
+            vistos.add(registro["id"])
+            informe.importados += 1
+            yield registro
+    finally:
+        informe.segundos = time.perf_counter() - inicio
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Importa un catálogo y construye todos los índices de la tienda")
+    parser.add_argument("ruta", help="Fichero .jsonl/.ndjson o .csv")
+    args = parser.parse_args()
+
+    # * La app importa el fichero al arrancar y registra (construye) sus índices sobre él
+    os.environ["STEAM_CATALOGO"] = args.ruta
+    inicio = time.perf_counter()
+    import app
+    total = time.perf_counter() - inicio
+
+    informe = app.informe_importacion
+    print(f"📥 {informe}")
+    for linea, mensaje in informe.errores:
+        print(f"   línea {linea}: {mensaje}")
+    print(f"🗂️  App lista con todos sus índices en {total:.2f} s "
+          f"({total - informe.segundos:.2f} s tras la lectura) → {informe.importados / total:,.0f} juegos/s")
+
+
+if __name__ == '__main__':
+    main()
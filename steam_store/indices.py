@@ -0,0 +1,255 @@
+# =========================================================================================
+#  🗂️ ÍNDICES DEL CATÁLOGO - Estructuras precalculadas para filtrar y ordenar
+#  ────────────────────────────────────────────────────────────────────────────────────────
+#  * Se registran en el catálogo y se actualizan con cada alta, edición o baja
+#  * Evitan recorrer y ordenar todo el catálogo en cada petición
+# =========================================================================================
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+
+from catalogo import IndiceCatalogo
+
+
+class VistasOrdenadas(IndiceCatalogo):
+    """Permutaciones del catálogo preordenadas por cada criterio (se calculan bajo demanda)"""
+
+    # * Con resultados muy pequeños es más barato ordenar que recorrer la vista completa
+    FACTOR_ORDENAR = 8
+
+    def __init__(self, catalogo, criterios, criterio_defecto="nombre"):
+        # * criterios: nombre → (campo del que depende, key para sorted)
+        self._catalogo = catalogo
+        self._criterios = criterios
+        self._criterio_defecto = criterio_defecto
+        self._vistas = {}
+
+    def construir(self, juegos):
+        self._vistas.clear()
+
+    def al_agregar(self, juego):
+        self._vistas.clear()
+
+    def al_eliminar(self, juego):
+        self._vistas.clear()
+
+    def al_actualizar(self, anterior, juego, campos):
+        # * Solo se invalidan las vistas cuyo campo ha cambiado
+        for clave in list(self._vistas):
+            if self._criterios[clave[0]][0] in campos:
+                del self._vistas[clave]
+
+    def vista(self, criterio, descendente=False):
+        """Catálogo completo ordenado por un criterio (se reconstruye solo si se invalidó)"""
+        clave = (criterio, descendente)
+        vista = self._vistas.get(clave)
+        if vista is None:
+            key_func = self._criterios[criterio][1]
+            vista = self._vistas[clave] = sorted(self._catalogo.juegos, key=key_func, reverse=descendente)
+        return vista
+
+    def ordenar_ids(self, ids, criterio="nombre", descendente=False, inicio=0, cantidad=None):
+        """Ordena un conjunto de IDs recorriendo la vista con la máscara de IDs.
+        Con `cantidad` solo se materializa la página pedida y el recorrido se corta al completarla."""
+        if criterio not in self._criterios:
+            criterio = self._criterio_defecto
+        fin = None if cantidad is None else inicio + cantidad
+        if len(ids) * self.FACTOR_ORDENAR < len(self._catalogo):
+            juegos = self._catalogo.juegos_en_orden(ids)
+            return sorted(juegos, key=self._criterios[criterio][1], reverse=descendente)[inicio:fin]
+        return list(islice((j for j in self.vista(criterio, descendente) if j["id"] in ids), inicio, fin))
+
+    def clave_cursor(self, juego, criterio):
+        """(valor de ordenación, posición en el catálogo): identifica un juego dentro de una vista"""
+        return self._criterios[criterio][1](juego), self._catalogo.posicion(juego["id"])
+
+    def indice_tras(self, criterio, descendente, valor, posicion):
+        """Índice del primer juego de la vista situado después de (valor, posición) - búsqueda binaria"""
+        vista = self.vista(criterio, descendente)
+        key_func = self._criterios[criterio][1]
+        inicio, fin = 0, len(vista)
+        while inicio < fin:
+            medio = (inicio + fin) // 2
+            juego = vista[medio]
+            actual = key_func(juego)
+            if actual == valor:
+                antes = self._catalogo.posicion(juego["id"]) <= posicion
+            else:
+                antes = actual > valor if descendente else actual < valor
+            if antes:
+                inicio = medio + 1
+            else:
+                fin = medio
+        return inicio
+
+    def pagina(self, ids, criterio="nombre", descendente=False, despues=None, cantidad=20):
+        """Página estable tras un cursor (valor, posición); devuelve (juegos, hay_mas).
+        `ids` es la máscara de IDs permitidos o None para todo el catálogo."""
+        juegos = list(islice(self.recorrer(ids, criterio, descendente, despues), cantidad + 1))
+        return juegos[:cantidad], len(juegos) > cantidad
+
+    def recorrer(self, ids=None, criterio="nombre", descendente=False, despues=None):
+        """Iterador de juegos en el orden del criterio sin materializar el resultado.
+        Recorre la vista del momento en que empieza: si se invalida después, no cambia bajo el recorrido."""
+        if criterio not in self._criterios:
+            criterio = self._criterio_defecto
+        vista = self.vista(criterio, descendente)
+        inicio = 0 if despues is None else self.indice_tras(criterio, descendente, *despues)
+        candidatos = (vista[i] for i in range(inicio, len(vista)))
+        if ids is not None:
+            candidatos = (j for j in candidatos if j["id"] in ids)
+        return candidatos
+
+    def ordenar(self, juegos, criterio="nombre", descendente=False):
+        """Ordena un subconjunto del catálogo (lista de juegos en orden de catálogo)"""
+        if criterio not in self._criterios:
+            criterio = self._criterio_defecto
+        if len(juegos) * self.FACTOR_ORDENAR < len(self._catalogo):
+            return sorted(juegos, key=self._criterios[criterio][1], reverse=descendente)
+        return self.ordenar_ids({j["id"] for j in juegos}, criterio, descendente)
+
+
+class IndicePrecio(IndiceCatalogo):
+    """Lista de pares (precio, id) ordenada para consultas por rango con bisect"""
+
+    def __init__(self):
+        self._ordenados = []
+
+    def construir(self, juegos):
+        self._ordenados = sorted((j["precio"], j["id"]) for j in juegos)
+
+    def al_agregar(self, juego):
+        insort(self._ordenados, (juego["precio"], juego["id"]))
+
+    def al_eliminar(self, juego):
+        clave = (juego["precio"], juego["id"])
+        i = bisect_left(self._ordenados, clave)
+        if i < len(self._ordenados) and self._ordenados[i] == clave:
+            del self._ordenados[i]
+
+    def al_actualizar(self, anterior, juego, campos):
+        if "precio" in campos:
+            super().al_actualizar(anterior, juego, campos)
+
+    def ids_en_rango(self, min_precio=0, max_precio=float('inf')):
+        """IDs con min_precio <= precio <= max_precio en O(log n + k)"""
+        inicio = bisect_left(self._ordenados, (min_precio,))
+        fin = bisect_right(self._ordenados, (max_precio, float('inf')))
+        return [id_juego for _, id_juego in self._ordenados[inicio:fin]]
+
+    def cubre_todo(self, min_precio=0, max_precio=float('inf')):
+        """True si el rango incluye todos los precios del catálogo (el filtro no descarta nada)"""
+        return not self._ordenados or (
+            min_precio <= self._ordenados[0][0] and max_precio >= self._ordenados[-1][0])
+
+
+class FiltroFacetas(IndiceCatalogo):
+    """Bitsets por faceta: el bit i corresponde al juego en la posición i del catálogo"""
+
+    # * faceta → valores del juego para esa faceta (OR dentro de una faceta, AND entre facetas)
+    FACETAS = {
+        "categoria": lambda j: (j["categoria"],),
+        "etiqueta": lambda j: j["etiquetas"],
+        "plataforma": lambda j: j["plataformas"],
+        "idioma": lambda j: j["idiomas"],
+        "multijugador": lambda j: (j["multijugador"],),
+        "oferta": lambda j: (True,) if j["descuento"] > 0 else (),
+        "gratis": lambda j: (True,) if j["precio"] == 0 else ()
+    }
+    CAMPOS = {"categoria", "etiquetas", "plataformas", "idiomas", "multijugador", "descuento", "precio"}
+
+    def __init__(self, catalogo):
+        self._catalogo = catalogo
+        self._bits = {}
+        self._id_por_posicion = []
+        self.todos = 0
+
+    def _claves(self, juego):
+        for faceta, valores in self.FACETAS.items():
+            for valor in valores(juego):
+                yield faceta, valor
+
+    def _registrar_posicion(self, juego):
+        posicion = self._catalogo.posicion(juego["id"])
+        if posicion >= len(self._id_por_posicion):
+            self._id_por_posicion.extend([None] * (posicion + 1 - len(self._id_por_posicion)))
+        self._id_por_posicion[posicion] = juego["id"]
+        return posicion
+
+    def construir(self, juegos):
+        # * Se agrupan las posiciones por clave y cada bitset se crea de una vez
+        posiciones = {}
+        todas = []
+        for juego in juegos:
+            posicion = self._registrar_posicion(juego)
+            todas.append(posicion)
+            for clave in self._claves(juego):
+                posiciones.setdefault(clave, []).append(posicion)
+        self._bits = {clave: self.bits_de_posiciones(p) for clave, p in posiciones.items()}
+        self.todos = self.bits_de_posiciones(todas)
+
+    def al_agregar(self, juego):
+        bit = 1 << self._registrar_posicion(juego)
+        self.todos |= bit
+        for clave in self._claves(juego):
+            self._bits[clave] = self._bits.get(clave, 0) | bit
+
+    def al_eliminar(self, juego):
+        posicion = self._catalogo.posicion(juego["id"])
+        mascara = ~(1 << posicion)
+        self.todos &= mascara
+        self._id_por_posicion[posicion] = None
+        for clave in self._claves(juego):
+            bits = self._bits.get(clave, 0) & mascara
+            if bits:
+                self._bits[clave] = bits
+            else:
+                self._bits.pop(clave, None)
+
+    def al_actualizar(self, anterior, juego, campos):
+        if campos & self.CAMPOS:
+            super().al_actualizar(anterior, juego, campos)
+
+    def valores(self, faceta):
+        """Valores presentes en el catálogo para una faceta"""
+        return sorted(valor for f, valor in self._bits if f == faceta)
+
+    def filtrar(self, filtros, base=None):
+        """Bitset de los juegos que cumplen los filtros {faceta: [valores]}"""
+        resultado = self.todos if base is None else self.todos & base
+        for faceta, valores in filtros.items():
+            union = 0
+            for valor in valores:
+                union |= self._bits.get((faceta, valor), 0)
+            resultado &= union
+            if not resultado:
+                break
+        return resultado
+
+    @staticmethod
+    def bits_de_posiciones(posiciones):
+        """Crea un bitset a partir de posiciones en O(n/8 + k) usando un bytearray"""
+        posiciones = list(posiciones)
+        if not posiciones:
+            return 0
+        buffer = bytearray(max(posiciones) // 8 + 1)
+        for posicion in posiciones:
+            buffer[posicion >> 3] |= 1 << (posicion & 7)
+        return int.from_bytes(buffer, "little")
+
+    def bits_de_ids(self, ids):
+        return self.bits_de_posiciones(self._catalogo.posicion(i) for i in ids)
+
+    def ids(self, bits):
+        """IDs de un bitset en orden de catálogo (recorre la representación binaria una vez)"""
+        binario = bin(bits)[:1:-1]
+        resultado = []
+        posicion = binario.find("1")
+        while posicion != -1:
+            resultado.append(self._id_por_posicion[posicion])
+            posicion = binario.find("1", posicion + 1)
+        return resultado
+
+    @staticmethod
+    def contar(bits):
+        return bin(bits).count("1")
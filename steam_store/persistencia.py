@@ -0,0 +1,249 @@
+# =========================================================================================
+#  💾 PERSISTENCIA EN SQLITE - Catálogo, carritos, wishlists, bibliotecas y reseñas
+#  ────────────────────────────────────────────────────────────────────────────────────────
+#  * Las lecturas se sirven siempre de memoria: SQLite solo se lee al arrancar
+#  * Cada cambio se encola (O(1), sin tocar disco dentro de la petición) y un hilo escritor
+#    los vuelca agrupados en una transacción corta cada `intervalo` segundos
+#  * Modo WAL; el fichero es de UN solo proceso: la memoria es la fuente de verdad (carritos,
+#    catálogo, contadores de IDs) y dos procesos sobrescribirían sus cambios. Se abre en modo
+#    EXCLUSIVE y un segundo proceso sobre el mismo fichero falla al arrancar
+#  * Si una escritura de un lote falla, el lote se repite con cada una en su SAVEPOINT: solo
+#    se descarta la que falla (y se registra)
+#  * Cada fila guarda el diccionario completo en JSON; las columnas sueltas son las claves
+#    por las que se busca o se ordena (y tienen índice)
+# =========================================================================================
+
+import atexit
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+from catalogo import IndiceCatalogo
+
+registro = logging.getLogger(__name__)
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS juegos (
+    id INTEGER PRIMARY KEY,
+    posicion INTEGER NOT NULL,
+    datos TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS juegos_posicion ON juegos (posicion);
+
+CREATE TABLE IF NOT EXISTS reviews (
+    id INTEGER PRIMARY KEY,
+    juego_id INTEGER NOT NULL,
+    datos TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reviews_juego ON reviews (juego_id, id);
+"""
+
+# * Carrito, wishlist y biblioteca comparten estructura: una fila por (usuario, juego).
+#   El rowid conserva el orden de inserción (un upsert no lo cambia)
+LISTAS_USUARIO = ("carrito", "wishlist", "biblioteca")
+
+ESQUEMA_LISTA = """
+CREATE TABLE IF NOT EXISTS {tabla} (
+    usuario TEXT NOT NULL,
+    juego_id INTEGER NOT NULL,
+    datos TEXT NOT NULL,
+    UNIQUE (usuario, juego_id)
+);
+CREATE INDEX IF NOT EXISTS {tabla}_juego ON {tabla} (juego_id);
+"""
+
+
+def _json(datos):
+    # * Los juegos compactos del catálogo se guardan como el diccionario equivalente
+    return json.dumps(datos, ensure_ascii=False, default=dict)
+
+
+class AlmacenEnUso(RuntimeError):
+    """El fichero SQLite ya lo tiene abierto otro proceso"""
+
+
+class AlmacenSQLite:
+    """Escrituras agrupadas en un hilo de fondo; lecturas completas solo al cargar"""
+
+    def __init__(self, ruta, intervalo=0.05):
+        self.ruta = ruta
+        self.intervalo = intervalo
+        self._conexion = sqlite3.connect(ruta, check_same_thread=False, isolation_level=None)
+        # * EXCLUSIVE antes de activar WAL: el lock del fichero se queda en este proceso
+        self._conexion.execute("PRAGMA locking_mode=EXCLUSIVE")
+        try:
+            self._conexion.execute("PRAGMA journal_mode=WAL")
+            self._conexion.execute("BEGIN EXCLUSIVE")
+            self._conexion.execute("COMMIT")
+        except sqlite3.OperationalError as error:
+            self._conexion.close()
+            raise AlmacenEnUso(f"{ruta} ya lo usa otro proceso (el almacén SQLite es de un solo proceso)") from error
+        # * En WAL, NORMAL no pierde consistencia; como mucho las últimas transacciones si cae el SO
+        self._conexion.execute("PRAGMA synchronous=NORMAL")
+        self._conexion.execute("PRAGMA busy_timeout=5000")
+        self._conexion.executescript(ESQUEMA + "".join(ESQUEMA_LISTA.format(tabla=t) for t in LISTAS_USUARIO))
+        # * La conexión la usan el hilo escritor, sincronizar() y las cargas: un lock la protege
+        #   (y garantiza que los lotes se escriben en el orden en que se encolaron)
+        self._lock_conexion = threading.Lock()
+        self._pendientes = []
+        self._condicion = threading.Condition()
+        self._cerrado = False
+        self.transacciones = 0
+        self.escrituras = 0
+        self.fallidas = 0
+        self._hilo = threading.Thread(target=self._escritor, name="almacen-sqlite", daemon=True)
+        self._hilo.start()
+        atexit.register(self.cerrar)
+
+    # ---------------------------------------------------------------- Carga
+
+    def _filas(self, sql, parametros=()):
+        with self._lock_conexion:
+            return self._conexion.execute(sql, parametros).fetchall()
+
+    def hay_juegos(self):
+        return bool(self._filas("SELECT 1 FROM juegos LIMIT 1"))
+
+    def cargar_juegos(self):
+        """Juegos guardados en orden de catálogo (lista vacía si la base es nueva)"""
+        return [json.loads(datos) for (datos,) in self._filas("SELECT datos FROM juegos ORDER BY posicion")]
+
+    def cargar_reviews(self):
+        return [json.loads(datos) for (datos,) in self._filas("SELECT datos FROM reviews ORDER BY id")]
+
+    def cargar_usuarios(self):
+        """usuario → {"carrito": [...], "wishlist": [...], "biblioteca": [...]} en orden de inserción"""
+        usuarios = {}
+        for tabla in LISTAS_USUARIO:
+            for usuario, datos in self._filas(f"SELECT usuario, datos FROM {tabla} ORDER BY rowid"):
+                listas = usuarios.setdefault(usuario, {t: [] for t in LISTAS_USUARIO})
+                listas[tabla].append(json.loads(datos))
+        return usuarios
+
+    # ---------------------------------------------------------------- Escritura
+
+    def _encolar(self, sql, parametros):
+        with self._condicion:
+            self._pendientes.append((sql, parametros))
+            self._condicion.notify()
+
+    def guardar_juego(self, juego, posicion):
+        self._encolar("INSERT OR REPLACE INTO juegos (id, posicion, datos) VALUES (?, ?, ?)",
+                      (juego["id"], posicion, _json(juego)))
+
+    def eliminar_juego(self, id_juego):
+        self._encolar("DELETE FROM juegos WHERE id = ?", (id_juego,))
+        self._encolar("DELETE FROM reviews WHERE juego_id = ?", (id_juego,))
+
+    def guardar_review(self, review):
+        self._encolar("INSERT INTO reviews (id, juego_id, datos) VALUES (?, ?, ?)",
+                      (review["id"], review["juego_id"], _json(review)))
+
+    def guardar_item(self, tabla, usuario, item):
+        self._encolar(f"INSERT INTO {tabla} (usuario, juego_id, datos) VALUES (?, ?, ?) "
+                      f"ON CONFLICT (usuario, juego_id) DO UPDATE SET datos = excluded.datos",
+                      (usuario, item["id"], _json(item)))
+
+    def eliminar_item(self, tabla, usuario, id_juego):
+        self._encolar(f"DELETE FROM {tabla} WHERE usuario = ? AND juego_id = ?", (usuario, id_juego))
+
+    def vaciar(self, tabla, usuario):
+        self._encolar(f"DELETE FROM {tabla} WHERE usuario = ?", (usuario,))
+
+    def _transaccion(self, lote, aislar):
+        """Ejecuta el lote en una transacción; con `aislar` cada escritura va en su SAVEPOINT y
+        las que fallan se deshacen y se registran. Devuelve cuántas fallaron."""
+        fallidas = 0
+        self._conexion.execute("BEGIN")
+        try:
+            for sql, parametros in lote:
+                if not aislar:
+                    self._conexion.execute(sql, parametros)
+                    continue
+                self._conexion.execute("SAVEPOINT escritura")
+                try:
+                    self._conexion.execute(sql, parametros)
+                except sqlite3.Error:
+                    self._conexion.execute("ROLLBACK TO escritura")
+                    fallidas += 1
+                    registro.exception("No se pudo guardar un cambio en %s: %s %r", self.ruta, sql, parametros)
+                self._conexion.execute("RELEASE escritura")
+            self._conexion.execute("COMMIT")
+        except Exception:
+            self._conexion.execute("ROLLBACK")
+            raise
+        return fallidas
+
+    def _volcar(self):
+        """Ejecuta todas las escrituras pendientes en una sola transacción"""
+        with self._lock_conexion:
+            with self._condicion:
+                lote, self._pendientes = self._pendientes, []
+            if not lote:
+                return
+            try:
+                fallidas = self._transaccion(lote, aislar=False)
+            except sqlite3.Error:
+                fallidas = None
+            if fallidas is None:
+                # * Una escritura mala no debe llevarse por delante las demás del lote: se repite
+                #   con cada una aislada (los SAVEPOINT solo se pagan cuando algo falla)
+                fallidas = self._transaccion(lote, aislar=True)
+            self.transacciones += 1
+            self.escrituras += len(lote) - fallidas
+            self.fallidas += fallidas
+
+    def _escritor(self):
+        while True:
+            with self._condicion:
+                while not self._pendientes and not self._cerrado:
+                    self._condicion.wait()
+                if self._cerrado:
+                    return
+            # * Se espera un poco para que las escrituras cercanas entren en la misma transacción
+            time.sleep(self.intervalo)
+            try:
+                self._volcar()
+            except sqlite3.Error:
+                # * Solo llega aquí si falla la transacción entera (disco lleno, fichero bloqueado...):
+                #   no debe parar al escritor, se registra y se sigue con el siguiente lote
+                registro.exception("No se pudo guardar un lote de cambios en %s", self.ruta)
+
+    def sincronizar(self):
+        """Escribe ya todo lo pendiente (al cerrar, en pruebas o antes de copiar el fichero)"""
+        self._volcar()
+
+    def cerrar(self):
+        with self._condicion:
+            if self._cerrado:
+                return
+            self._cerrado = True
+            self._condicion.notify()
+        self._hilo.join()
+        self.sincronizar()
+        self._conexion.close()
+
+
+class DiarioCatalogo(IndiceCatalogo):
+    """Índice del catálogo que escribe cada alta, edición y baja en el almacén"""
+
+    def __init__(self, catalogo, almacen):
+        self._catalogo = catalogo
+        self._almacen = almacen
+
+    def construir(self, juegos):
+        # * Base nueva: se guarda el catálogo inicial (si ya tenía juegos, es de ahí de donde se cargó)
+        if not self._almacen.hay_juegos():
+            for juego in juegos:
+                self.al_agregar(juego)
+
+    def al_agregar(self, juego):
+        self._almacen.guardar_juego(juego, self._catalogo.posicion(juego["id"]))
+
+    def al_eliminar(self, juego):
+        self._almacen.eliminar_juego(juego["id"])
+
+    def al_actualizar(self, anterior, juego, campos):
+        self.al_agregar(juego)
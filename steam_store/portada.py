@@ -0,0 +1,126 @@
+# =========================================================================================
+#  🏠 MODELO DE LA PORTADA - Secciones top-k mantenidas con montículos acotados
+#  ────────────────────────────────────────────────────────────────────────────────────────
+#  * Cada sección guarda solo sus k mejores juegos en un min-heap (la raíz es el peor)
+#  * Un alta cuesta O(log k); solo si sale un juego del top se recalcula con heapq.nlargest
+#  * `version` cambia cuando cambia algo que se ve en la portada (sirve para cachear el HTML)
+# =========================================================================================
+
+import heapq
+
+from catalogo import IndiceCatalogo
+
+
+def _sin_clave(juego):
+    """Clave constante: el top queda en orden de catálogo"""
+    return 0
+
+
+class TopK:
+    """Los k mejores juegos según una clave (a igualdad gana el primero del catálogo)"""
+
+    def __init__(self, catalogo, k, clave, filtro=None):
+        self._catalogo = catalogo
+        self.k = k
+        self._clave = clave
+        self._filtro = filtro
+        self._heap = []
+        self._ids = set()
+        self._sucio = False
+
+    def _entrada(self, juego):
+        return (self._clave(juego), -self._catalogo.posicion(juego["id"]), juego["id"])
+
+    def _admite(self, juego):
+        return self._filtro is None or self._filtro(juego)
+
+    def contiene(self, id_juego):
+        return id_juego in self._ids
+
+    def reconstruir(self):
+        """Recalcula el top desde el catálogo: O(n log k)"""
+        self._heap = heapq.nlargest(self.k, (self._entrada(j) for j in self._catalogo if self._admite(j)))
+        heapq.heapify(self._heap)
+        self._ids = {entrada[2] for entrada in self._heap}
+        self._sucio = False
+
+    def agregar(self, juego):
+        if self._sucio or not self._admite(juego):
+            return
+        entrada = self._entrada(juego)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entrada)
+        elif entrada > self._heap[0]:
+            self._ids.discard(heapq.heapreplace(self._heap, entrada)[2])
+        else:
+            return
+        self._ids.add(juego["id"])
+
+    def eliminar(self, juego):
+        """Si el juego estaba en el top hay que recalcular (alguien de fuera puede entrar)"""
+        if juego["id"] in self._ids:
+            self._sucio = True
+
+    def actualizar(self, anterior, juego):
+        if juego["id"] not in self._ids:
+            self.agregar(juego)
+            return
+        entrada = self._entrada(juego)
+        if self._admite(juego) and entrada >= self._entrada(anterior):
+            # * Sigue en el top y no empeora: basta con sustituir su entrada
+            self._heap = [entrada if e[2] == juego["id"] else e for e in self._heap]
+            heapq.heapify(self._heap)
+        else:
+            self._sucio = True
+
+    def juegos(self):
+        """Juegos del top ordenados de mejor a peor"""
+        if self._sucio:
+            self.reconstruir()
+        return [self._catalogo.obtener(e[2]) for e in sorted(self._heap, reverse=True)]
+
+
+class ModeloPortada(IndiceCatalogo):
+    """Secciones de la portada: destacados, ofertas, mejor valorados, nuevos y gratis"""
+
+    # * Campos que afectan a alguna sección o a las estadísticas de la portada
+    CAMPOS = {"destacado", "descuento", "valoracion", "fecha_lanzamiento", "precio", "num_reviews", "nombre"}
+
+    def __init__(self, catalogo):
+        self.secciones = {
+            "destacados": TopK(catalogo, 5, _sin_clave, lambda j: j.get("destacado", False)),
+            "ofertas": TopK(catalogo, 6, lambda j: j["descuento"], lambda j: j["descuento"] > 0),
+            "mejor_valorados": TopK(catalogo, 6, lambda j: j["valoracion"]),
+            "nuevos": TopK(catalogo, 6, lambda j: j["fecha_lanzamiento"]),
+            "gratis": TopK(catalogo, 3, _sin_clave, lambda j: j["precio"] == 0)
+        }
+        self.version = 0
+
+    def construir(self, juegos):
+        for seccion in self.secciones.values():
+            seccion.reconstruir()
+        self.version += 1
+
+    def al_agregar(self, juego):
+        # * Un alta siempre cambia las estadísticas de la portada
+        for seccion in self.secciones.values():
+            seccion.agregar(juego)
+        self.version += 1
+
+    def al_eliminar(self, juego):
+        for seccion in self.secciones.values():
+            seccion.eliminar(juego)
+        self.version += 1
+
+    def al_actualizar(self, anterior, juego, campos):
+        if campos & self.CAMPOS:
+            for seccion in self.secciones.values():
+                seccion.actualizar(anterior, juego)
+            self.version += 1
+        elif any(s.contiene(juego["id"]) for s in self.secciones.values()):
+            # * Cambia un dato mostrado en la portada (imagen, descripción...)
+            self.version += 1
+
+    def obtener(self):
+        """Listas de juegos de cada sección"""
+        return {nombre: seccion.juegos() for nombre, seccion in self.secciones.items()}
@@ -0,0 +1,412 @@
+# =========================================================================================
+#  🎯 JUEGOS SIMILARES - Vecinos precalculados por etiquetas, categoría y desarrollador
+#  ────────────────────────────────────────────────────────────────────────────────────────
+#  * Similitud = Jaccard de etiquetas + bonus por misma categoría y mismo desarrollador
+#  * Los juegos con los mismos rasgos (perfil) tienen los mismos vecinos: se calcula una vez
+#    por perfil y cada juego solo descarta su propia entrada → consulta O(k)
+#  * Candidatos: en catálogos pequeños, todo perfil que comparte algún rasgo (exacto);
+#    en catálogos grandes, los que coinciden en alguna banda MinHash de etiquetas (LSH), en
+#    desarrollador o en etiquetas y categoría a la vez; el top se ordena con la similitud exacta
+#  * Un alta solo puede entrar en los tops de sus candidatos; una baja marca como sucios
+#    los tops en los que estaba y se recalculan al consultarlos
+#  * Reconstrucción completa en varios procesos: python recomendador.py --procesos 8
+#    (--salida guarda el resultado; la app lo sirve mientras calcula el suyo en segundo plano)
+# =========================================================================================
+
+import hashlib
+import heapq
+import json
+import logging
+import os
+import struct
+import threading
+import time
+from bisect import insort
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count, islice
+
+from catalogo import IndiceCatalogo
+
+registro = logging.getLogger(__name__)
+
+PESO_CATEGORIA = 0.5
+PESO_DESARROLLADOR = 0.25
+
+# * A partir de este número de perfiles se usa LSH y la reconstrucción se reparte en procesos
+UMBRAL_LSH = 2_000
+UMBRAL_PROCESOS = 5_000
+
+# * MinHash de las etiquetas (la categoría y el desarrollador se tratan aparte):
+#   - BANDAS bandas dentro de cada categoría: la categoría pesa más que casi cualquier Jaccard,
+#     así que los mejores vecinos suelen ser de la misma categoría
+#   - BANDAS_GLOBALES bandas con una fila más, entre todas las categorías
+#   Con 10k y 100k perfiles al azar el índice devuelve ~97% del top exacto (recall@4 en
+#   benchmarks/bench_similares.py; con 12 bandas de 4 filas sobre todos los rasgos, ~65%)
+BANDAS = 30
+BANDAS_GLOBALES = 10
+
+
+def filas_por_banda(perfiles):
+    """Filas por banda según el tamaño del catálogo: con más perfiles hay vecinos más parecidos
+    y bastan cubetas más estrictas (si no, los candidatos crecen con el catálogo)"""
+    if perfiles < 15_000:
+        return 2
+    if perfiles < 50_000:
+        return 3
+    return 4
+
+
+def perfil_juego(juego):
+    """Rasgos que intervienen en la similitud (clave hashable)"""
+    return frozenset(juego["etiquetas"]), juego["categoria"], juego["desarrollador"]
+
+
+def rasgos_perfil(perfil):
+    etiquetas, categoria, desarrollador = perfil
+    return [("etiqueta", e) for e in etiquetas] + [("categoria", categoria), ("desarrollador", desarrollador)]
+
+
+def similitud(a, b):
+    """Jaccard de etiquetas (0-1) más los pesos de categoría y desarrollador compartidos"""
+    comunes = len(a[0] & b[0])
+    union = len(a[0]) + len(b[0]) - comunes
+    puntos = comunes / union if union else 0.0
+    if a[1] == b[1]:
+        puntos += PESO_CATEGORIA
+    if a[2] == b[2]:
+        puntos += PESO_DESARROLLADOR
+    return puntos
+
+
+def _hashes_etiqueta(etiqueta, cantidad):
+    """Un valor por permutación; hashlib da lo mismo en todos los procesos (hash() no)"""
+    datos = hashlib.shake_128(repr(etiqueta).encode()).digest(4 * cantidad)
+    return struct.unpack(f"{cantidad}I", datos)
+
+
+class Vecindario:
+    """Perfiles, índice rasgo → perfiles y (opcional) cubetas LSH para generar candidatos.
+    Se puede enviar tal cual a otros procesos."""
+
+    def __init__(self, perfiles, lsh=False):
+        # * perfil → [(posición, id)] en orden de catálogo
+        self.perfiles = perfiles
+        self.lsh = lsh
+        # * Se fijan al construir: las altas posteriores caen en las mismas cubetas
+        self.filas = filas_por_banda(len(perfiles))
+        self.postings = {}
+        self._hashes = {}
+        self._cubetas = {}
+        for perfil in perfiles:
+            self._indexar(perfil)
+
+    def _firma(self, etiquetas):
+        cantidad = max(BANDAS * self.filas, BANDAS_GLOBALES * (self.filas + 1))
+        hashes = [self._hashes.get(e) or self._hashes.setdefault(e, _hashes_etiqueta(e, cantidad))
+                  for e in etiquetas]
+        return tuple(map(min, *hashes)) if len(hashes) > 1 else hashes[0]
+
+    def _bandas(self, perfil):
+        """Claves de las cubetas LSH del perfil"""
+        etiquetas, categoria, _ = perfil
+        claves = [("grupo", etiquetas, categoria)]
+        if etiquetas:
+            firma = self._firma(etiquetas)
+            filas, globales = self.filas, self.filas + 1
+            claves += [(categoria, b, firma[b * filas:(b + 1) * filas]) for b in range(BANDAS)]
+            claves += [(b, firma[b * globales:(b + 1) * globales]) for b in range(BANDAS_GLOBALES)]
+        return claves
+
+    def _indexar(self, perfil):
+        for rasgo in rasgos_perfil(perfil):
+            self.postings.setdefault(rasgo, set()).add(perfil)
+        if self.lsh:
+            for banda in self._bandas(perfil):
+                self._cubetas.setdefault(banda, set()).add(perfil)
+
+    def agregar(self, perfil, entrada):
+        if perfil not in self.perfiles:
+            self.perfiles[perfil] = []
+            self._indexar(perfil)
+        insort(self.perfiles[perfil], entrada)
+
+    def eliminar(self, perfil, entrada):
+        """Quita un juego; devuelve True si su perfil se queda sin juegos y desaparece"""
+        lista = self.perfiles[perfil]
+        lista.remove(entrada)
+        if lista:
+            return False
+        del self.perfiles[perfil]
+        for rasgo in rasgos_perfil(perfil):
+            self.postings[rasgo].discard(perfil)
+            if not self.postings[rasgo]:
+                del self.postings[rasgo]
+        if self.lsh:
+            for banda in self._bandas(perfil):
+                self._cubetas[banda].discard(perfil)
+                if not self._cubetas[banda]:
+                    del self._cubetas[banda]
+        return True
+
+    def candidatos(self, perfil):
+        """Perfiles que pueden estar en el top (relación simétrica: a es candidato de b y viceversa)"""
+        if not self.lsh:
+            return set().union(*(self.postings.get(r, ()) for r in rasgos_perfil(perfil)))
+        candidatos = set(self.postings.get(("desarrollador", perfil[2]), ()))
+        for banda in self._bandas(perfil):
+            candidatos.update(self._cubetas.get(banda, ()))
+        return candidatos
+
+    def top(self, perfil, k):
+        """Los k mejores juegos para un perfil como tuplas (-similitud, posición, id).
+        Cada perfil candidato aporta como mucho sus k primeros juegos (los demás no pueden entrar)."""
+        entradas = (
+            (-similitud(perfil, otro), posicion, id_juego)
+            for otro in self.candidatos(perfil)
+            for posicion, id_juego in self.perfiles[otro][:k]
+        )
+        return heapq.nsmallest(k, entradas)
+
+
+# * Vecindario de cada proceso trabajador (se envía una sola vez al arrancarlo)
+_vecindario = None
+
+
+def _iniciar_trabajador(vecindario):
+    global _vecindario
+    _vecindario = vecindario
+
+
+def _tops_lote(lote, k):
+    return [(perfil, _vecindario.top(perfil, k)) for perfil in lote]
+
+
+def calcular_tops(vecindario, k, procesos=None):
+    """Top k de todos los perfiles; con procesos > 1 se reparten por lotes entre procesos"""
+    if procesos is None:
+        procesos = os.cpu_count() if len(vecindario.perfiles) >= UMBRAL_PROCESOS else 1
+    if procesos <= 1:
+        return {p: vecindario.top(p, k) for p in vecindario.perfiles}
+
+    claves = list(vecindario.perfiles)
+    tamano = max(len(claves) // (procesos * 8), 1)
+    lotes = [claves[i:i + tamano] for i in range(0, len(claves), tamano)]
+    tops = {}
+    with ProcessPoolExecutor(procesos, initializer=_iniciar_trabajador, initargs=(vecindario,)) as pool:
+        for resultado in pool.map(_tops_lote, lotes, [k] * len(lotes)):
+            tops.update(resultado)
+    return tops
+
+
+def agrupar_perfiles(juegos, posicion):
+    """perfil → [(posición, id)] ordenado por posición"""
+    perfiles = {}
+    for juego in juegos:
+        perfiles.setdefault(perfil_juego(juego), []).append((posicion(juego), juego["id"]))
+    for lista in perfiles.values():
+        lista.sort()
+    return perfiles
+
+
+def _con_huella(juegos, resumen):
+    """Recorre los juegos añadiendo a `resumen` lo que decide sus similares (ID y perfil)"""
+    for juego in juegos:
+        etiquetas, categoria, desarrollador = perfil_juego(juego)
+        resumen.update(repr((juego["id"], sorted(etiquetas), categoria, desarrollador)).encode())
+        yield juego
+
+
+def huella_catalogo(juegos):
+    """Huella de los IDs (en orden) y perfiles del catálogo: un fichero precalculado solo vale
+    para el catálogo con la misma huella"""
+    resumen = hashlib.blake2b(digest_size=16)
+    for _ in _con_huella(juegos, resumen):
+        pass
+    return resumen.hexdigest()
+
+
+def cargar_precalculados(ruta, juegos):
+    """id → ids similares del fichero de `recomendador.py --salida`; {} si no existe o se
+    calculó para otro catálogo (otro número de juegos u otra huella)"""
+    if not ruta or not os.path.exists(ruta):
+        return {}
+    with open(ruta, encoding="utf-8") as fichero:
+        datos = json.load(fichero)
+    # * Primero el número de juegos (gratis); la huella recorre el catálogo
+    if (not isinstance(datos, dict) or datos.get("juegos") != len(juegos)
+            or datos.get("huella") != huella_catalogo(juegos)):
+        registro.warning("%s no corresponde al catálogo cargado; se ignora", ruta)
+        return {}
+    return {int(id_juego): ids for id_juego, ids in datos["similares"].items()}
+
+
+class IndiceSimilares(IndiceCatalogo):
+    """Los k juegos más parecidos a cada juego (a igualdad, el primero del catálogo).
+    Con segundo_plano, los catálogos grandes se calculan en un hilo aparte; mientras tanto se
+    responde con `precalculados` (id → ids) o, si el juego no está, con los de su categoría."""
+
+    CAMPOS = {"etiquetas", "categoria", "desarrollador"}
+
+    def __init__(self, catalogo, k=4, procesos=None, precalculados=None, segundo_plano=False):
+        self._catalogo = catalogo
+        self.k = k
+        self._procesos = procesos
+        self._segundo_plano = segundo_plano
+        self._precalculados = precalculados or {}
+        # * None mientras se calcula en segundo plano (o si el cálculo falló)
+        self._vecindario = Vecindario({})
+        # * perfil → top k + 1 (se guarda uno más porque el propio juego aparece en su top)
+        self._tops = {}
+        # * Cambios del catálogo que llegan durante el cálculo en segundo plano (None: no hay cálculo)
+        self._pendientes = None
+        self._hilo = None
+
+    def construir(self, juegos):
+        perfiles = agrupar_perfiles(juegos, lambda j: self._catalogo.posicion(j["id"]))
+        if not self._segundo_plano or len(perfiles) < UMBRAL_PROCESOS:
+            self._vecindario, self._tops = self._calcular(perfiles)
+            return
+        # * Se llama con el lock del catálogo: los perfiles son una foto y lo que cambie después
+        #   queda en _pendientes hasta que el hilo termina
+        self._vecindario = None
+        self._pendientes = []
+        self._hilo = threading.Thread(target=self._calcular_en_segundo_plano, args=(perfiles,),
+                                      name="similares", daemon=True)
+        self._hilo.start()
+
+    def esperar(self, timeout=None):
+        """Espera a que termine el cálculo en segundo plano; True si los vecinos ya están calculados"""
+        if self._hilo is not None:
+            self._hilo.join(timeout)
+        return self._pendientes is None and self._vecindario is not None
+
+    def _calcular(self, perfiles):
+        vecindario = Vecindario(perfiles, lsh=len(perfiles) >= UMBRAL_LSH)
+        return vecindario, calcular_tops(vecindario, self.k + 1, self._procesos)
+
+    def _calcular_en_segundo_plano(self, perfiles):
+        inicio = time.perf_counter()
+        try:
+            vecindario, tops = self._calcular(perfiles)
+        except Exception:
+            registro.exception("No se pudieron calcular los juegos similares; se usan los de su categoría")
+            with self._catalogo.lock:
+                self._pendientes = None
+            return
+        with self._catalogo.lock:
+            self._vecindario, self._tops = vecindario, tops
+            for aplicar, perfil, entrada in self._pendientes:
+                aplicar(perfil, entrada)
+            self._pendientes = None
+            self._precalculados = {}
+        registro.info("Juegos similares calculados en %.1f s (%d perfiles)",
+                      time.perf_counter() - inicio, len(perfiles))
+
+    def _entrada(self, juego):
+        return self._catalogo.posicion(juego["id"]), juego["id"]
+
+    def al_agregar(self, juego):
+        perfil, entrada = perfil_juego(juego), self._entrada(juego)
+        if self._pendientes is not None:
+            self._pendientes.append((self._agregar, perfil, entrada))
+        elif self._vecindario is not None:
+            self._agregar(perfil, entrada)
+
+    def al_eliminar(self, juego):
+        perfil, entrada = perfil_juego(juego), self._entrada(juego)
+        if self._pendientes is not None:
+            self._pendientes.append((self._eliminar, perfil, entrada))
+        elif self._vecindario is not None:
+            self._eliminar(perfil, entrada)
+
+    def al_actualizar(self, anterior, juego, campos):
+        if campos & self.CAMPOS:
+            self.al_eliminar(anterior)
+            self.al_agregar(juego)
+
+    def _agregar(self, perfil, entrada):
+        self._vecindario.agregar(perfil, entrada)
+        for otro in self._vecindario.candidatos(perfil):
+            top = self._tops.get(otro)
+            if top is None:
+                continue
+            puntuada = (-similitud(otro, perfil),) + entrada
+            if len(top) < self.k + 1 or puntuada < top[-1]:
+                insort(top, puntuada)
+                del top[self.k + 1:]
+
+    def _eliminar(self, perfil, entrada):
+        if self._vecindario.eliminar(perfil, entrada):
+            self._tops.pop(perfil, None)
+        # * Si el juego estaba en un top, otro juego de fuera puede ocupar su hueco
+        for otro in self._vecindario.candidatos(perfil):
+            top = self._tops.get(otro)
+            if top is not None and any(e[2] == entrada[1] for e in top):
+                del self._tops[otro]
+
+    def _provisionales(self, juego):
+        """Mientras no hay vecinos calculados: los precalculados o los primeros de su categoría"""
+        ids = [i for i in self._precalculados.get(juego["id"], ()) if i in self._catalogo]
+        if ids:
+            return ids[:self.k]
+        return list(islice((j["id"] for j in self._catalogo.juegos
+                            if j["categoria"] == juego["categoria"] and j["id"] != juego["id"]), self.k))
+
+    def similares(self, id_juego):
+        """IDs de los k juegos más parecidos (el top se recalcula solo si quedó sucio)"""
+        juego = self._catalogo.obtener(id_juego)
+        if juego is None:
+            return []
+        if self._pendientes is not None or self._vecindario is None:
+            return self._provisionales(juego)
+        perfil = perfil_juego(juego)
+        top = self._tops.get(perfil)
+        if top is None:
+            top = self._tops[perfil] = self._vecindario.top(perfil, self.k + 1)
+        return [e[2] for e in top if e[2] != id_juego][:self.k]
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Reconstruye los juegos similares de todo el catálogo")
+    parser.add_argument("--procesos", type=int, default=os.cpu_count())
+    parser.add_argument("-k", type=int, default=4)
+    parser.add_argument("--entrada", help="Catálogo .jsonl/.ndjson o .csv, el mismo que STEAM_CATALOGO "
+                                          "(por defecto el catálogo de app.py)")
+    parser.add_argument("--salida", help="Fichero JSON id → ids similares (con la huella del catálogo)")
+    args = parser.parse_args()
+
+    informe = None
+    if args.entrada:
+        # * Se lee en streaming con el importador de la app (mismos juegos válidos, mismo orden)
+        #   y solo se guarda el perfil de cada juego
+        from importador import InformeImportacion, importar
+        informe = InformeImportacion()
+        juegos = importar(args.entrada, informe)
+    else:
+        from app import catalogo_juegos as juegos
+
+    inicio = time.perf_counter()
+    resumen = hashlib.blake2b(digest_size=16)
+    posiciones = count()
+    perfiles = agrupar_perfiles(_con_huella(juegos, resumen), lambda j: next(posiciones))
+    if informe is not None:
+        print(f"📥 {informe}")
+    vecindario = Vecindario(perfiles, lsh=len(perfiles) >= UMBRAL_LSH)
+    tops = calcular_tops(vecindario, args.k + 1, args.procesos)
+    similares = {
+        id_juego: [e[2] for e in tops[perfil] if e[2] != id_juego][:args.k]
+        for perfil, lista in perfiles.items()
+        for _, id_juego in lista
+    }
+    segundos = time.perf_counter() - inicio
+    print(f"🎯 {len(similares):,} juegos ({len(perfiles):,} perfiles) en {segundos:.2f} s "
+          f"con {args.procesos} proceso(s) → {len(similares) / segundos:,.0f} juegos/s")
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as fichero:
+            json.dump({"juegos": len(similares), "huella": resumen.hexdigest(), "similares": similares}, fichero)
+
+
+if __name__ == '__main__':
+    main()
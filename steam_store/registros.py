@@ -0,0 +1,119 @@
+# =========================================================================================
+#  🧱 REGISTROS COMPACTOS - Juegos con __slots__ y vocabularios compartidos
+#  ────────────────────────────────────────────────────────────────────────────────────────
+#  * Un diccionario por juego repite la tabla hash entera en cada uno; con __slots__ cada
+#    campo es un puntero fijo en el objeto (unas 5 veces menos por registro)
+#  * Categorías, desarrolladores, etiquetas, plataformas, idiomas y requisitos se repiten
+#    mucho: el vocabulario guarda una sola copia de cada valor y los juegos la comparten
+#  * Las listas pasan a tuplas (inmutables: compartirlas entre juegos es seguro)
+#  * Se comportan como un diccionario (juego["nombre"], get, keys, update, dict(juego))
+#    y como un objeto (juego.nombre): plantillas, índices y JSON no cambian
+# =========================================================================================
+
+from collections.abc import Mapping
+
+from catalogo import ESQUEMA_JUEGO
+
+CAMPOS_JUEGO = tuple(ESQUEMA_JUEGO)
+_CAMPOS = frozenset(CAMPOS_JUEGO)
+
+
+class Vocabulario:
+    """Una sola copia de cada texto, lista o diccionario repetido"""
+
+    def __init__(self):
+        self._textos = {}
+        self._listas = {}
+        self._diccionarios = {}
+
+    def texto(self, valor):
+        return self._textos.setdefault(valor, valor)
+
+    def lista(self, valores):
+        """Tupla compartida con los valores (y cada valor compartido)"""
+        tupla = tuple(self.texto(v) if isinstance(v, str) else v for v in valores)
+        return self._listas.setdefault(tupla, tupla)
+
+    def diccionario(self, valor):
+        """Diccionario compartido con el mismo contenido (no se debe modificar)"""
+        try:
+            clave = tuple(sorted(valor.items()))
+            compartido = self._diccionarios.get(clave)
+        except TypeError:
+            # * Valores no hashables o claves no comparables: se guarda tal cual
+            return valor
+        if compartido is None:
+            compartido = self._diccionarios.setdefault(
+                clave, {k: self.texto(v) if isinstance(v, str) else v for k, v in valor.items()})
+        return compartido
+
+    def __len__(self):
+        return len(self._textos) + len(self._listas) + len(self._diccionarios)
+
+
+class JuegoCompacto(Mapping):
+    """Juego del catálogo con un slot por campo de ESQUEMA_JUEGO"""
+
+    __slots__ = CAMPOS_JUEGO
+
+    # * Vocabulario común a todos los registros (como sys.intern, pero también para tuplas)
+    vocabulario = Vocabulario()
+
+    # * Cómo se compacta cada campo; el resto se guarda tal cual
+    COMPACTAR = {
+        "categoria": Vocabulario.texto,
+        "desarrollador": Vocabulario.texto,
+        "editor": Vocabulario.texto,
+        "etiquetas": Vocabulario.lista,
+        "plataformas": Vocabulario.lista,
+        "idiomas": Vocabulario.lista,
+        "requisitos_minimos": Vocabulario.diccionario,
+        "requisitos_recomendados": Vocabulario.diccionario,
+        "capturas": lambda vocabulario, valor: tuple(valor)
+    }
+
+    def __init__(self, datos):
+        for campo, valor in datos.items():
+            self[campo] = valor
+
+    def __getitem__(self, campo):
+        if campo not in _CAMPOS:
+            raise KeyError(campo)
+        try:
+            return getattr(self, campo)
+        except AttributeError:
+            raise KeyError(campo) from None
+
+    def _compactado(self, campo, valor):
+        if campo not in _CAMPOS:
+            raise KeyError(f"Campo desconocido: {campo}")
+        compactar = self.COMPACTAR.get(campo)
+        return valor if compactar is None else compactar(self.vocabulario, valor)
+
+    def __setitem__(self, campo, valor):
+        setattr(self, campo, self._compactado(campo, valor))
+
+    def __iter__(self):
+        for campo in CAMPOS_JUEGO:
+            if hasattr(self, campo):
+                yield campo
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def update(self, cambios):
+        """Aplica todos los cambios o ninguno: se validan y compactan antes de escribir el primero"""
+        valores = {campo: self._compactado(campo, valor) for campo, valor in cambios.items()}
+        for campo, valor in valores.items():
+            setattr(self, campo, valor)
+
+    def __repr__(self):
+        return f"JuegoCompacto({dict(self)!r})"
+
+
+def compactar(juego):
+    """JuegoCompacto a partir de un diccionario de juego.
+    Un diccionario con campos fuera del esquema se deja como está (no cabría en los slots)."""
+    if isinstance(juego, JuegoCompacto) or not _CAMPOS.issuperset(juego):
+        return juego
+    return JuegoCompacto(juego)
@@ -0,0 +1,94 @@
+# =========================================================================================
+#  ⭐ RESEÑAS - Índice por juego y agregados de valoración incrementales
+#  ────────────────────────────────────────────────────────────────────────────────────────
+#  * Las reseñas se guardan en una lista por juego (orden de publicación = orden de fecha)
+#  * Cada reseña nueva actualiza valoracion, num_reviews y positivas del juego al momento:
+#    se guardan las sumas exactas y el juego solo muestra los valores redondeados
+# =========================================================================================
+
+import threading
+
+from catalogo import IndiceCatalogo
+
+
+class ReviewsJuegos(IndiceCatalogo):
+    """Reseñas indexadas por ID de juego con agregados de valoración mantenidos al vuelo"""
+
+    CAMPOS = {"valoracion", "num_reviews", "positivas"}
+
+    def __init__(self, catalogo, diario=None):
+        self._catalogo = catalogo
+        self._diario = diario
+        self._por_juego = {}
+        # * id → [suma de valoraciones, número de reseñas, reseñas positivas]
+        self._agregados = {}
+        self._total = 0
+        self._lock = threading.Lock()
+        self._propio = False
+
+    def __len__(self):
+        return self._total
+
+    def cargar(self, reviews):
+        """Restaura reseñas ya guardadas; la valoración de los juegos ya las incluye"""
+        with self._lock:
+            for review in reviews:
+                if review["juego_id"] in self._catalogo:
+                    self._por_juego.setdefault(review["juego_id"], []).append(review)
+                    self._total += 1
+
+    def al_eliminar(self, juego):
+        self._total -= len(self._por_juego.pop(juego["id"], ()))
+        self._agregados.pop(juego["id"], None)
+
+    def al_actualizar(self, anterior, juego, campos):
+        # * Si la valoración se cambia desde fuera (edición, importación) las sumas se reconstruyen
+        if campos & self.CAMPOS and not self._propio:
+            self._agregados.pop(juego["id"], None)
+
+    def _agregado(self, juego):
+        """Sumas exactas del juego; la primera vez se reconstruyen a partir de sus valores actuales"""
+        agregado = self._agregados.get(juego["id"])
+        if agregado is None:
+            num = juego["num_reviews"]
+            agregado = self._agregados[juego["id"]] = [
+                juego["valoracion"] * num, num, juego["positivas"] * num / 100
+            ]
+        return agregado
+
+    def agregar(self, review):
+        """Guarda la reseña y actualiza los agregados del juego en O(1)"""
+        with self._lock:
+            juego = self._catalogo.obtener(review["juego_id"])
+            agregado = self._agregado(juego)
+            agregado[0] += review["valoracion"]
+            agregado[1] += 1
+            agregado[2] += 1 if review["recomendado"] else 0
+            suma, num, positivas = agregado
+            self._por_juego.setdefault(juego["id"], []).append(review)
+            self._total += 1
+            if self._diario is not None:
+                self._diario.guardar_review(review)
+            # * Con el lock del catálogo tomado ninguna otra edición puede colarse entre medias
+            with self._catalogo.lock:
+                self._propio = True
+                try:
+                    self._catalogo.actualizar(juego["id"], {
+                        "valoracion": round(suma / num, 1),
+                        "num_reviews": num,
+                        "positivas": round(positivas * 100 / num)
+                    })
+                finally:
+                    self._propio = False
+        return review
+
+    def total(self, id_juego):
+        return len(self._por_juego.get(id_juego, ()))
+
+    def pagina(self, id_juego, pagina=1, por_pagina=10):
+        """Reseñas de un juego de la más reciente a la más antigua, paginadas"""
+        reviews = self._por_juego.get(id_juego, [])
+        fin = len(reviews) - (pagina - 1) * por_pagina
+        if fin <= 0:
+            return []
+        return reviews[max(fin - por_pagina, 0):fin][::-1]
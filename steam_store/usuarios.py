@@ -0,0 +1,270 @@
+# =========================================================================================
+#  👤 ESTADO POR USUARIO - Carrito, lista de deseos y biblioteca de cada sesión
+#  ────────────────────────────────────────────────────────────────────────────────────────
+#  * Diccionarios id → item: añadir, actualizar y eliminar cuestan O(1)
+#  * Los totales del carrito se mantienen en céntimos en cada cambio (sin recorrer el carrito)
+#  * Cada estado tiene su propio lock: peticiones simultáneas de una misma sesión no pierden
+#    cambios y sesiones distintas no se bloquean entre sí
+#  * Los lotes (varios juegos de una vez) se aplican enteros bajo el lock: nadie ve un lote a medias
+#  * Con un `diario` (p. ej. AlmacenSQLite) cada cambio se anota también para persistirlo
+# =========================================================================================
+
+import threading
+
+
+def _centimos(precio):
+    return round(precio * 100)
+
+
+class ContadorAtomico:
+    """Generador de IDs seguro entre hilos (nunca repite un valor)"""
+
+    def __init__(self, inicio=1):
+        self._siguiente = inicio
+        self._lock = threading.Lock()
+
+    def siguiente(self):
+        with self._lock:
+            valor = self._siguiente
+            self._siguiente += 1
+            return valor
+
+
+class EstadoUsuario:
+    """Carrito, wishlist y biblioteca de un usuario (conservan el orden de inserción)"""
+
+    def __init__(self, id_usuario=None, diario=None):
+        self.id_usuario = id_usuario
+        self.carrito = {}
+        self.wishlist = {}
+        self.biblioteca = {}
+        self._total_centimos = 0
+        self._ahorro_centimos = 0
+        self.lock = threading.RLock()
+        self._diario = diario
+
+    def restaurar(self, carrito, wishlist, biblioteca):
+        """Rellena el estado con items ya guardados (no se vuelven a anotar en el diario)"""
+        with self.lock:
+            for item in carrito:
+                self.carrito[item["id"]] = item
+                self._acumular(item, item["cantidad"])
+            self.wishlist.update((item["id"], item) for item in wishlist)
+            self.biblioteca.update((item["id"], item) for item in biblioteca)
+
+    def items_carrito(self):
+        """Copia de los items del carrito (se puede recorrer aunque otro hilo lo modifique)"""
+        with self.lock:
+            return list(self.carrito.values())
+
+    def items_wishlist(self):
+        with self.lock:
+            return list(self.wishlist.values())
+
+    def items_biblioteca(self):
+        with self.lock:
+            return list(self.biblioteca.values())
+
+    # ---------------------------------------------------------------- Carrito
+
+    def _acumular(self, item, cantidad):
+        self._total_centimos += _centimos(item["precio"]) * cantidad
+        self._ahorro_centimos += (_centimos(item["precio_original"]) - _centimos(item["precio"])) * cantidad
+
+    @property
+    def total(self):
+        return round(self._total_centimos / 100, 2)
+
+    @property
+    def ahorro(self):
+        return round(self._ahorro_centimos / 100, 2)
+
+    def agregar_al_carrito(self, juego, nuevo_id, cantidad=1):
+        """Añade un juego o incrementa su cantidad; devuelve (copia del item, es_nuevo).
+        `nuevo_id` se llama solo si el juego no estaba en el carrito."""
+        with self.lock:
+            return self._agregar_al_carrito(juego, nuevo_id, cantidad)
+
+    def _agregar_al_carrito(self, juego, nuevo_id, cantidad):
+        item = self.carrito.get(juego["id"])
+        es_nuevo = item is None
+        if es_nuevo:
+            item = self.carrito[juego["id"]] = {
+                "carrito_id": nuevo_id(),
+                "id": juego["id"],
+                "nombre": juego["nombre"],
+                "imagen": juego["imagen"],
+                "precio": juego["precio"],
+                "precio_original": juego["precio_original"],
+                "descuento": juego["descuento"],
+                "cantidad": cantidad
+            }
+        else:
+            item["cantidad"] += cantidad
+        self._acumular(item, cantidad)
+        if self._diario is not None:
+            self._diario.guardar_item("carrito", self.id_usuario, item)
+        return dict(item), es_nuevo
+
+    def eliminar_del_carrito(self, id_juego):
+        with self.lock:
+            item = self.carrito.pop(id_juego, None)
+            if item is not None:
+                self._acumular(item, -item["cantidad"])
+                if self._diario is not None:
+                    self._diario.eliminar_item("carrito", self.id_usuario, id_juego)
+            return item
+
+    def _quitar_del_carrito(self, id_juego, cantidad=None):
+        """Resta `cantidad` unidades (None o todas: quita el item); devuelve True si estaba"""
+        item = self.carrito.get(id_juego)
+        if item is None:
+            return False
+        if cantidad is None or cantidad >= item["cantidad"]:
+            del self.carrito[id_juego]
+            self._acumular(item, -item["cantidad"])
+            if self._diario is not None:
+                self._diario.eliminar_item("carrito", self.id_usuario, id_juego)
+        else:
+            item["cantidad"] -= cantidad
+            self._acumular(item, -cantidad)
+            if self._diario is not None:
+                self._diario.guardar_item("carrito", self.id_usuario, item)
+        return True
+
+    def lote_carrito(self, agregar, eliminar, nuevo_id):
+        """Aplica un lote de cambios de una vez: primero quita y después añade.
+        `agregar` son pares (juego, cantidad) y `eliminar` pares (id, cantidad o None).
+        Devuelve los contadores del lote y el resumen del carrito tras aplicarlo."""
+        with self.lock:
+            eliminados = sum(self._quitar_del_carrito(id_juego, cantidad) for id_juego, cantidad in eliminar)
+            nuevos = sum(self._agregar_al_carrito(juego, nuevo_id, cantidad)[1] for juego, cantidad in agregar)
+            return {
+                "agregados": nuevos,
+                "actualizados": len(agregar) - nuevos,
+                "eliminados": eliminados,
+                "carrito_count": len(self.carrito),
+                "total": self.total,
+                "ahorro": self.ahorro
+            }
+
+    def vaciar_carrito(self):
+        with self.lock:
+            self._vaciar_carrito()
+
+    def _vaciar_carrito(self):
+        if self.carrito and self._diario is not None:
+            self._diario.vaciar("carrito", self.id_usuario)
+        self.carrito = {}
+        self._total_centimos = 0
+        self._ahorro_centimos = 0
+
+    def resumen_carrito(self):
+        """(juegos distintos, total, ahorro) leídos de forma consistente"""
+        with self.lock:
+            return len(self.carrito), self.total, self.ahorro
+
+    def comprar(self, fecha):
+        """Pasa el carrito a la biblioteca; devuelve (total pagado, juegos comprados).
+        Con el carrito vacío devuelve (0, 0) sin cambiar nada."""
+        with self.lock:
+            return self._comprar(fecha)
+
+    def _comprar(self, fecha):
+        for id_juego, item in self.carrito.items():
+            if id_juego not in self.biblioteca:
+                self.biblioteca[id_juego] = {
+                    "id": item["id"],
+                    "nombre": item["nombre"],
+                    "imagen": item["imagen"],
+                    "fecha_compra": fecha,
+                    "tiempo_jugado": 0
+                }
+                if self._diario is not None:
+                    self._diario.guardar_item("biblioteca", self.id_usuario, self.biblioteca[id_juego])
+        resultado = (self.total, len(self.carrito))
+        self._vaciar_carrito()
+        return resultado
+
+    # ---------------------------------------------------------------- Wishlist
+
+    def agregar_a_wishlist(self, juego, fecha):
+        """Devuelve False si el juego ya estaba en la lista"""
+        with self.lock:
+            if juego["id"] in self.wishlist:
+                return False
+            self._agregar_a_wishlist(juego, fecha)
+            return True
+
+    def _agregar_a_wishlist(self, juego, fecha):
+        self.wishlist[juego["id"]] = {
+            "id": juego["id"],
+            "nombre": juego["nombre"],
+            "imagen": juego["imagen"],
+            "precio": juego["precio"],
+            "precio_original": juego["precio_original"],
+            "descuento": juego["descuento"],
+            "fecha_agregado": fecha
+        }
+        if self._diario is not None:
+            self._diario.guardar_item("wishlist", self.id_usuario, self.wishlist[juego["id"]])
+
+    def eliminar_de_wishlist(self, id_juego):
+        with self.lock:
+            item = self.wishlist.pop(id_juego, None)
+            if item is not None and self._diario is not None:
+                self._diario.eliminar_item("wishlist", self.id_usuario, id_juego)
+            return item
+
+    def lote_wishlist(self, agregar, eliminar, fecha):
+        """Quita los ids de `eliminar` y añade los juegos de `agregar` que no estaban, de una vez"""
+        with self.lock:
+            eliminados = 0
+            for id_juego in eliminar:
+                if self.wishlist.pop(id_juego, None) is not None:
+                    eliminados += 1
+                    if self._diario is not None:
+                        self._diario.eliminar_item("wishlist", self.id_usuario, id_juego)
+            ya_estaban = [juego["id"] for juego in agregar if juego["id"] in self.wishlist]
+            for juego in agregar:
+                if juego["id"] not in self.wishlist:
+                    self._agregar_a_wishlist(juego, fecha)
+            return {
+                "agregados": len(agregar) - len(ya_estaban),
+                "ya_estaban": ya_estaban,
+                "eliminados": eliminados,
+                "wishlist_count": len(self.wishlist)
+            }
+
+
+class RegistroUsuarios:
+    """Estados de usuario indexados por identificador de sesión"""
+
+    def __init__(self, diario=None):
+        self._estados = {}
+        self._lock = threading.Lock()
+        self._diario = diario
+
+    def cargar(self, guardados):
+        """Restaura los estados guardados: usuario → {"carrito", "wishlist", "biblioteca"}"""
+        for id_usuario, listas in guardados.items():
+            self.obtener(id_usuario).restaurar(listas["carrito"], listas["wishlist"], listas["biblioteca"])
+
+    def __len__(self):
+        return len(self._estados)
+
+    def estados(self):
+        """Copia de la lista de estados registrados"""
+        with self._lock:
+            return list(self._estados.values())
+
+    def obtener(self, id_usuario, crear=True):
+        """Estado del usuario; si no existe y crear=False devuelve uno vacío sin guardarlo"""
+        estado = self._estados.get(id_usuario)
+        if estado is None:
+            if not crear:
+                return EstadoUsuario()
+            # * Dos peticiones simultáneas de una sesión nueva deben compartir el mismo estado
+            with self._lock:
+                estado = self._estados.setdefault(id_usuario, EstadoUsuario(id_usuario, self._diario))
+        return estado